@@ -0,0 +1,237 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from collections import Counter
+from pathlib import Path
+
+import cli
+import mock_unipass
+from main import UnipassHSScraper
+from sinks import iter_jsonl
+from resource_monitor import process_tree_rss
+
+
+# 보고서에 먼저 표시할 단계 (탐색, 클릭, 추출, PDF)
+KEY_STEPS = (
+    "driver_start", "navigate_main", "navigate_menu", "search", "page_move", "click_case", "extract_detail",
+    "pdf", "pdf_capture", "pdf_wait", "image_wait",
+)
+# 브라우저가 필요 없는 CLI 명령에서 불러오지 않아야 하는 모듈
+BROWSER_MODULES = ("selenium", "webdriver_manager", "requests")
+
+
+class WebDriverCallCounter:
+    """WebDriver 명령(chromedriver HTTP 왕복) 횟수 집계"""
+    
+    def __init__(self):
+        self.counts = Counter()
+        self._lock = threading.Lock()
+    
+    def wrap(self, driver):
+        """driver.execute를 감싸 명령별 호출 수 기록 (WebElement 호출도 driver.execute를 거침)"""
+        execute = driver.execute
+        
+        def counted_execute(driver_command, params=None):
+            with self._lock:
+                self.counts[driver_command] += 1
+            return execute(driver_command, params)
+        
+        driver.execute = counted_execute
+        return driver
+    
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+    
+    def attach(self, scraper: UnipassHSScraper):
+        """스크래퍼의 메인 브라우저와 PDF 변환 브라우저 모두 집계하도록 연결"""
+        setup_driver = scraper.setup_driver
+        create_render_driver = scraper.create_render_driver
+        
+        def counted_setup_driver():
+            setup_driver()
+            self.wrap(scraper.driver)
+        
+        scraper.setup_driver = counted_setup_driver
+        scraper.create_render_driver = lambda: self.wrap(create_render_driver())
+
+
+class RssSampler:
+    """백그라운드 스레드에서 프로세스 트리 RSS를 주기적으로 측정하여 최대값 기록"""
+    
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, process_tree_rss(os.getpid()))
+            self._stop.wait(self.interval)
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, process_tree_rss(os.getpid()))
+
+
+def python_peak_rss() -> int:
+    """현재 파이썬 프로세스의 최대 RSS (바이트)"""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_benchmark(cases: int = 200, latency: float = 0.05, max_pages: int = 3, output_dir: str = None,
+                  **scraper_options) -> dict:
+    """목 서버를 띄우고 UnipassHSScraper로 처음부터 끝까지 크롤링한 뒤 측정 결과 반환"""
+    server, base_url = mock_unipass.start_mock_server(corpus_size=cases, latency=latency)
+    output_dir = output_dir or tempfile.mkdtemp(prefix="unipass_bench_")
+    
+    scraper = UnipassHSScraper(output_dir=output_dir, base_url=base_url, **scraper_options)
+    counter = WebDriverCallCounter()
+    counter.attach(scraper)
+    
+    try:
+        with RssSampler() as rss:
+            start = time.perf_counter()
+            # 목 사이트의 사례는 모두 2016년 이후 시행이므로 기본 검색 조건으로 전체가 조회됨
+            scraper.scrape_all_cases(max_pages=max_pages)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+    
+    scraped = sum(1 for _ in iter_jsonl(scraper.cases_path))
+    return {
+        "config": {
+            "cases": cases, "latency": latency, "max_pages": max_pages,
+            "scraper_options": scraper_options, "output_dir": output_dir,
+        },
+        "scraped_cases": scraped,
+        "elapsed": elapsed,
+        "cases_per_sec": scraped / elapsed if elapsed else 0.0,
+        "steps": scraper.profiler.summary(),
+        "peak_rss_bytes": rss.peak,
+        "python_peak_rss_bytes": python_peak_rss(),
+        "webdriver_calls": {
+            "total": counter.total,
+            "per_case": counter.total / scraped if scraped else 0.0,
+            "by_command": dict(counter.counts.most_common()),
+        },
+    }
+
+
+def measure_startup(output_dir: str, repeat: int = 5) -> dict:
+    """CLI 하위 명령별 실행 시간과 불러온 브라우저 관련 모듈 (crawl/resume은 브라우저 시작 전 스크래퍼 import까지)
+    
+    오프라인 명령(export/stats/verify-pdfs)은 output_dir에 대해 실제로 실행하며, 비교용으로 빈 파이썬 실행 시간도 측정한다.
+    """
+    repo = Path(__file__).resolve().parent
+    commands = {"python": ["-c", "pass"]}
+    for command in cli.COMMANDS:
+        if command in ("crawl", "resume"):
+            commands[command] = ["-c", "import cli; cli.scraper_class()"]
+        else:
+            commands[command] = ["cli.py", "--output-dir", str(output_dir), command]
+    
+    results = {}
+    for name, args in commands.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + args, cwd=repo, capture_output=True)
+            times.append(time.perf_counter() - start)
+        # 마지막으로 한 번 더 -X importtime으로 실행하여 불러온 모듈 확인
+        completed = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=repo, capture_output=True, text=True)
+        modules = {
+            line.rsplit("|", 1)[-1].strip() for line in completed.stderr.splitlines() if line.startswith("import time:")
+        }
+        results[name] = {
+            "seconds": min(times),
+            "browser_modules": [module for module in BROWSER_MODULES if module in modules],
+        }
+    return results
+
+
+def print_startup_report(results: dict):
+    """CLI 시작 시간 측정 결과 출력"""
+    print(f"\n{'명령':<16}{'시간(ms)':>10}  브라우저 관련 모듈")
+    for name, result in results.items():
+        print(f"{name:<16}{result['seconds'] * 1000:>10.1f}  {', '.join(result['browser_modules']) or '-'}")
+
+
+def print_report(report: dict):
+    """벤치마크 결과 출력"""
+    print("\n" + "=" * 60)
+    print("벤치마크 결과")
+    print("=" * 60)
+    config = report["config"]
+    print(f"목 사이트: 사례 {config['cases']}건, 지연 {config['latency']}초, 최대 {config['max_pages']} 페이지")
+    print(f"수집: {report['scraped_cases']}건 / {report['elapsed']:.2f}초 ({report['cases_per_sec']:.2f}건/초)")
+    print(f"최대 RSS: 프로세스 트리 {report['peak_rss_bytes'] / 2 ** 20:.1f}MB, "
+          f"파이썬 {report['python_peak_rss_bytes'] / 2 ** 20:.1f}MB")
+    
+    calls = report["webdriver_calls"]
+    print(f"WebDriver 호출: {calls['total']}회 (사례당 {calls['per_case']:.1f}회)")
+    for command, count in list(calls["by_command"].items())[:10]:
+        print(f"  {command:<32}{count:>8}")
+    
+    steps = report["steps"]
+    ordered = [step for step in KEY_STEPS if step in steps] + sorted(step for step in steps if step not in KEY_STEPS)
+    print(f"\n{'단계':<20}{'횟수':>8}{'p50':>10}{'p95':>10}{'최대':>10}  (ms)")
+    for step in ordered:
+        s = steps[step]
+        print(f"{step:<20}{s['count']:>8}{s['p50'] * 1000:>10.1f}{s['p95'] * 1000:>10.1f}{s['max'] * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 UNIPASS 목 사이트를 이용한 스크래퍼 벤치마크")
+    parser.add_argument("--cases", type=int, default=200, help="목 사이트 사례 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="목 사이트 응답 지연 (초)")
+    parser.add_argument("--max-pages", type=int, default=3)
+    parser.add_argument("--pdf-workers", type=int, default=0)
+    parser.add_argument("--image-workers", type=int, default=4)
+    parser.add_argument("--profile", choices=("default", "fast"), default="fast", help="브라우저 프로필")
+    parser.add_argument("--rate-limit", action="store_true", help="요청 속도 제한 사용 (기본값: 목 사이트에서는 사용하지 않음)")
+    parser.add_argument("--tabs", type=int, default=1, help="한 브라우저에서 사례를 동시에 불러올 탭 수")
+    parser.add_argument("--output-dir", default=None, help="스크래핑 결과 위치 (기본값: 임시 디렉터리)")
+    parser.add_argument("--report", default=None, help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--startup", action="store_true",
+                        help="크롤링 대신 CLI 하위 명령별 시작 시간만 측정 (--output-dir의 결과로 오프라인 명령 실행)")
+    args = parser.parse_args()
+    
+    if args.startup:
+        results = measure_startup(args.output_dir or tempfile.mkdtemp(prefix="unipass_bench_"))
+        print_startup_report(results)
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        return
+    
+    report = run_benchmark(
+        cases=args.cases, latency=args.latency, max_pages=args.max_pages, output_dir=args.output_dir,
+        pdf_workers=args.pdf_workers, image_workers=args.image_workers, browser_profile=args.profile,
+        rate_limit=args.rate_limit, tabs=args.tabs
+    )
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
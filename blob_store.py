@@ -0,0 +1,201 @@
+import os
+import re
+import json
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from records import case_key
+from sinks import iter_jsonl, compact_jsonl
+
+
+# 실행할 때마다 바뀌는 PDF 메타데이터 (같은 길이의 0으로 바꿔 xref 위치를 유지한 채 내용이 같으면 같은 해시가 되도록)
+PDF_VOLATILE_PATTERNS = (
+    re.compile(rb"/(?:CreationDate|ModDate)\s*\(D:([^)]*)\)"),
+    re.compile(rb"/ID\s*\[\s*<([0-9A-Fa-f]*)>\s*<([0-9A-Fa-f]*)>\s*\]"),
+)
+# 레코드 해시에서 제외하는 필드 (같은 내용이라도 실행마다 달라짐)
+VOLATILE_RECORD_FIELDS = ("index", "scraped_at")
+
+
+def normalize_pdf(data: bytes) -> bytes:
+    """PDF 생성 시각/문서 ID를 고정값으로 바꿔 같은 화면을 인쇄한 PDF가 같은 바이트가 되도록 정규화"""
+    def zero_groups(match):
+        result = match.group(0)
+        for index in range(1, len(match.groups()) + 1):
+            start, end = match.start(index) - match.start(0), match.end(index) - match.start(0)
+            result = result[:start] + b"0" * (end - start) + result[end:]
+        return result
+    
+    for pattern in PDF_VOLATILE_PATTERNS:
+        data = pattern.sub(zero_groups, data)
+    return data
+
+
+def record_bytes(detail: dict) -> bytes:
+    """레코드 저장용 정규화 JSON (키 정렬, 실행마다 바뀌는 필드 제외)"""
+    stable = {key: value for key, value in detail.items() if key not in VOLATILE_RECORD_FIELDS}
+    return json.dumps(stable, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+class BlobStore:
+    """내용 해시(sha256) 주소 저장소 (root/<해시 앞 2자리>/<sha256><확장자>, 같은 내용은 다시 쓰지 않음)"""
+    
+    def __init__(self, root):
+        self.root = Path(root)
+    
+    def path(self, sha256: str, suffix: str = "") -> Path:
+        return self.root / sha256[:2] / f"{sha256}{suffix}"
+    
+    def put(self, data: bytes, suffix: str = "") -> tuple:
+        """내용 저장 후 (sha256, 경로) 반환 (이미 있으면 쓰기 없이 반환)"""
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.path(sha256, suffix)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 여러 프로세스/스레드가 같은 내용을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 구분
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        return sha256, path
+    
+    def contains(self, path) -> bool:
+        """경로가 이 저장소의 blob인지 여부"""
+        try:
+            Path(path).resolve().relative_to(self.root.resolve())
+            return True
+        except ValueError:
+            return False
+    
+    def blobs(self):
+        """저장된 모든 blob (sha256, 경로) 순회"""
+        if not self.root.exists():
+            return
+        for path in self.root.glob("??/*"):
+            if path.is_file() and not path.name.endswith(".tmp"):
+                yield path.name.split(".", 1)[0], path
+
+
+class BlobManifest:
+    """사례 식별 키 → 레코드/PDF blob 해시 목록 (append-only JSONL, 같은 사례는 마지막 기록 우선)"""
+    
+    def __init__(self, output_dir, filename: str = "blob_manifest.jsonl"):
+        self.path = Path(output_dir) / filename
+        self.entries = None
+    
+    def load(self) -> "BlobManifest":
+        self.entries = {}
+        for entry in iter_jsonl(self.path):
+            self.entries[entry["case"]] = {"record": entry.get("record", ""), "pdf": entry.get("pdf", "")}
+        return self
+    
+    def update(self, case_id: str, record_sha: str, pdf_sha: str = ""):
+        """사례의 blob 해시 기록 (이전과 같으면 기록하지 않음)"""
+        if self.entries is None:
+            self.load()
+        entry = {"record": record_sha, "pdf": pdf_sha}
+        if self.entries.get(case_id) == entry:
+            return
+        self.entries[case_id] = entry
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"case": case_id, **entry, "at": datetime.now().isoformat()}, ensure_ascii=False) + "\n")
+    
+    def referenced(self) -> set:
+        if self.entries is None:
+            self.load()
+        return {sha for entry in self.entries.values() for sha in entry.values() if sha}
+    
+    def compact(self):
+        """사례마다 마지막 기록 한 줄만 남기도록 다시 쓰기"""
+        if self.entries is None:
+            self.load()
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for case_id, entry in self.entries.items():
+                f.write(json.dumps({"case": case_id, **entry}, ensure_ascii=False) + "\n")
+        tmp_path.replace(self.path)
+
+
+def pdf_sha(store: BlobStore, pdf_path: str) -> str:
+    """저장소 안의 PDF 경로이면 해시, 아니면 빈 문자열"""
+    if pdf_path and store.contains(pdf_path):
+        return Path(pdf_path).name.split(".", 1)[0]
+    return ""
+
+
+def collect_garbage(output_dir, dry_run: bool = False) -> dict:
+    """저장소 정리: 예전 case_N.pdf 파일을 저장소로 옮기고, 매니페스트가 가리키지 않는 blob 삭제"""
+    output_dir = Path(output_dir)
+    cases_path = output_dir / "hs_classification_cases.jsonl"
+    store = BlobStore(output_dir / "blobs")
+    manifest = BlobManifest(output_dir).load()
+    stats = {"migrated_pdfs": 0, "removed_blobs": 0, "removed_bytes": 0, "kept_blobs": 0}
+    
+    # 1. 사례별 마지막 레코드를 저장소/매니페스트에 등록 (예전 PDF는 내용 해시 경로로 이동)
+    moved = {}  # 예전 PDF 경로 → 저장소 경로
+    latest = {}  # 식별 키 → 마지막 줄 번호 (JSONL 압축과 같은 기준)
+    for line_number, detail in enumerate(iter_jsonl(cases_path)):
+        latest[case_key(detail)] = line_number
+    for line_number, detail in enumerate(iter_jsonl(cases_path)):
+        key = case_key(detail)
+        if latest[key] != line_number:
+            continue
+        pdf_path = detail.get("pdf_path", "")
+        if pdf_path and not store.contains(pdf_path) and Path(pdf_path).exists():
+            stats["migrated_pdfs"] += 1
+            if dry_run:
+                continue
+            if pdf_path not in moved:
+                _, path = store.put(normalize_pdf(Path(pdf_path).read_bytes()), ".pdf")
+                moved[pdf_path] = str(path)
+            detail["pdf_path"] = moved[pdf_path]
+        if not dry_run:
+            record_sha, _ = store.put(record_bytes(detail), ".json")
+            manifest.update(key, record_sha, pdf_sha(store, detail.get("pdf_path", "")))
+    
+    if moved:
+        # JSONL의 PDF 경로를 저장소 경로로 바꾸고 JSON/CSV 다시 생성
+        tmp_path = cases_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for detail in iter_jsonl(cases_path):
+                detail["pdf_path"] = moved.get(detail.get("pdf_path", ""), detail.get("pdf_path", ""))
+                f.write(json.dumps(detail, ensure_ascii=False) + "\n")
+        tmp_path.replace(cases_path)
+        compact_jsonl(cases_path, output_dir / "hs_classification_cases.json", output_dir / "hs_classification_cases.csv")
+        for old_path in moved:
+            Path(old_path).unlink()
+    
+    # 2. 매니페스트가 가리키지 않는 blob 삭제
+    referenced = manifest.referenced()
+    for sha256, path in list(store.blobs()):
+        if sha256 in referenced:
+            stats["kept_blobs"] += 1
+            continue
+        stats["removed_blobs"] += 1
+        stats["removed_bytes"] += path.stat().st_size
+        if not dry_run:
+            path.unlink()
+    if not dry_run and manifest.path.exists():
+        manifest.compact()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF/레코드 내용 해시 저장소 관리")
+    parser.add_argument("--output-dir", default="scraped_data")
+    commands = parser.add_subparsers(dest="command", required=True)
+    gc = commands.add_parser("gc", help="예전 PDF를 저장소로 옮기고 참조되지 않는 blob 삭제 (크롤링 중이 아닐 때 실행)")
+    gc.add_argument("--dry-run", action="store_true", help="삭제/이동하지 않고 결과만 출력")
+    args = parser.parse_args()
+    
+    if args.command == "gc":
+        stats = collect_garbage(args.output_dir, args.dry_run)
+        print(f"예전 PDF 이동 {stats['migrated_pdfs']}개, 삭제 {stats['removed_blobs']}개 "
+              f"({stats['removed_bytes'] / 2 ** 20:.1f}MB), 유지 {stats['kept_blobs']}개"
+              + (" (dry run)" if args.dry_run else ""))
+
+
+if __name__ == "__main__":
+    main()
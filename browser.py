@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+# fast 프로필에서 메인 브라우저가 받지 않는 리소스 (이미지는 ImagePipeline으로만 받음)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*wcs.naver.net*",
+]
+
+# fast 프로필 Chrome 옵션 (헤드리스, 작은 창, 백그라운드 기능/캐시 축소)
+FAST_PROFILE_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1366,768",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--mute-audio",
+    "--disk-cache-size=33554432",
+]
+
+# 여러 탭으로 사례를 동시에 불러올 때 Chrome 옵션 (보이지 않는 탭의 타이머/렌더링이 느려지지 않도록)
+TAB_POOL_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+# ChromeDriverManager가 찾은 드라이버 경로 캐시 (다음 실행부터 버전 확인 요청 없이 사용)
+DRIVER_PATH_CACHE = Path.home() / ".cache" / "unipass_scraper" / "chromedriver_path"
+
+_driver_path = None  # 프로세스 내 캐시
+
+
+def resolve_chromedriver_path(refresh: bool = False) -> str:
+    """ChromeDriver 경로 (CHROMEDRIVER_PATH 환경변수 → 프로세스/파일 캐시 → ChromeDriverManager 순)"""
+    global _driver_path
+    pinned = os.environ.get("CHROMEDRIVER_PATH")
+    if pinned:
+        return pinned
+    
+    if not refresh:
+        if _driver_path:
+            return _driver_path
+        try:
+            cached = DRIVER_PATH_CACHE.read_text(encoding="utf-8").strip()
+        except OSError:
+            cached = ""
+        if cached and Path(cached).exists():
+            _driver_path = cached
+            return cached
+    
+    _driver_path = ChromeDriverManager().install()
+    try:
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_PATH_CACHE.write_text(_driver_path, encoding="utf-8")
+    except OSError:
+        pass
+    return _driver_path
+
+
+def block_resources(driver, patterns: list = None):
+    """CDP로 현재 탭의 이미지/폰트/미디어/분석 스크립트 요청 차단 (인쇄 팝업 등 새 창에는 적용되지 않음)"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
@@ -0,0 +1,261 @@
+import sys
+import json
+import hashlib
+import argparse
+from datetime import date
+from pathlib import Path
+
+from records import case_key
+from sinks import iter_jsonl
+
+
+# 하위 명령 (crawl/resume만 브라우저를 사용하며 selenium 등은 이 두 명령에서만 불러옴)
+COMMANDS = ("crawl", "resume", "export", "stats", "verify-pdfs")
+CASES_FILENAME = "hs_classification_cases.jsonl"
+
+
+def scraper_class():
+    """UnipassHSScraper (selenium/webdriver_manager/requests를 불러오므로 브라우저가 필요한 명령에서만 호출)"""
+    from main import UnipassHSScraper
+    return UnipassHSScraper
+
+
+def latest_records(output_dir: Path):
+    """사례별 마지막 레코드 순회 (JSONL 압축과 같은 기준)"""
+    cases_path = output_dir / CASES_FILENAME
+    last_position = {}
+    for position, detail in enumerate(iter_jsonl(cases_path)):
+        last_position[case_key(detail)] = position
+    for position, detail in enumerate(iter_jsonl(cases_path)):
+        if last_position[case_key(detail)] == position:
+            yield detail
+
+
+def make_scraper(args):
+    return scraper_class()(
+        output_dir=args.output_dir, output_formats=tuple(args.formats.split(",")), pdf_workers=args.pdf_workers,
+        image_workers=args.image_workers, browser_profile=args.profile, verbosity=args.verbosity,
+        metrics_port=args.metrics_port, rate_limit=not args.no_rate_limit, tabs=args.tabs, long_run=args.long_run
+    )
+
+
+def run_crawl(args) -> int:
+    start = date.fromisoformat(args.start)
+    scraper = make_scraper(args)
+    if args.incremental:
+        _, complete = scraper.scrape_new_cases(max_pages=args.max_pages)
+    elif args.sharded or args.end or start.day != 1:
+        complete = scraper.scrape_date_range(start, args.end, max_shard_pages=args.max_shard_pages,
+                                             num_workers=args.workers, max_pages=args.max_pages)
+    elif args.workers > 1:
+        complete = scraper.scrape_all_cases_parallel(start.year, start.month, max_pages=args.max_pages,
+                                                     num_workers=args.workers)
+    else:
+        complete = scraper.scrape_all_cases(start.year, start.month, max_pages=args.max_pages)
+    return 0 if complete else 1
+
+
+def run_resume(args) -> int:
+    """크롤링 저널에 기록된 검색 조건으로 이어서 진행"""
+    from journal import CrawlJournal
+    search = CrawlJournal(args.output_dir).load_state()["search"]
+    if not search:
+        print(f"이어서 진행할 크롤링 저널이 없습니다: {Path(args.output_dir) / 'crawl_journal.jsonl'}", file=sys.stderr)
+        return 2
+    
+    scraper = make_scraper(args)
+    if "start_date" in search:
+        complete = scraper.scrape_date_range(search["start_date"], search["end_date"],
+                                             max_shard_pages=search["max_shard_pages"], num_workers=args.workers,
+                                             resume=True, max_pages=args.max_pages)
+    elif args.workers > 1:
+        complete = scraper.scrape_all_cases_parallel(search["start_year"], search["start_month"],
+                                                     max_pages=args.max_pages, num_workers=args.workers, resume=True)
+    else:
+        complete = scraper.scrape_all_cases(search["start_year"], search["start_month"], max_pages=args.max_pages,
+                                            resume=True)
+    return 0 if complete else 1
+
+
+def run_export(args) -> int:
+    """JSONL 원본으로 JSON/CSV (및 --formats의 추가 출력) 다시 생성"""
+    from sinks import compact_jsonl, make_sinks
+    output_dir = Path(args.output_dir)
+    if not (output_dir / CASES_FILENAME).exists():
+        print(f"사례 파일이 없습니다: {output_dir / CASES_FILENAME}", file=sys.stderr)
+        return 2
+    
+    count = compact_jsonl(output_dir / CASES_FILENAME, output_dir / "hs_classification_cases.json",
+                          output_dir / "hs_classification_cases.csv")
+    print(f"JSON/CSV 생성: {count}건")
+    formats = [name for name in args.formats.split(",") if name and name != "jsonl"]
+    if formats:
+        try:
+            sinks = make_sinks(output_dir, formats)
+        except ImportError as e:
+            print(e, file=sys.stderr)
+            return 2
+        for sink in sinks:
+            sink.open(append=False)
+        for detail in latest_records(output_dir):
+            for sink in sinks:
+                sink.write(detail)
+        for sink in sinks:
+            sink.close()
+        print(f"추가 출력 생성: {', '.join(formats)}")
+    return 0
+
+
+def collect_stats(output_dir: Path) -> dict:
+    """출력 디렉터리의 사례/저널/실패 목록/증분 인덱스/저장소 현황"""
+    from journal import CrawlJournal
+    from known_cases import KnownCaseIndex
+    from blob_store import BlobStore
+    
+    cases = {"records": sum(1 for _ in iter_jsonl(output_dir / CASES_FILENAME)), "unique": 0, "with_pdf": 0,
+             "pdf_errors": 0, "with_images": 0, "first_effective_date": "", "last_effective_date": ""}
+    dates = []
+    for detail in latest_records(output_dir):
+        cases["unique"] += 1
+        cases["with_pdf"] += bool(detail.get("pdf_path"))
+        cases["pdf_errors"] += bool(detail.get("pdf_error"))
+        cases["with_images"] += bool(detail.get("images"))
+        if detail.get("effective_date"):
+            dates.append(detail["effective_date"])
+    if dates:
+        cases["first_effective_date"], cases["last_effective_date"] = min(dates), max(dates)
+    
+    state = CrawlJournal(output_dir).load_state()
+    known_cases = KnownCaseIndex(output_dir).load()
+    blob_count = blob_bytes = 0
+    for _, path in BlobStore(output_dir / "blobs").blobs():
+        blob_count += 1
+        blob_bytes += path.stat().st_size
+    return {
+        "cases": cases,
+        "journal": {
+            "search": state["search"], "completed_pages": len(state["completed_pages"]),
+            "last_page": state["last_page"], "first_unfinished_page": state["first_unfinished_page"],
+            "case_count": state["case_count"],
+        },
+        "dead_letters": sum(1 for _ in iter_jsonl(output_dir / "dead_letters.jsonl")),
+        "known_cases": {"count": len(known_cases), "high_water_mark": known_cases.high_water_mark,
+                        "last_crawl_at": known_cases.last_crawl_at},
+        "blobs": {"count": blob_count, "bytes": blob_bytes},
+    }
+
+
+def run_stats(args) -> int:
+    stats = collect_stats(Path(args.output_dir))
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        return 0
+    
+    cases, journal = stats["cases"], stats["journal"]
+    print(f"사례: {cases['unique']}건 (기록 {cases['records']}줄), PDF {cases['with_pdf']}건, "
+          f"PDF 오류 {cases['pdf_errors']}건, 이미지 포함 {cases['with_images']}건")
+    if cases["first_effective_date"]:
+        print(f"시행일자: {cases['first_effective_date']} ~ {cases['last_effective_date']}")
+    print(f"저널: 검색 조건 {journal['search'] or '-'}, 완료 페이지 {journal['completed_pages']}개 "
+          f"(마지막 {journal['last_page']}, 다음 시작 {journal['first_unfinished_page']})")
+    print(f"실패 목록: {stats['dead_letters']}건")
+    known_cases = stats["known_cases"]
+    print(f"증분 인덱스: {known_cases['count']}건, 최근 시행일자 {known_cases['high_water_mark'] or '-'}, "
+          f"마지막 크롤링 {known_cases['last_crawl_at'] or '-'}")
+    print(f"저장소: blob {stats['blobs']['count']}개 ({stats['blobs']['bytes'] / 2 ** 20:.1f}MB)")
+    return 0
+
+
+def check_pdf(path: Path, blob_root: Path) -> str:
+    """PDF 파일 문제 (없음/PDF 아님/잘림/해시 불일치, 정상이면 빈 문자열)"""
+    if not path.is_file():
+        return "missing"
+    data = path.read_bytes()
+    if not data.startswith(b"%PDF-"):
+        return "not_pdf"
+    if b"%%EOF" not in data[-2048:]:
+        return "truncated"
+    try:
+        path.resolve().relative_to(blob_root.resolve())
+    except ValueError:
+        return ""
+    # 내용 해시 저장소의 PDF는 파일 이름이 내용의 sha256
+    if hashlib.sha256(data).hexdigest() != path.name.split(".", 1)[0]:
+        return "hash_mismatch"
+    return ""
+
+
+def run_verify_pdfs(args) -> int:
+    """사례별 PDF 파일 확인 (문제가 있는 사례가 있으면 종료 코드 1)"""
+    output_dir = Path(args.output_dir)
+    blob_root = output_dir / "blobs"
+    checked = 0
+    problems = []
+    for detail in latest_records(output_dir):
+        if not detail.get("pdf_path"):
+            continue
+        checked += 1
+        problem = check_pdf(Path(detail["pdf_path"]), blob_root)
+        if problem:
+            problems.append({"case": case_key(detail), "index": detail.get("index"), "pdf_path": detail["pdf_path"],
+                             "problem": problem})
+    
+    if args.json:
+        print(json.dumps({"checked": checked, "problems": problems}, ensure_ascii=False, indent=2))
+    else:
+        for problem in problems:
+            print(f"  사례 {problem['index']} ({problem['case']}): {problem['problem']} {problem['pdf_path']}")
+        print(f"PDF {checked}개 확인, 문제 {len(problems)}개")
+    return 1 if problems else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="관세청 UNIPASS 품목분류 국내사례 스크래퍼")
+    parser.add_argument("--output-dir", default="scraped_data")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    # crawl/resume 공통 브라우저/출력 설정
+    browser = argparse.ArgumentParser(add_help=False)
+    browser.add_argument("--max-pages", type=int, default=None, help="최대 페이지 수 (테스트용)")
+    browser.add_argument("--workers", type=int, default=1, help="2 이상이면 여러 브라우저로 병렬 스크래핑")
+    browser.add_argument("--profile", choices=("default", "fast"), default="default", help="브라우저 프로필")
+    browser.add_argument("--pdf-workers", type=int, default=0, help="1 이상이면 PDF 변환을 백그라운드 브라우저에서 처리")
+    browser.add_argument("--image-workers", type=int, default=4)
+    browser.add_argument("--tabs", type=int, default=1, help="한 브라우저에서 사례를 동시에 불러올 탭 수")
+    browser.add_argument("--formats", default="jsonl", help="출력 형식 (쉼표로 구분: jsonl, csv, parquet, index)")
+    browser.add_argument("--verbosity", choices=("error", "warning", "info", "debug"), default="info")
+    browser.add_argument("--metrics-port", type=int, default=None, help="지표 HTTP 엔드포인트 포트")
+    browser.add_argument("--no-rate-limit", action="store_true", help="요청 속도 제한 사용 안 함")
+    browser.add_argument("--long-run", action="store_true", help="메모리/처리 시간을 보고 페이지 경계에서 브라우저를 주기적으로 교체")
+    
+    crawl = commands.add_parser("crawl", parents=[browser], help="크롤링 (처음부터)")
+    crawl.add_argument("--start", default="2016-01-01", help="검색 시작일 (YYYY-MM-DD)")
+    crawl.add_argument("--end", default=None, help="검색 종료일 (지정하면 기간을 구간으로 나누어 스크래핑)")
+    crawl.add_argument("--sharded", action="store_true", help="기간을 월 단위 구간으로 나누어 스크래핑")
+    crawl.add_argument("--max-shard-pages", type=int, default=5, help="구간 하나의 최대 페이지 수")
+    crawl.add_argument("--incremental", action="store_true", help="마지막 크롤링 이후의 새 사례만 수집")
+    commands.add_parser("resume", parents=[browser], help="크롤링 저널의 검색 조건으로 이어서 진행")
+    
+    export = commands.add_parser("export", help="JSONL 원본으로 JSON/CSV 다시 생성 (브라우저 없이)")
+    export.add_argument("--formats", default="", help="추가로 다시 만들 출력 (쉼표로 구분: csv, parquet, index)")
+    stats = commands.add_parser("stats", help="수집 현황 (브라우저 없이)")
+    stats.add_argument("--json", action="store_true")
+    verify = commands.add_parser("verify-pdfs", help="사례별 PDF 파일 확인 (브라우저 없이)")
+    verify.add_argument("--json", action="store_true")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    handlers = {
+        "crawl": run_crawl,
+        "resume": run_resume,
+        "export": run_export,
+        "stats": run_stats,
+        "verify-pdfs": run_verify_pdfs,
+    }
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
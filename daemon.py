@@ -0,0 +1,319 @@
+import json
+import time
+import queue
+import argparse
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from main import UnipassHSScraper
+from telemetry import Telemetry
+
+
+JOB_TYPES = ("crawl", "refresh", "lookup")
+DEFAULT_PORT = 8765
+KEEPALIVE_INTERVAL = 600  # 쉬고 있는 세션의 검색을 다시 조회하여 사이트 세션을 유지하는 간격 (초)
+JOB_TTL = 3600  # 끝난 작업을 /jobs에 남겨 두는 시간 (초)
+MAX_FINISHED_JOBS = 200  # 남겨 둘 끝난 작업 수 (넘으면 오래된 것부터 삭제)
+
+
+class Job:
+    """API로 받은 작업 한 건 (상태: queued → running → done/failed)"""
+    
+    def __init__(self, job_id: int, job_type: str, params: dict):
+        self.id = job_id
+        self.type = job_type
+        self.params = params
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.submitted_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.finished_clock = None  # 끝난 시각 (time.monotonic, 보관 기간 계산용)
+        self.seconds = None
+        self.done = threading.Event()
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id, "type": self.type, "params": self.params, "status": self.status,
+            "result": self.result, "error": self.error, "submitted_at": self.submitted_at,
+            "started_at": self.started_at, "finished_at": self.finished_at, "seconds": self.seconds,
+        }
+
+
+class ScraperDaemon:
+    """검색 화면까지 미리 열어 둔 브라우저 세션 풀로 크롤링/증분 크롤링/사례 조회 작업을 처리하는 상주 프로세스
+
+    세션마다 UnipassHSScraper를 상주 모드(keep_browser)로 만들어 드라이버 시작, 메인 페이지/메뉴 이동, 검색 설정을
+    시작할 때 한 번만 한다. 작업은 쉬고 있는 세션을 하나 가져가 검색 기간만 바꿔 바로 시작한다.
+    출력 파일(JSONL/저널)에 기록하는 crawl/refresh 작업은 한 번에 하나씩 실행하고, lookup은 세션 수만큼 동시에 실행한다.
+    """
+    
+    def __init__(self, sessions: int = 2, output_dir: str = "scraped_data", keepalive: float = KEEPALIVE_INTERVAL,
+                 job_ttl: float = JOB_TTL, max_finished_jobs: int = MAX_FINISHED_JOBS, **scraper_options):
+        self.output_dir = Path(output_dir)
+        self.keepalive = keepalive
+        self.job_ttl = job_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self.sessions = [
+            UnipassHSScraper(output_dir=output_dir, keep_browser=True, **scraper_options) for _ in range(max(1, sessions))
+        ]
+        for session_id, scraper in enumerate(self.sessions):
+            scraper.telemetry.worker = session_id  # 추적은 같은 파일에 세션 번호와 함께 기록, 지표는 데몬이 합쳐서 제공
+            scraper.telemetry.metrics_path = None
+        self.telemetry = Telemetry(self.output_dir, scraper_options.get("verbosity", "info"), metrics_filename=None)
+        self.idle = queue.Queue()  # 작업에 사용할 수 있는 세션
+        self.executor = ThreadPoolExecutor(max_workers=len(self.sessions), thread_name_prefix="job")
+        self.output_lock = threading.Lock()  # 출력에 기록하는 작업은 한 번에 하나씩
+        self.jobs = {}  # 대기/실행 중인 작업과 최근에 끝난 작업 (prune_jobs로 정리)
+        self._jobs_lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._stopped = threading.Event()
+        self._server = None
+    
+    def warm(self, scraper: UnipassHSScraper):
+        """브라우저를 띄우고 품목분류 국내사례 검색 결과 화면까지 이동"""
+        with scraper.profiler.measure("warm_up"):
+            scraper.setup_driver()
+            scraper.open_search()
+    
+    def ensure_alive(self, scraper: UnipassHSScraper):
+        """세션이 끊겼으면 브라우저를 다시 띄워 검색 화면 복원"""
+        try:
+            scraper.driver.current_url
+        except Exception:
+            scraper.restart_driver(1)
+    
+    def start(self):
+        """모든 세션을 동시에 준비하고 세션 유지 스레드 시작"""
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(self.sessions)) as executor:
+            list(executor.map(self.warm, self.sessions))
+        for scraper in self.sessions:
+            self.idle.put(scraper)
+        self.telemetry.log(f"세션 {len(self.sessions)}개 준비 완료 ({time.perf_counter() - started:.1f}초)",
+                           event="daemon_ready", sessions=len(self.sessions))
+        if self.keepalive:
+            threading.Thread(target=self._keepalive_loop, name="keepalive", daemon=True).start()
+    
+    def _keepalive_loop(self):
+        while not self._stopped.wait(self.keepalive):
+            # 지금 쉬고 있는 세션만 다시 조회 (작업 중인 세션은 그대로)
+            for _ in range(self.idle.qsize()):
+                try:
+                    scraper = self.idle.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    scraper.change_search(*scraper.search)
+                except Exception as e:
+                    self.telemetry.log(f"세션 유지 조회 실패, 브라우저 재시작: {type(e).__name__}", "warning", "keepalive",
+                                       error_type=type(e).__name__)
+                    try:
+                        scraper.restart_driver(1)
+                    except Exception:
+                        pass
+                finally:
+                    self.idle.put(scraper)
+    
+    def submit(self, job_type: str, params: dict = None) -> Job:
+        """작업 등록 (알 수 없는 작업 종류면 ValueError)"""
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"알 수 없는 작업 종류: {job_type} (가능한 값: {', '.join(JOB_TYPES)})")
+        if job_type == "lookup" and not (params or {}).get("date"):
+            raise ValueError("lookup 작업에는 시행일자(date, YYYY-MM-DD)가 필요합니다.")
+        job = Job(next(self._job_ids), job_type, params or {})
+        with self._jobs_lock:
+            self.jobs[job.id] = job
+        self.prune_jobs()
+        self.telemetry.event("job_submitted", job=job.id, type=job_type, params=job.params)
+        self.executor.submit(self._run, job)
+        return job
+    
+    def _run(self, job: Job):
+        scraper = self.idle.get()
+        job.status = "running"
+        job.started_at = datetime.now().isoformat()
+        started = time.perf_counter()
+        try:
+            self.ensure_alive(scraper)
+            job.result = self.execute(scraper, job.type, job.params)
+            job.status = "done"
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.idle.put(scraper)
+            job.seconds = round(time.perf_counter() - started, 3)
+            job.finished_at = datetime.now().isoformat()
+            job.finished_clock = time.monotonic()
+            job.done.set()
+            self.prune_jobs()
+            level = "info" if job.status == "done" else "error"
+            self.telemetry.log(f"작업 {job.id} ({job.type}) {job.status}, {job.seconds}초", level, "job_finished",
+                               job=job.id, type=job.type, status=job.status, seconds=job.seconds, error=job.error)
+    
+    def prune_jobs(self):
+        """보관 기간(job_ttl)이 지난 끝난 작업과 max_finished_jobs를 넘는 오래된 끝난 작업 삭제 (대기/실행 중인 작업은 유지)"""
+        now = time.monotonic()
+        with self._jobs_lock:
+            finished = [job for job in self.jobs.values() if job.finished_clock is not None]
+            finished.sort(key=lambda job: job.finished_clock)
+            excess = len(finished) - self.max_finished_jobs
+            for position, job in enumerate(finished):
+                if position < excess or now - job.finished_clock > self.job_ttl:
+                    del self.jobs[job.id]
+    
+    def execute(self, scraper: UnipassHSScraper, job_type: str, params: dict) -> dict:
+        """세션 하나로 작업 실행 (결과는 JSON으로 보낼 수 있는 dict)"""
+        if job_type == "lookup":
+            detail = scraper.lookup_case(params["date"], params.get("case_number"), params.get("position"))
+            return {"case": detail}
+        
+        with self.output_lock:
+            if job_type == "refresh":
+                new_cases, complete = scraper.scrape_new_cases(max_pages=params.get("max_pages"))
+                return {"new_cases": new_cases, "complete": complete}
+            if params.get("start_date"):
+                complete = scraper.scrape_date_range(
+                    params["start_date"], params.get("end_date"),
+                    max_shard_pages=params.get("max_shard_pages", 5), resume=params.get("resume", False)
+                )
+            else:
+                complete = scraper.scrape_all_cases(
+                    params.get("start_year", 2016), params.get("start_month", 1),
+                    max_pages=params.get("max_pages"), resume=params.get("resume", False)
+                )
+            return {"complete": complete, "output_dir": str(self.output_dir)}
+    
+    def status(self) -> dict:
+        counts = {}
+        for job in list(self.jobs.values()):
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"sessions": len(self.sessions), "idle": self.idle.qsize(), "jobs": counts}
+    
+    def render_metrics(self) -> str:
+        """모든 세션의 카운터를 합친 Prometheus 텍스트 형식 지표"""
+        telemetry = Telemetry(self.output_dir, metrics_filename=None)
+        telemetry.started = self.telemetry.started
+        for scraper in self.sessions:
+            telemetry.merge_counters(scraper.telemetry.counter_items())
+        return telemetry.render_metrics()
+    
+    def serve(self, port: int = DEFAULT_PORT, host: str = "127.0.0.1"):
+        """로컬 HTTP 작업 API 실행 (Ctrl+C로 종료할 때까지 대기)
+
+        - POST /jobs  {"type": "crawl"|"refresh"|"lookup", ..., "wait": true면 끝날 때까지 기다려 결과 반환}
+        - GET /jobs, GET /jobs/<id>, GET /health, GET /metrics
+        """
+        daemon = self
+        
+        class JobHandler(BaseHTTPRequestHandler):
+            def send_json(self, status: int, body):
+                data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_GET(self):
+                path = self.path.split("?")[0].rstrip("/")
+                if path == "/health":
+                    self.send_json(200, daemon.status())
+                elif path == "/jobs":
+                    self.send_json(200, [job.to_dict() for job in list(daemon.jobs.values())])
+                elif path.startswith("/jobs/") and path[len("/jobs/"):].isdigit():
+                    job = daemon.jobs.get(int(path[len("/jobs/"):]))
+                    if job is None:
+                        self.send_json(404, {"error": "작업을 찾을 수 없습니다."})
+                    else:
+                        self.send_json(200, job.to_dict())
+                elif path == "/metrics":
+                    body = daemon.render_metrics().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self.send_error(404)
+            
+            def do_POST(self):
+                if self.path.split("?")[0].rstrip("/") != "/jobs":
+                    self.send_error(404)
+                    return
+                try:
+                    params = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                    if not isinstance(params, dict):
+                        raise ValueError("작업은 JSON 객체로 보내야 합니다.")
+                    wait = params.pop("wait", False)
+                    job = daemon.submit(params.pop("type", ""), params)
+                except ValueError as e:
+                    self.send_json(400, {"error": str(e)})
+                    return
+                if wait:
+                    job.done.wait()
+                    self.send_json(200, job.to_dict())
+                else:
+                    self.send_json(202, job.to_dict())
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((host, port), JobHandler)
+        self.telemetry.log(f"작업 API: http://{host}:{self._server.server_port}/jobs", event="daemon_listen",
+                           port=self._server.server_port)
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """진행 중인 작업이 끝나면 모든 세션의 브라우저 종료"""
+        self._stopped.set()
+        if self._server:
+            self._server.server_close()
+            self._server = None
+        self.executor.shutdown(wait=True)
+        for scraper in self.sessions:
+            scraper.keep_browser = False
+            scraper.close_driver()
+            scraper.telemetry.shutdown()
+        self.telemetry.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UNIPASS 스크래퍼 상주 모드 (브라우저 세션 풀 + 로컬 HTTP 작업 API)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--sessions", type=int, default=2, help="미리 준비해 둘 브라우저 세션 수")
+    parser.add_argument("--output-dir", default="scraped_data")
+    parser.add_argument("--base-url", default=None, help="사이트 주소 (기본값: UNIPASS)")
+    parser.add_argument("--profile", choices=("default", "fast"), default="fast", help="브라우저 프로필")
+    parser.add_argument("--pdf-workers", type=int, default=0)
+    parser.add_argument("--keepalive", type=float, default=KEEPALIVE_INTERVAL, help="세션 유지 조회 간격 (초, 0이면 사용 안 함)")
+    parser.add_argument("--job-ttl", type=float, default=JOB_TTL, help="끝난 작업을 /jobs에 남겨 두는 시간 (초)")
+    parser.add_argument("--max-finished-jobs", type=int, default=MAX_FINISHED_JOBS, help="남겨 둘 끝난 작업 수")
+    parser.add_argument("--verbosity", choices=("error", "warning", "info", "debug"), default="info")
+    parser.add_argument("--long-run", action="store_true", help="메모리/처리 시간을 보고 페이지 경계에서 브라우저를 주기적으로 교체")
+    args = parser.parse_args()
+    
+    scraper_options = {"browser_profile": args.profile, "pdf_workers": args.pdf_workers, "verbosity": args.verbosity,
+                       "long_run": args.long_run}
+    if args.base_url:
+        scraper_options["base_url"] = args.base_url
+    daemon = ScraperDaemon(args.sessions, args.output_dir, args.keepalive, job_ttl=args.job_ttl,
+                           max_finished_jobs=args.max_finished_jobs, **scraper_options)
+    daemon.start()
+    daemon.serve(args.port, args.host)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+
+def parse_date(value) -> date:
+    """'YYYY-MM-DD' 문자열 또는 date (None이면 None)"""
+    if value is None or isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def month_shards(start: date, end: date) -> list:
+    """시작일~종료일(포함)을 달력 월 단위 (시작일, 종료일) 구간으로 분할 (첫/마지막 구간은 범위에 맞춰 잘림)"""
+    if end < start:
+        raise ValueError(f"종료일({end})이 시작일({start})보다 앞입니다.")
+    shards = []
+    current = start
+    while current <= end:
+        next_month = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        shards.append((current, min(end, next_month - timedelta(days=1))))
+        current = next_month
+    return shards
+
+
+def split_shard(start: date, end: date) -> list:
+    """구간을 날짜 기준 절반으로 분할 (하루짜리 구간은 그대로)"""
+    if start >= end:
+        return [(start, end)]
+    middle = start + timedelta(days=(end - start).days // 2)
+    return [(start, middle), (middle + timedelta(days=1), end)]
+
+
+class ShardPlan:
+    """날짜 구간별 사례 수/페이지 수와 전체 페이지 번호 배정 (이어서 진행할 때 같은 번호를 쓰도록 파일에 저장)
+
+    구간 i의 로컬 페이지 p는 전체 페이지 first_page + p - 1로 저널에 기록된다.
+    """
+    
+    def __init__(self, output_dir, filename: str = "shard_plan.json"):
+        self.path = Path(output_dir) / filename
+        self.search = None
+        self.total_count = None  # 전체 범위 한 번에 조회한 사례 수 (확인용)
+        self.shards = []  # {"start", "end", "count", "pages", "first_page"}
+    
+    def add(self, start: date, end: date, count: int, pages: int):
+        first_page = self.shards[-1]["first_page"] + self.shards[-1]["pages"] if self.shards else 1
+        self.shards.append({
+            "start": start.isoformat(), "end": end.isoformat(), "count": count, "pages": pages, "first_page": first_page
+        })
+    
+    @property
+    def shard_count_sum(self) -> int:
+        return sum(shard["count"] for shard in self.shards)
+    
+    @property
+    def total_pages(self) -> int:
+        return sum(shard["pages"] for shard in self.shards)
+    
+    def verified(self) -> bool:
+        """구간별 사례 수의 합이 전체 범위 사례 수와 같은지 (전체 사례 수를 알 수 없으면 False)"""
+        return self.total_count is not None and self.shard_count_sum == self.total_count
+    
+    def save(self):
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"search": self.search, "total_count": self.total_count, "shards": self.shards},
+                      f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.path)
+    
+    def load(self, search: dict) -> bool:
+        """같은 검색 조건으로 저장된 계획이 있으면 불러오기"""
+        if not self.path.exists():
+            return False
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("search") != search:
+            return False
+        self.search = data["search"]
+        self.total_count = data.get("total_count")
+        self.shards = data.get("shards", [])
+        return True
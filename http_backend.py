@@ -0,0 +1,522 @@
+import re
+import json
+import time
+import base64
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from records import new_case_detail, assign_detail_field, normalize_date
+from recovery import SESSION, FATAL, TRANSIENT_STATUS, classify_error, retry_call, RetryPolicy
+
+
+# 목록 요청에서 페이지 번호로 쓰이는 파라미터 후보
+PAGE_PARAM_NAMES = ("pageIndex", "pageNo", "pageNum", "currentPage", "curPage", "nowPage", "page")
+DETAIL_FIELDS = ("case_number", "title", "hs_code", "description", "classification_reason", "effective_date")
+
+
+def normalize_text(value) -> str:
+    """공백을 정규화한 문자열"""
+    return re.sub(r"\s+", " ", str(value)).strip()
+
+
+class TableParser(HTMLParser):
+    """HTML 조각에서 테이블 행 추출 (th/td 텍스트와 링크의 href/onclick 인자)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self._cell = None
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "tr":
+            self.rows.append({"th": [], "td": [], "args": []})
+        elif tag in ("th", "td") and self.rows:
+            self._cell = (tag, [])
+        elif tag == "a" and self.rows:
+            # onclick="fn_detail('CLSF-1', '2')" 또는 href="#..." 에 들어있는 인자
+            handler = attrs.get("onclick") or attrs.get("href") or ""
+            for single, double in re.findall(r"'([^']*)'|\"([^\"]*)\"", handler):
+                self.rows[-1]["args"].append(single or double)
+    
+    def handle_data(self, data):
+        if self._cell:
+            self._cell[1].append(data)
+    
+    def handle_endtag(self, tag):
+        if self._cell and tag == self._cell[0]:
+            self.rows[-1][tag].append(normalize_text("".join(self._cell[1])))
+            self._cell = None
+
+
+def parse_table_rows(html: str) -> list:
+    """HTML 조각의 모든 테이블 행"""
+    parser = TableParser()
+    parser.feed(html)
+    return parser.rows
+
+
+def field_value(field: str, value) -> str:
+    """상세 JSON 값을 Selenium 경로(assign_detail_field)와 같은 형식의 필드 값으로 변환"""
+    value = str(value).strip()
+    return normalize_date(value) if field == "effective_date" else value
+
+
+def find_records(payload) -> list:
+    """JSON 응답에서 첫 번째 객체 배열(목록 행) 찾기"""
+    if isinstance(payload, list) and payload and all(isinstance(item, dict) for item in payload):
+        return payload
+    children = payload.values() if isinstance(payload, dict) else payload if isinstance(payload, list) else []
+    for child in children:
+        records = find_records(child)
+        if records:
+            return records
+    return []
+
+
+def find_record(payload) -> dict:
+    """JSON 응답에서 스칼라 값이 가장 많은 객체(상세 레코드) 찾기"""
+    best, best_count = {}, -1
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            count = sum(1 for value in node.values() if isinstance(value, (str, int, float)))
+            if count > best_count:
+                best, best_count = node, count
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return best
+
+
+def parse_body(text: str):
+    """응답 본문을 JSON이면 객체로, 아니면 문자열 그대로 반환"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def html_row_to_record(row: dict) -> dict:
+    """HTML 목록 행을 JSON 행과 같은 dict 형태로 변환"""
+    record = {f"cell_{i}": value for i, value in enumerate(row["td"])}
+    record.update({f"arg_{i}": value for i, value in enumerate(row["args"])})
+    return record
+
+
+class XhrEndpoint:
+    """브라우저에서 캡처한 XHR 요청 템플릿 (URL, 메서드, 파라미터)"""
+    
+    def __init__(self, url: str, method: str = "POST", params: dict = None, json_body: bool = False):
+        self.url = url
+        self.method = method.upper()
+        self.params = dict(params or {})
+        self.json_body = json_body
+    
+    @classmethod
+    def from_captured(cls, captured: dict) -> "XhrEndpoint":
+        """capture_xhr_requests 결과 한 건으로 템플릿 생성 (쿼리/폼/JSON 파라미터 분리)"""
+        parts = urlsplit(captured["url"])
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+        json_body = False
+        post_data = captured.get("post_data") or ""
+        if post_data:
+            body = parse_body(post_data)
+            if isinstance(body, dict):
+                params.update({key: str(value) for key, value in body.items()})
+                json_body = True
+            else:
+                params.update(dict(parse_qsl(post_data, keep_blank_values=True)))
+        return cls(url, captured.get("method", "POST"), params, json_body)
+    
+    def find_param(self, names: tuple = (), value: str = None):
+        """이름 후보 또는 값으로 파라미터 이름 찾기"""
+        for name in names:
+            if name in self.params:
+                return name
+        if value is not None:
+            for name, param_value in self.params.items():
+                if normalize_text(param_value) == normalize_text(value):
+                    return name
+        return None
+    
+    def to_dict(self) -> dict:
+        return {"url": self.url, "method": self.method, "params": self.params, "json_body": self.json_body}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "XhrEndpoint":
+        return cls(data["url"], data.get("method", "POST"), data.get("params"), data.get("json_body", False))
+
+
+class UnipassHttpBackend:
+    """Selenium 렌더링 없이 목록/상세 XHR 엔드포인트를 직접 호출하는 스크래핑 엔진"""
+    
+    def __init__(self, list_endpoint: XhrEndpoint, detail_endpoint: XhrEndpoint,
+                 page_param: str, id_param: str, id_key: str,
+                 field_map: dict = None, pool_size: int = 8, timeout: int = 10,
+                 retry_policy: RetryPolicy = None, dead_letters=None, telemetry=None, rate_limiter=None):
+        self.list_endpoint = list_endpoint
+        self.detail_endpoint = detail_endpoint
+        self.page_param = page_param  # 목록 요청의 페이지 번호 파라미터
+        self.id_param = id_param  # 상세 요청의 사례 식별 파라미터
+        self.id_key = id_key  # 목록 행에서 사례 식별값이 들어있는 키
+        self.field_map = dict(field_map or {})  # 사례 필드 → 상세 JSON 키 (HTML 응답이면 th 텍스트로 매핑)
+        self.pool_size = pool_size
+        self.timeout = timeout
+        
+        # 오류 복구: Selenium 경로와 같은 오류 분류/재시도 정책, 끝내 실패한 사례는 dead letter로 기록 (출력에는 넣지 않음)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.dead_letters = dead_letters  # DeadLetterLog
+        self.telemetry = telemetry  # Telemetry (없으면 콘솔에만 출력)
+        self.refresh_session = None  # 세션 만료 시 쿠키를 다시 받는 함수 (없으면 그대로 재시도)
+        # Selenium 경로와 공유하는 사이트별 요청 속도 제한 (429/5xx/느린 응답이면 모든 워커의 속도를 줄임)
+        self.rate_limiter = rate_limiter  # AdaptiveRateLimiter (없으면 제한하지 않음)
+        
+        # 연결 재사용을 위한 세션 (동시 상세 요청 수만큼 커넥션 풀 확보, 재시도는 fetch_case_detail에서 처리)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"X-Requested-With": "XMLHttpRequest"})
+    
+    def log(self, message: str, level: str = "info", event: str = "log", **fields):
+        """콘솔 출력 + 추적 이벤트 기록 (telemetry가 없으면 콘솔에만 출력)"""
+        if self.telemetry:
+            self.telemetry.log(message, level, event, **fields)
+        else:
+            print(message)
+    
+    def count(self, name: str, **labels):
+        if self.telemetry:
+            self.telemetry.count(name, **labels)
+    
+    def load_cookies(self, cookies: list):
+        """WebDriver get_cookies() 결과를 세션에 적용"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+            )
+    
+    def request(self, endpoint: XhrEndpoint, **overrides):
+        """템플릿 파라미터에 overrides를 덮어써서 요청 후 본문 파싱"""
+        params = dict(endpoint.params, **{key: str(value) for key, value in overrides.items()})
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            if endpoint.method == "GET":
+                response = self.session.get(endpoint.url, params=params, timeout=self.timeout)
+            elif endpoint.json_body:
+                response = self.session.post(endpoint.url, json=params, timeout=self.timeout)
+            else:
+                response = self.session.post(endpoint.url, data=params, timeout=self.timeout)
+        except Exception:
+            # 연결 실패/시간 초과는 서버 과부하로 보고 속도를 줄임
+            if self.rate_limiter:
+                self.rate_limiter.report(time.perf_counter() - start, ok=False)
+            raise
+        if self.rate_limiter:
+            # 세션 만료/없는 사례(4xx)는 속도와 무관하므로 429/5xx만 오류로 반영
+            self.rate_limiter.report(time.perf_counter() - start, ok=response.status_code not in TRANSIENT_STATUS)
+        response.raise_for_status()
+        return parse_body(response.text)
+    
+    def fetch_case_list(self, page_num: int) -> list:
+        """목록 페이지의 사례 행 (JSON 행 또는 HTML 행을 dict로 변환)"""
+        payload = self.request(self.list_endpoint, **{self.page_param: page_num})
+        if isinstance(payload, str):
+            return [html_row_to_record(row) for row in parse_table_rows(payload) if row["td"]]
+        return find_records(payload)
+    
+    def request_case_detail(self, row: dict, case_index: int) -> dict:
+        """목록 행의 식별값으로 상세 정보를 요청하여 Selenium과 같은 형태의 detail 생성 (요청 오류는 그대로 전달)"""
+        detail = new_case_detail(case_index)
+        payload = self.request(self.detail_endpoint, **{self.id_param: row[self.id_key]})
+        if isinstance(payload, str):
+            for table_row in parse_table_rows(payload):
+                if table_row["th"] and table_row["td"]:
+                    assign_detail_field(detail, table_row["th"][0], table_row["td"][0])
+        else:
+            record = find_record(payload)
+            for field, key in self.field_map.items():
+                if record.get(key) is not None:
+                    detail[field] = field_value(field, record[key])
+        return detail
+    
+    def run_with_retry(self, action, page_num: int, label: str):
+        """action 실행 (Selenium 경로와 같은 recovery.retry_call 규칙, 재시도 횟수를 넘거나 fatal 오류면 마지막 예외를 전달)"""
+        needs_refresh = False
+        
+        def attempt_action():
+            nonlocal needs_refresh
+            # 세션이 만료되었으면 쿠키를 다시 받은 뒤 재시도 (여러 스레드가 동시에 받아도 무방)
+            if needs_refresh and self.refresh_session:
+                needs_refresh = False
+                try:
+                    self.refresh_session()
+                except Exception:
+                    pass
+            return action()
+        
+        def on_retry(error, kind, attempt, delay):
+            nonlocal needs_refresh
+            needs_refresh = needs_refresh or kind == SESSION
+            self.log(f"    {label}: {type(error).__name__} ({kind}), {delay:.1f}초 후 재시도 "
+                     f"({attempt}/{self.retry_policy.max_attempts - 1})", "warning", "retry",
+                     label=label, error_type=type(error).__name__, error_class=kind, attempt=attempt, page=page_num)
+            self.count("retries", kind=kind)
+        
+        return retry_call(attempt_action, self.retry_policy, on_retry)
+    
+    def fetch_case_detail(self, row: dict, case_index: int, page_num: int) -> dict:
+        """상세 정보 요청 (재시도 후에도 실패하면 dead letter로 기록하고 None, 빈 레코드를 출력에 넣지 않음)"""
+        try:
+            return self.run_with_retry(lambda: self.request_case_detail(row, case_index), page_num,
+                                       f"사례 {case_index} 상세 요청")
+        except Exception as e:
+            kind = classify_error(e)
+            if self.dead_letters:
+                self.dead_letters.append(page_num, case_index, e, 1 if kind == FATAL else self.retry_policy.max_attempts)
+            self.log(f"  사례 {case_index}: 상세 요청 실패 ({type(e).__name__}), 실패 목록에 기록", "error", "case_failed",
+                     page=page_num, case_index=case_index, error_type=type(e).__name__)
+            self.count("cases_failed", error_class=kind)
+            return None
+    
+    def scrape_pages(self, first_page: int = 1, max_pages: int = None, max_workers: int = None):
+        """목록 페이지를 순서대로 요청하고 각 페이지의 상세 정보를 동시에 요청 (페이지 단위로 (page_num, details) 반환)"""
+        total = 0
+        page_size = None
+        page_num = first_page
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            while max_pages is None or page_num < first_page + max_pages:
+                # 목록을 끝내 받지 못하면 페이지를 건너뛰지 않고 중단
+                rows = self.run_with_retry(lambda: self.fetch_case_list(page_num), page_num, f"페이지 {page_num} 목록")
+                if not rows:
+                    break
+                page_size = page_size or len(rows)
+                
+                # 인덱스는 Selenium 경로와 같은 페이지 위치 기반
+                indexes = [(page_num - 1) * page_size + i + 1 for i in range(len(rows))]
+                details = executor.map(self.fetch_case_detail, rows, indexes, [page_num] * len(rows))
+                page_results = [detail for detail in details if detail is not None]
+                total += len(page_results)
+                self.log(f"  페이지 {page_num} 처리 완료 ({len(page_results)}건, 누적 {total}건)", event="page_done",
+                         page=page_num, cases=len(page_results))
+                yield page_num, page_results
+                page_num += 1
+    
+    def save(self, path):
+        """엔드포인트/매핑/쿠키를 저장하여 다음 실행에서 브라우저 없이 재사용"""
+        config = {
+            "list_endpoint": self.list_endpoint.to_dict(),
+            "detail_endpoint": self.detail_endpoint.to_dict(),
+            "page_param": self.page_param,
+            "id_param": self.id_param,
+            "id_key": self.id_key,
+            "field_map": self.field_map,
+            "headers": {key: value for key, value in self.session.headers.items() if key in ("User-Agent", "Referer")},
+            "cookies": [
+                {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+                for c in self.session.cookies
+            ],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+    
+    @classmethod
+    def load(cls, path, **options) -> "UnipassHttpBackend":
+        """save()로 저장한 설정으로 백엔드 생성"""
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        backend = cls(
+            XhrEndpoint.from_dict(config["list_endpoint"]),
+            XhrEndpoint.from_dict(config["detail_endpoint"]),
+            config["page_param"], config["id_param"], config["id_key"],
+            config.get("field_map"), **options
+        )
+        backend.session.headers.update(config.get("headers", {}))
+        backend.load_cookies(config.get("cookies", []))
+        return backend
+
+
+def capture_xhr_requests(driver) -> list:
+    """performance 로그에서 XHR/Fetch 요청과 응답 본문 수집 (호출하면 로그가 비워짐)"""
+    captured = {}
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent" and params.get("type") in ("XHR", "Fetch"):
+            request = params["request"]
+            captured[params["requestId"]] = {
+                "url": request["url"],
+                "method": request["method"],
+                "post_data": request.get("postData", ""),
+            }
+    
+    for request_id, request in captured.items():
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            text = body["body"]
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8", errors="replace")
+            request["body"] = text
+        except Exception:
+            request["body"] = ""
+    return list(captured.values())
+
+
+def find_request_containing(captured: list, *texts) -> dict:
+    """응답 본문에 texts가 모두 들어있는 마지막 요청 (JSON의 \\uXXXX 이스케이프도 풀어서 비교)"""
+    for request in reversed(captured):
+        body = parse_body(request.get("body", ""))
+        if not isinstance(body, str):
+            body = json.dumps(body, ensure_ascii=False)
+        body = normalize_text(body)
+        if all(normalize_text(text) in body for text in texts if text):
+            return request
+    return None
+
+
+def bootstrap_from_browser(scraper, start_year: int = 2016, start_month: int = 1, **options) -> UnipassHttpBackend:
+    """브라우저로 검색과 첫 사례 상세보기를 한 번만 수행하여 쿠키와 XHR 엔드포인트 확보"""
+    scraper.capture_network = True
+    scraper.setup_driver()
+    try:
+        scraper.navigate_to_main_page()
+        scraper.navigate_to_hs_classification()
+        scraper.set_search_date(start_year, start_month)
+        capture_xhr_requests(scraper.driver)  # 검색 이전 요청은 버림
+        
+        scraper.click_search()
+        list_requests = capture_xhr_requests(scraper.driver)
+        if not scraper.click_case_by_index(0):
+            raise RuntimeError("첫 번째 사례를 클릭할 수 없습니다.")
+        dom_detail = scraper.extract_case_detail(1)
+        detail_requests = capture_xhr_requests(scraper.driver)
+        
+        cookies = scraper.driver.get_cookies()
+        user_agent = scraper.driver.execute_script("return navigator.userAgent;")
+        referer = scraper.driver.current_url
+    finally:
+        scraper.close_driver()
+    
+    # 첫 사례의 품명이 들어있는 응답이 목록 요청, 품명과 HS코드가 함께 들어있는 응답이 상세 요청
+    list_request = find_request_containing(list_requests, dom_detail["title"])
+    detail_request = find_request_containing(detail_requests, dom_detail["title"], dom_detail["hs_code"])
+    if not list_request or not detail_request:
+        raise RuntimeError("목록/상세 XHR 요청을 찾을 수 없습니다.")
+    
+    list_endpoint = XhrEndpoint.from_captured(list_request)
+    detail_endpoint = XhrEndpoint.from_captured(detail_request)
+    page_param = list_endpoint.find_param(PAGE_PARAM_NAMES)
+    if not page_param:
+        raise RuntimeError(f"목록 요청에서 페이지 파라미터를 찾을 수 없습니다: {list_endpoint.params}")
+    
+    # 상세 요청 파라미터 중 값이 첫 목록 행에 들어있는 것이 사례 식별 파라미터
+    list_body = parse_body(list_request["body"])
+    if isinstance(list_body, str):
+        rows = [html_row_to_record(row) for row in parse_table_rows(list_body) if row["td"]]
+    else:
+        rows = find_records(list_body)
+    first_row = rows[0] if rows else {}
+    id_param = id_key = None
+    for key, value in first_row.items():
+        id_param = detail_endpoint.find_param(value=value)
+        if id_param:
+            id_key = key
+            break
+    if not id_param:
+        raise RuntimeError("상세 요청의 사례 식별 파라미터를 찾을 수 없습니다.")
+    
+    # 상세 JSON 키 매핑: 화면에서 읽은 값과 같은 값을 가진 키 (문서번호/시행일자는 사례 식별 키에 쓰이므로 함께 매핑)
+    field_map = {}
+    detail_body = parse_body(detail_request["body"])
+    if not isinstance(detail_body, str):
+        record = find_record(detail_body)
+        for field in DETAIL_FIELDS:
+            for key, value in record.items():
+                if not isinstance(value, (str, int, float)):
+                    continue
+                if dom_detail[field] and normalize_text(field_value(field, value)) == normalize_text(dom_detail[field]):
+                    field_map[field] = key
+                    break
+    
+    backend = UnipassHttpBackend(list_endpoint, detail_endpoint, page_param, id_param, id_key, field_map, **options)
+    backend.session.headers.update({"User-Agent": user_agent, "Referer": referer})
+    backend.load_cookies(cookies)
+    print(f"HTTP 백엔드 부트스트랩 완료: 목록 {list_endpoint.url}, 상세 {detail_endpoint.url}")
+    return backend
+
+
+def fixture_backend(base_url: str, **options) -> UnipassHttpBackend:
+    """mock_unipass 서버용 백엔드 (브라우저 없이 세션 쿠키만 받아서 사용)"""
+    import mock_unipass
+    
+    backend = UnipassHttpBackend(
+        XhrEndpoint(base_url + mock_unipass.LIST_PATH, "POST", {"pageIndex": "1", "recordCountPerPage": "10"}),
+        XhrEndpoint(base_url + mock_unipass.DETAIL_PATH, "POST", {"caseSn": ""}),
+        page_param="pageIndex", id_param="caseSn", id_key="caseSn",
+        field_map=mock_unipass.FIELD_MAP, **options
+    )
+    backend.refresh_session = lambda: backend.session.get(base_url + "/clip/index.do", timeout=backend.timeout)
+    backend.refresh_session()
+    return backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UNIPASS 품목분류 국내사례 HTTP 스크래퍼")
+    parser.add_argument("--output-dir", default="scraped_data")
+    parser.add_argument("--start-year", type=int, default=2016)
+    parser.add_argument("--start-month", type=int, default=1)
+    parser.add_argument("--max-pages", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=8, help="동시 상세 요청 수")
+    parser.add_argument("--config", default=None, help="저장된 백엔드 설정 (없으면 브라우저로 부트스트랩)")
+    parser.add_argument("--fixture", action="store_true", help="로컬 목 서버를 띄워 오프라인으로 실행")
+    args = parser.parse_args()
+    
+    from main import UnipassHSScraper
+    
+    scraper = UnipassHSScraper(output_dir=args.output_dir)
+    config_path = Path(args.config) if args.config else scraper.output_dir / "http_backend.json"
+    # 재시도/실패 목록/로그/요청 속도 제한은 Selenium 경로와 같은 설정과 파일 사용
+    options = {"pool_size": args.workers, "retry_policy": scraper.retry_policy, "dead_letters": scraper.dead_letters,
+               "telemetry": scraper.telemetry, "rate_limiter": scraper.rate_limiter}
+    
+    if args.fixture:
+        import mock_unipass
+        
+        server, base_url = mock_unipass.start_mock_server(corpus_size=200)
+        backend = fixture_backend(base_url, **options)
+    elif config_path.exists():
+        backend = UnipassHttpBackend.load(config_path, **options)
+    else:
+        backend = bootstrap_from_browser(scraper, args.start_year, args.start_month, **options)
+        backend.save(config_path)
+    
+    # 사례는 페이지 단위로 바로 출력에 기록 (저널/이어서 진행은 Selenium 경로 전용)
+    scraper.journal = None
+    scraper.dead_letters.start()
+    scraper.open_sinks(append=False)
+    count = 0
+    start = time.perf_counter()
+    for page_num, page_results in backend.scrape_pages(max_pages=args.max_pages):
+        for detail in page_results:
+            scraper.record_case(page_num, detail)
+        count += len(page_results)
+    elapsed = time.perf_counter() - start
+    print(f"{count}건 / {elapsed:.2f}초 ({count / max(elapsed, 1e-9):.1f}건/초)")
+    scraper.save_results()
+    scraper.print_dead_letters()
+    scraper.telemetry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import io
+import json
+import base64
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from blob_store import BlobStore
+
+
+def guess_extension(data: bytes) -> str:
+    """이미지 파일 형식을 내용(매직 바이트)으로 판별"""
+    if data.startswith(b"\x89PNG"):
+        return ".png"
+    if data.startswith(b"\xff\xd8"):
+        return ".jpg"
+    if data.startswith(b"GIF8"):
+        return ".gif"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data.startswith(b"BM"):
+        return ".bmp"
+    return ".bin"
+
+
+class ImagePipeline:
+    """상세보기 이미지 동시 다운로드 파이프라인 (연결 재사용, 재시도, 내용 해시 기반 중복 제거)
+
+    이미지는 images/<해시 앞 2자리>/<sha256>.<확장자>에 저장되므로 여러 사례에 같은 제품 사진이
+    있어도 한 번만 저장되고, 한 번 받은 URL은 url_index.jsonl에 기록되어 다음 실행에서도 다시 받지 않는다.
+    """
+    
+    def __init__(self, images_dir, base_url: str = "", max_workers: int = 4, timeout: int = 10,
+                 thumbnail_size: tuple = (320, 320), rate_limiter=None):
+        self.images_dir = Path(images_dir)
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.store = BlobStore(self.images_dir)
+        self.thumbs_dir = self.images_dir / "thumbs"
+        self.base_url = base_url
+        self.timeout = timeout
+        self.thumbnail_size = thumbnail_size
+        self.rate_limiter = rate_limiter  # AdaptiveRateLimiter (없으면 제한 없음)
+        
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-download")
+        
+        self._lock = threading.Lock()
+        self._in_flight = {}  # URL → Future (같은 URL 동시 요청 방지)
+        self._index_path = self.images_dir / "url_index.jsonl"
+        self._url_index = self._load_url_index()
+    
+    def _load_url_index(self) -> dict:
+        index = {}
+        if self._index_path.exists():
+            with open(self._index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if Path(record.get("local_path", "")).exists():
+                        index[record["url"]] = record
+        return index
+    
+    def load_cookies(self, cookies: list):
+        """WebDriver get_cookies() 결과를 세션에 적용 (로그인/세션이 필요한 이미지용)"""
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/")
+            )
+    
+    def _fetch(self, src: str) -> bytes:
+        if src.startswith("data:"):
+            # Base64 인코딩된 이미지
+            header, data = src.split(",", 1)
+            return base64.b64decode(data)
+        with self.rate_limiter.limit() if self.rate_limiter else nullcontext():
+            response = self.session.get(urljoin(self.base_url + "/", src), timeout=self.timeout)
+            response.raise_for_status()
+        return response.content
+    
+    def _store(self, data: bytes) -> tuple:
+        """내용 해시 경로에 저장 (이미 있으면 쓰지 않음)"""
+        return self.store.put(data, guess_extension(data))
+    
+    def _thumbnail(self, data: bytes, digest: str) -> str:
+        """Pillow로 썸네일 생성 (이미지로 읽을 수 없으면 빈 문자열)"""
+        if not self.thumbnail_size:
+            return ""
+        thumb_path = self.thumbs_dir / digest[:2] / f"{digest}.jpg"
+        if thumb_path.exists():
+            return str(thumb_path)
+        try:
+            from PIL import Image
+            
+            with Image.open(io.BytesIO(data)) as img:
+                img.thumbnail(self.thumbnail_size)
+                thumb_path.parent.mkdir(parents=True, exist_ok=True)
+                img.convert("RGB").save(thumb_path, "JPEG", quality=85)
+            return str(thumb_path)
+        except Exception:
+            return ""
+    
+    def download(self, src: str, alt: str = "") -> dict:
+        """이미지 한 건 다운로드 후 저장 (실패 시 error 필드 포함)"""
+        # data URI는 레코드에 본문 대신 형식만 남김
+        record = {"src": src.split(",", 1)[0] if src.startswith("data:") else src, "alt": alt}
+        cached = self._url_index.get(src)
+        if cached:
+            record.update({key: cached[key] for key in ("sha256", "local_path", "thumbnail_path")})
+            return record
+        
+        try:
+            data = self._fetch(src)
+            digest, path = self._store(data)
+            record.update({"sha256": digest, "local_path": str(path), "thumbnail_path": self._thumbnail(data, digest)})
+        except Exception as e:
+            record.update({"sha256": "", "local_path": "", "thumbnail_path": "", "error": str(e)})
+            return record
+        
+        if not src.startswith("data:"):
+            with self._lock:
+                self._url_index[src] = dict(record, url=src)
+                with open(self._index_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(self._url_index[src], ensure_ascii=False) + "\n")
+        return record
+    
+    def submit(self, src: str, alt: str = ""):
+        """백그라운드 다운로드 등록 (같은 URL이 진행 중이면 같은 Future 반환)"""
+        with self._lock:
+            future = self._in_flight.get(src)
+            if future is None:
+                future = self._executor.submit(self.download, src, alt)
+                self._in_flight[src] = future
+                future.add_done_callback(lambda _, src=src: self._forget(src))
+            return future
+    
+    def _forget(self, src: str):
+        with self._lock:
+            self._in_flight.pop(src, None)
+    
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
@@ -0,0 +1,87 @@
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+
+from records import case_key
+
+
+class CrawlJournal:
+    """크롤링 진행 상황을 사례 단위로 append-only 기록하는 저널 (JSONL)
+
+    레코드 종류:
+      {"type": "start", "search": {...}}               새 크롤링 시작 (검색 조건)
+      {"type": "case", "page": 3, "key": "..."}        사례 한 건 스크래핑 완료 (내용은 출력 JSONL에 기록)
+      {"type": "page", "page": 3, "group": 1, ...}     페이지 처리 완료
+    """
+    
+    def __init__(self, output_dir, filename: str = "crawl_journal.jsonl"):
+        self.path = Path(output_dir) / filename
+        self._file = None
+    
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+    
+    def _append(self, record: dict, sync: bool = False):
+        f = self._open()
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        if sync:
+            os.fsync(f.fileno())
+    
+    def start(self, search: dict):
+        """기존 저널을 비우고 새 크롤링 시작 기록"""
+        self.close()
+        self.path.write_text("", encoding="utf-8")
+        self._append({"type": "start", "search": search, "at": datetime.now().isoformat()}, sync=True)
+    
+    def append_case(self, page_num: int, detail: dict):
+        """사례 한 건 기록 (스크래핑 직후 호출)"""
+        self._append({"type": "case", "page": page_num, "key": case_key(detail)})
+    
+    def mark_page_done(self, page_num: int, case_count: int, group_size: int = 10):
+        """페이지 처리 완료 기록 (디스크 동기화까지 수행)"""
+        self._append({
+            "type": "page",
+            "page": page_num,
+            "group": (page_num - 1) // group_size + 1,
+            "cases": case_count,
+            "at": datetime.now().isoformat()
+        }, sync=True)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def records(self):
+        """저널 레코드 순회 (비정상 종료로 잘린 마지막 줄은 무시)"""
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    
+    def load_state(self) -> dict:
+        """검색 조건, 완료된 페이지 목록, 마지막 완료 페이지/그룹, 기록된 사례 수, 완료되지 않은 첫 페이지 복원"""
+        state = {"search": None, "completed_pages": set(), "last_page": 0, "last_group": 0, "case_count": 0}
+        for record in self.records():
+            if record["type"] == "start":
+                state["search"] = record["search"]
+            elif record["type"] == "case":
+                state["case_count"] += 1
+            elif record["type"] == "page":
+                state["completed_pages"].add(record["page"])
+                state["last_page"] = record["page"]
+                state["last_group"] = record["group"]
+        
+        first_unfinished = 1
+        while first_unfinished in state["completed_pages"]:
+            first_unfinished += 1
+        state["first_unfinished_page"] = first_unfinished
+        return state
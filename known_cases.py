@@ -0,0 +1,70 @@
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+from records import case_key, normalize_date
+
+
+def valid_date(value: str) -> str:
+    """'YYYY-MM-DD'로 정규화한 날짜 (날짜가 아니면 빈 문자열, 문자열 비교로 최신 날짜를 고를 수 있도록)"""
+    value = normalize_date(value)
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        return ""
+
+
+class KnownCaseIndex:
+    """이미 수집한 사례의 식별 키와 시행일자 최고 기록(high-water mark) 저장소"""
+    
+    def __init__(self, output_dir, filename: str = "known_cases.json"):
+        self.path = Path(output_dir) / filename
+        self.keys = set()
+        self.high_water_mark = ""  # 수집한 사례 중 가장 최근 시행일자 (YYYY-MM-DD)
+        self.last_crawl_at = ""
+    
+    def load(self) -> "KnownCaseIndex":
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.keys = set(data.get("keys", []))
+            self.high_water_mark = data.get("high_water_mark", "")
+            self.last_crawl_at = data.get("last_crawl_at", "")
+        return self
+    
+    def save(self):
+        self.last_crawl_at = datetime.now().isoformat()
+        data = {
+            "high_water_mark": self.high_water_mark,
+            "last_crawl_at": self.last_crawl_at,
+            "keys": sorted(self.keys),
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(self.path)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def contains(self, detail: dict) -> bool:
+        return case_key(detail) in self.keys
+    
+    def add(self, details):
+        """사례 키 등록 및 시행일자 최고 기록 갱신 (날짜로 읽을 수 없는 시행일자는 최고 기록에 반영하지 않음)"""
+        high_water_mark = valid_date(self.high_water_mark)
+        for detail in details:
+            self.keys.add(case_key(detail))
+            effective_date = valid_date(detail.get("effective_date"))
+            if effective_date > high_water_mark:
+                high_water_mark = effective_date
+        self.high_water_mark = high_water_mark
+    
+    def search_start(self) -> date:
+        """증분 크롤링 검색 시작일 (시행일자 최고 기록, 없으면 마지막 크롤링 날짜)"""
+        for value in (self.high_water_mark, self.last_crawl_at[:10]):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                continue
+        return None
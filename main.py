@@ -1,9 +1,12 @@
+import gc
 import os
-import time
+import re
 import json
+import time
+import queue
 import base64
-import requests
-from datetime import datetime
+import multiprocessing
+from datetime import date
 from pathlib import Path
 
 from selenium import webdriver
@@ -17,37 +20,270 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException,
     StaleElementReferenceException,
-    ElementClickInterceptedException
+    ElementClickInterceptedException,
+    SessionNotCreatedException
 )
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+
+from profiler import StepProfiler
+from records import new_case_detail, assign_detail_field, case_key, normalize_date
+from journal import CrawlJournal
+from known_cases import KnownCaseIndex
+from sinks import make_sinks, iter_jsonl, compact_jsonl, seed_jsonl_from_json
+from pdf_render import PDF_PRINT_OPTIONS, PdfRenderPool
+from images import ImagePipeline
+from recovery import SESSION, FATAL, classify_error, retry_call, RetryPolicy, DeadLetterLog
+from browser import FAST_PROFILE_ARGUMENTS, TAB_POOL_ARGUMENTS, resolve_chromedriver_path, block_resources
+from blob_store import BlobStore, BlobManifest, normalize_pdf, record_bytes, pdf_sha
+from telemetry import Telemetry
+from rate_limit import AdaptiveRateLimiter
+from date_shards import parse_date, month_shards, split_shard, ShardPlan
+from resource_monitor import ResourceMonitor
+
+
+BASE_URL = "https://unipass.customs.go.kr"
+CASES_PER_PAGE = 10  # 결과 목록 한 페이지당 사례 수
+PAGE_GROUP_SIZE = 10  # 페이지네이션 한 그룹의 페이지 수 ("다음10페이지" 단위)
+DOM_CHANGE_TIMEOUT = 10  # 클릭 후 화면 갱신 신호를 기다리는 최대 시간 (초)
+BROWSER_PROFILES = ("default", "fast")  # default: 화면 표시 Chrome, fast: 헤드리스 + 리소스 차단
+PDF_RENDER_TIMEOUT = 120  # 백그라운드 PDF 변환 결과를 기다리는 최대 시간 (초)
+IMAGE_DOWNLOAD_TIMEOUT = 60  # 백그라운드 이미지 다운로드 결과를 기다리는 최대 시간 (초)
+
+# position번째 달력 버튼 앞의 날짜 입력란 (1: 시작일자, 2: 종료일자, 설정 결과 확인용)
+SEARCH_DATE_INPUT_XPATH = "(//a[@class='btn_calendar'])[{position}]/preceding::input[@type='text' or not(@type)][1]"
+
+# 상세보기 영역 옆의 인쇄 버튼
+PRINT_BUTTON_XPATH = (
+    "//button[@title='인쇄'] | //a[@title='인쇄'] | //button[contains(@onclick, 'print')] | "
+    "//a[contains(@onclick, 'print')] | //button[contains(text(), '인쇄')] | "
+    "//span[contains(text(), '인쇄')]/parent::button | //span[contains(text(), '인쇄')]/parent::a | "
+    "//img[contains(@alt, '인쇄')]/parent::a | //img[contains(@alt, '인쇄')]/parent::button"
+)
+
+# h2 제목 다음 첫 번째 테이블의 텍스트와 XHR 완료 횟수 (목록/상세보기 갱신 여부 판단용)
+TABLE_STATE_JS = """
+var table = document.evaluate(
+    "//h2[contains(text(), '" + arguments[0] + "')]/following::table[1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+var xhr = window.__scraperXhr || {started: 0, done: 0};
+return {text: table ? table.innerText : "", xhr_started: xhr.started, xhr_done: xhr.done};
+"""
+
+# 클릭 전 상태: XHR 완료 횟수를 세는 훅을 한 번 설치하고 테이블 텍스트, 첫 번째 행(없으면 테이블) 요소, XHR 완료 횟수 반환
+# (조회/클릭 결과가 이전과 같아도 요청이 끝나거나 행이 다시 그려진 것으로 갱신 완료를 판단)
+TABLE_SNAPSHOT_JS = """
+if (!window.__scraperXhr) {
+    window.__scraperXhr = {started: 0, done: 0};
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__scraperXhr.started++;
+        this.addEventListener("loadend", function () { window.__scraperXhr.done++; });
+        return send.apply(this, arguments);
+    };
+}
+var table = document.evaluate(
+    "//h2[contains(text(), '" + arguments[0] + "')]/following::table[1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+var row = table ? Array.prototype.find.call(table.querySelectorAll("tr"), function (tr) {
+    return tr.querySelector("td");
+}) : null;
+return {text: table ? table.innerText : "", element: row || table, xhr_done: window.__scraperXhr.done};
+"""
+
+# 상세보기 테이블의 th/td 쌍과 이미지를 한 번에 추출 (테이블이 없으면 null)
+DETAIL_TABLE_JS = """
+var table = document.evaluate(
+    "//h2[contains(text(), '상세보기')]/following::table[1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!table) { return null; }
+var rows = [];
+table.querySelectorAll("tr").forEach(function (tr) {
+    var th = tr.querySelector("th"), td = tr.querySelector("td");
+    if (th && td) { rows.push([th.innerText.trim(), td.innerText.trim()]); }
+});
+var images = [];
+table.querySelectorAll("img").forEach(function (img) {
+    if (img.src) { images.push({src: img.src, alt: img.getAttribute("alt") || ""}); }
+});
+return {rows: rows, images: images};
+"""
+
+# 품목분류사례 목록의 사례 행 수, 품명 링크, 테이블 텍스트를 한 번에 추출
+CASE_LIST_JS = """
+var table = document.evaluate(
+    "//h2[contains(text(), '품목분류사례')]/following::table[1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!table) { return {rows: 0, links: [], text: ""}; }
+var rows = Array.prototype.filter.call(
+    table.querySelectorAll("tbody tr"), function (tr) { return tr.querySelector("td"); }
+);
+return {rows: rows.length, links: Array.prototype.slice.call(table.querySelectorAll("tbody tr a")),
+        text: table.innerText};
+"""
+
+# 페이지네이션 상태 (표시된 페이지 번호, 링크(href="#N")가 가리키는 페이지 번호, 현재 페이지,
+# 다음10페이지 버튼 여부, 전체 건수 문구)
+PAGINATION_JS = """
+var pages = [], linked = [];
+function collect(a) {
+    var text = a.innerText.trim(), href = /^#(\\d+)$/.exec(a.getAttribute("href") || "");
+    if (/^\\d+$/.test(text)) { pages.push(parseInt(text, 10)); }
+    if (href) { linked.push(parseInt(href[1], 10)); }
+}
+document.querySelectorAll("div[class*='paging'] a, div[class*='pagination'] a").forEach(collect);
+var list = document.evaluate(
+    "//h2[contains(text(), '품목분류사례')]/following::ul[@class='pages'][1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+var current = null, hasNextGroup = false;
+if (list) {
+    list.querySelectorAll("a").forEach(collect);
+    var active = list.querySelector("li.on, li.active, a.on, a.active, strong, [aria-current], [title*='현재']");
+    if (active && /^\\d+$/.test(active.innerText.trim())) { current = parseInt(active.innerText.trim(), 10); }
+}
+hasNextGroup = document.evaluate(
+    "//h2[contains(text(), '품목분류사례')]/following::a[span[contains(text(), '다음10페이지')]][1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue !== null;
+var count = document.evaluate(
+    "//*[contains(text(), '총') and contains(text(), '건')]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue || document.evaluate(
+    "//*[contains(text(), '건') or contains(text(), '총')]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+return {pages: pages, linked_pages: linked, current: current, has_next_group: hasNextGroup,
+        total_count_text: count ? count.innerText : ""};
+"""
+
+# 페이지 번호 링크를 목표 번호로 복제하여 클릭 (href="#N"이나 onclick의 페이지 인자만 바꿔 사이트의 이동 함수를 그대로 사용)
+PAGE_JUMP_JS = """
+var target = String(arguments[0]);
+var list = document.evaluate(
+    "//h2[contains(text(), '품목분류사례')]/following::ul[@class='pages'][1]",
+    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+if (!list) { return false; }
+var links = Array.prototype.filter.call(list.querySelectorAll("a"), function (a) {
+    return /^\\d+$/.test(a.innerText.trim());
+});
+for (var i = 0; i < links.length; i++) {
+    if (links[i].innerText.trim() === target) { links[i].click(); return true; }
+}
+// 자기 번호를 onclick 인자로 가진 링크를 우선 사용 (현재 페이지 링크에는 이동 함수가 없는 경우가 많음)
+var template = null;
+["onclick", "href"].forEach(function (name) {
+    links.forEach(function (a) {
+        var pattern = new RegExp("\\\\b" + a.innerText.trim() + "\\\\b");
+        if (!template && pattern.test(a.getAttribute(name) || "")) { template = a; }
+    });
+});
+if (!template) { return false; }
+var number = new RegExp("\\\\b" + template.innerText.trim() + "\\\\b", "g");
+var jump = template.cloneNode(true);
+["onclick", "href"].forEach(function (name) {
+    var value = template.getAttribute(name);
+    if (value) { jump.setAttribute(name, value.replace(number, target)); }
+});
+jump.textContent = target;
+jump.style.display = "none";
+template.parentNode.appendChild(jump);
+jump.click();
+if (jump.parentNode) { jump.parentNode.removeChild(jump); }
+return true;
+"""
 
 
 class UnipassHSScraper:
     """관세청 UNIPASS 품목분류 국내사례 스크래퍼"""
     
-    def __init__(self, output_dir: str = "scraped_data"):
+    def __init__(self, output_dir: str = "scraped_data", base_url: str = BASE_URL,
+                 capture_network: bool = False, output_formats: tuple = ("jsonl",), pdf_workers: int = 0,
+                 image_workers: int = 4, max_attempts: int = 3, browser_profile: str = "default",
+                 verbosity: str = "info", metrics_port: int = None, rate_limit: bool = True,
+                 tabs: int = 1, keep_browser: bool = False, long_run: bool = False):
+        if browser_profile not in BROWSER_PROFILES:
+            raise ValueError(f"알 수 없는 브라우저 프로필: {browser_profile} (가능한 값: {', '.join(BROWSER_PROFILES)})")
+        self.base_url = base_url.rstrip("/")
+        self.browser_profile = browser_profile
+        self.capture_network = capture_network  # XHR 요청 캡처 (HTTP 백엔드 부트스트랩용)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.images_dir = self.output_dir / "images"
         self.images_dir.mkdir(exist_ok=True)
-        self.pdf_dir = self.output_dir / "pdf"
+        self.pdf_dir = self.output_dir / "pdf"  # 인쇄 대화상자 저장 위치 (PDF는 blobs에 내용 해시로 저장)
         self.pdf_dir.mkdir(exist_ok=True)
+        self.blob_store = BlobStore(self.output_dir / "blobs")
+        self.manifest = BlobManifest(self.output_dir)
         
         self.driver = None
         self.wait = None
-        self.results = []
+        self.profiler = StepProfiler()
+        self.keep_browser = keep_browser  # 상주 모드: 크롤링이 끝나도 브라우저를 닫지 않고 다음 작업에 재사용
+        
+        # 로그/추적(trace.jsonl)/지표(metrics.prom), verbosity는 콘솔에 출력할 로그 수준 (error/warning/info/debug)
+        self.verbosity = verbosity
+        self.telemetry = Telemetry(self.output_dir, verbosity)
+        self.telemetry.attach_profiler(self.profiler)
+        if metrics_port is not None:
+            self.telemetry.serve_metrics(metrics_port)
+        
+        # 페이지 이동/클릭/이미지 다운로드 요청 속도 제한 (같은 사이트의 모든 워커/실행이 상태 파일로 공유, AIMD 자동 조정)
+        self.rate_limiter = AdaptiveRateLimiter.for_site(self.base_url, enabled=rate_limit)
+        
+        # pdf_workers > 0이면 인쇄 화면만 캡처하고 PDF 변환/저장은 백그라운드 브라우저에서 처리
+        self.pdf_workers = pdf_workers
+        self.pdf_pool = None
+        self.pending_pdfs = {}  # case_index → PDF 변환 Future
+        
+        # image_workers > 0이면 상세보기 이미지를 백그라운드에서 동시에 다운로드 (0이면 다운로드하지 않음)
+        self.image_workers = image_workers
+        self.image_pipeline = None
+        self.pending_images = {}  # case_index → 이미지 다운로드 Future 목록
+        self.journal = CrawlJournal(self.output_dir)  # 병렬 워커에서는 None (부모 프로세스만 기록)
+        self.recording = True  # 병렬 워커에서는 False (사례 기록/저장소/카운터는 부모 프로세스가 결과를 받아 처리)
+        
+        # 오류 복구: 사례/페이지 이동 재시도, 세션이 끊기면 브라우저 재시작 후 검색 조건과 페이지 복원
+        self.retry_policy = RetryPolicy(max_attempts=max_attempts)
+        self.dead_letters = DeadLetterLog(self.output_dir)  # 재시도 후에도 실패한 사례
+        self.search = None  # 마지막 검색 조건 (시작일, 종료일 또는 None)
+        self.current_page = 1  # 현재 표시 중인 결과 페이지
+        
+        # tabs > 1이면 같은 브라우저에 검색 결과 탭을 더 열어 한 페이지의 사례를 탭마다 나누어 동시에 불러옴
+        self.tabs = max(1, tabs)
+        self.tab_pages = {}  # 추가 탭 창 핸들 → 표시 중인 결과 페이지
+        
+        # 장시간 모드: 브라우저/파이썬 메모리와 사례당 처리 시간을 보고 페이지 경계에서 브라우저를 새로 띄움
+        self.monitor = ResourceMonitor() if long_run else None
+        
+        # 사례는 메모리에 모으지 않고 스크래핑 직후 출력에 기록 (JSONL은 최종 JSON/CSV의 원본이므로 항상 포함)
+        self.cases_path = self.output_dir / "hs_classification_cases.jsonl"
+        formats = ("jsonl",) + tuple(name for name in output_formats if name != "jsonl")
+        self.sinks = make_sinks(self.output_dir, formats)
         
     def setup_driver(self):
-        """Chrome WebDriver 설정 (PDF 저장 지원)"""
+        """Chrome WebDriver 설정 (PDF 저장 지원, 상주 모드에서 이미 띄운 브라우저가 있으면 재사용)"""
+        if self.keep_browser and self.driver is not None:
+            return
         chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # 필요시 헤드리스 모드
+        if self.browser_profile == "fast":
+            # 헤드리스, 작은 창, 캐시/백그라운드 기능 축소 (이미지/폰트 등은 드라이버 시작 후 CDP로 차단)
+            for argument in FAST_PROFILE_ARGUMENTS:
+                chrome_options.add_argument(argument)
+        else:
+            # chrome_options.add_argument("--headless")  # 필요시 헤드리스 모드
+            chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--lang=ko-KR")
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        if self.tabs > 1:
+            for argument in TAB_POOL_ARGUMENTS:
+                chrome_options.add_argument(argument)
         
         # PDF 저장을 위한 설정
         chrome_options.add_argument("--kiosk-printing")
@@ -79,341 +315,629 @@ class UnipassHSScraper:
         }
         chrome_options.add_experimental_option("prefs", prefs)
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # 네트워크 이벤트를 performance 로그로 수집 (http_backend가 XHR 엔드포인트를 찾는 데 사용)
+        if self.capture_network:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
+        with self.profiler.measure("driver_start"):
+            self.driver = self.start_chrome(chrome_options)
         self.wait = WebDriverWait(self.driver, 20)
         
+        # 메인 탭에서는 이미지/폰트/미디어/분석 스크립트를 받지 않음 (상세보기 이미지는 ImagePipeline이 따로 받고,
+        # 인쇄 팝업은 새 창이라 차단되지 않으므로 PDF에는 그대로 포함됨)
+        if self.browser_profile == "fast":
+            block_resources(self.driver)
+        
+        if self.pdf_workers and self.pdf_pool is None:
+            self.pdf_pool = PdfRenderPool(self.create_render_driver, self.pdf_workers)
+        if self.image_workers and self.image_pipeline is None:
+            self.image_pipeline = self.create_image_pipeline()
+            
+    def chrome_service(self, refresh: bool = False) -> Service:
+        """ChromeDriver 서비스 (드라이버 경로는 캐시하여 매번 버전 확인 요청을 보내지 않음)"""
+        return Service(resolve_chromedriver_path(refresh))
+        
+    def start_chrome(self, chrome_options: Options):
+        """Chrome 실행 (캐시된 드라이버가 설치된 Chrome 버전과 맞지 않으면 드라이버를 다시 찾아 한 번 더 시도)"""
+        try:
+            return webdriver.Chrome(service=self.chrome_service(), options=chrome_options)
+        except SessionNotCreatedException:
+            return webdriver.Chrome(service=self.chrome_service(refresh=True), options=chrome_options)
+        
+    def create_render_driver(self):
+        """PDF 변환 전용 헤드리스 Chrome (백그라운드 변환 풀에서 사용)"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1240,1754")
+        chrome_options.add_argument("--lang=ko-KR")
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        return self.start_chrome(chrome_options)
+        
+    def create_image_pipeline(self) -> ImagePipeline:
+        """이미지 다운로드 파이프라인 (images/ 아래 내용 해시 경로에 저장)"""
+        return ImagePipeline(self.images_dir, self.base_url, max_workers=max(1, self.image_workers),
+                             rate_limiter=self.rate_limiter)
+        
     def close_driver(self):
-        """WebDriver 종료"""
+        """WebDriver 종료 (백그라운드 PDF 변환/이미지 다운로드가 남아 있으면 완료까지 대기, 상주 모드에서는 유지)"""
+        if self.keep_browser and self.driver is not None:
+            return
+        if self.pdf_pool:
+            self.pdf_pool.shutdown()
+            self.pdf_pool = None
+        if self.image_pipeline:
+            self.image_pipeline.close()
+            self.image_pipeline = None
         if self.driver:
             self.driver.quit()
+            self.driver = None
+            self.search = None  # 새 브라우저는 검색 화면부터 다시 열어야 함
+            self.tab_pages = {}
             
-    def navigate_to_main_page(self):
-        """메인 페이지로 이동"""
-        url = "https://unipass.customs.go.kr/clip/index.do"
-        self.driver.get(url)
-        time.sleep(3)
-        print("메인 페이지 로드 완료")
+    def throttle(self):
+        """사이트 요청 전 속도 제한 (with 블록의 소요 시간/오류로 요청 속도 조정, 대기 시간은 rate_wait로 기록)"""
+        return self.rate_limiter.limit(self.profiler)
         
-    def navigate_to_hs_classification(self):
-        """세계 HS > 품목분류국내사례 메뉴로 이동"""
+    def log(self, message: str, level: str = "info", event: str = "log", **fields):
+        """콘솔 출력(verbosity 수준까지) + 추적 이벤트 기록"""
+        self.telemetry.log(message, level, event, **fields)
+        
+    def open_search(self, start_year: int = 2016, start_month: int = 1, start_day: int = 1, end_date: date = None):
+        """메인 페이지 → 품목분류 국내사례 메뉴 → 검색 기간 설정 → 조회 (결과 1페이지 표시)
+        
+        상주 모드에서 브라우저가 이미 검색 화면에 있으면 메뉴 이동 없이 기간만 바꿔 다시 조회하고,
+        검색 조건이 같으면 다시 조회하지 않고 1페이지로만 돌아간다.
+        """
+        if self.keep_browser and self.search is not None:
+            start_date = date(start_year, start_month, start_day)
+            if self.search == (start_date, end_date) and self.go_to_page_number(self.current_page, 1):
+                self.current_page = 1
+                return
+            self.change_search(start_date, end_date)
+            return
+        self.navigate_to_main_page()
+        self.navigate_to_hs_classification()
+        self.change_search(date(start_year, start_month, start_day), end_date)
+        
+    def change_search(self, start_date: date, end_date: date = None):
+        """검색 화면에서 기간만 바꿔 다시 조회 (메뉴 이동 없이, 결과 1페이지 표시, 이전 조건의 추가 탭은 닫음)"""
+        self.close_tabs()
+        self.set_search_date(start_date.year, start_date.month, start_date.day, end_date)
+        self.click_search()
+        self.search = (start_date, end_date)
+        self.current_page = 1
+        self.telemetry.event("search_opened", start=start_date.isoformat(), end=end_date.isoformat() if end_date else None)
+        
+    def ensure_search(self, start_date: date, end_date: date = None):
+        """검색 조건이 다르면 다시 조회 (검색 화면을 연 적이 없으면 메뉴부터 이동)"""
+        if self.search is None:
+            self.open_search(start_date.year, start_date.month, start_date.day, end_date)
+        elif self.search != (start_date, end_date):
+            self.change_search(start_date, end_date)
+        
+    def restart_driver(self, page_num: int):
+        """브라우저만 새로 띄워 같은 검색 조건의 page_num 페이지로 복원 (PDF 변환 풀/이미지 다운로드는 유지)"""
+        self.log(f"  브라우저 재시작 후 {page_num} 페이지로 복원합니다.", "warning", "driver_restart", page=page_num)
+        self.telemetry.count("driver_restarts")
+        with self.profiler.measure("driver_restart"):
+            self.reopen_browser(page_num)
+        
+    def reopen_browser(self, page_num: int):
+        """브라우저를 닫고 새로 띄워 같은 검색 조건의 page_num 페이지 표시"""
         try:
-            # 메인 메뉴에서 '세계HS' 버튼 클릭 (span 태그로 되어있음)
-            world_hs_menu = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), '세계HS')]"))
-            )
-            world_hs_menu.click()
-            time.sleep(1)
-            print("세계HS 메뉴 클릭 완료")
-            
-            # 서브메뉴에서 '품목분류 국내사례' 클릭 (ID로 찾기)
-            domestic_case_menu = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_M_ULS0807030051"))
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.tab_pages = {}
+        self.setup_driver()
+        # 새 브라우저는 검색 화면부터 다시 열어야 함 (상주 모드에서도 메뉴부터 이동)
+        start_date, end_date = self.search or (date(2016, 1, 1), None)
+        self.navigate_to_main_page()
+        self.navigate_to_hs_classification()
+        self.change_search(start_date, end_date)
+        if not self.go_to_page_number(1, page_num):
+            raise TimeoutException(f"재시작 후 {page_num} 페이지로 이동하지 못했습니다.")
+                
+    def run_with_recovery(self, action, page_num: int, label: str):
+        """action 실행 (오류 종류에 따라 재시도, 재시도 횟수를 넘거나 fatal 오류면 마지막 예외를 그대로 전달)"""
+        # 일시적 오류는 같은 브라우저에서 백오프 후 재시도하고, 세션이 끊겼거나 두 번 이상 실패하면
+        # 브라우저를 재시작하여 같은 검색 조건의 page_num 페이지로 복원한 뒤 재시도
+        needs_restart = False
+        
+        def attempt_action():
+            nonlocal needs_restart
+            if needs_restart:
+                self.restart_driver(page_num)
+                needs_restart = False
+            return action()
+        
+        def on_retry(error, kind, attempt, delay):
+            nonlocal needs_restart
+            needs_restart = needs_restart or kind == SESSION or attempt >= 2
+            self.log(f"    {label}: {type(error).__name__} ({kind}), {delay:.1f}초 후 재시도 "
+                     f"({attempt}/{self.retry_policy.max_attempts - 1})", "warning", "retry",
+                     label=label, error_type=type(error).__name__, error_class=kind, attempt=attempt, page=page_num)
+            self.telemetry.count("retries", kind=kind)
+            self.profiler.record(f"retry_{kind}", delay)
+        
+        return retry_call(attempt_action, self.retry_policy, on_retry)
+                
+    def wait_for_page_ready(self, timeout: int = 20):
+        """문서 로드 완료 및 진행 중인 AJAX 요청이 없을 때까지 대기"""
+        WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script(
+                "return document.readyState === 'complete' && "
+                "(!window.jQuery || window.jQuery.active === 0);"
             )
-            domestic_case_menu.click()
-            time.sleep(3)
-            print("품목분류 국내사례 페이지로 이동 완료")
+        )
+        
+    def table_snapshot(self, heading: str) -> dict:
+        """클릭 전 h2 제목(예: 품목분류사례, 상세보기) 다음 테이블의 상태 (text, element, xhr_done, wait_for_table_change용)"""
+        try:
+            return self.driver.execute_script(TABLE_SNAPSHOT_JS, heading) or {"text": "", "element": None, "xhr_done": 0}
+        except Exception:
+            return {"text": "", "element": None, "xhr_done": 0}
             
-        except TimeoutException:
-            print("메뉴를 찾을 수 없습니다. 직접 URL로 이동합니다.")
-            # 직접 URL로 이동 시도
-            self.driver.get("https://unipass.customs.go.kr/clip/index.do#702010100000")
-            time.sleep(3)
+    def table_changed(self, heading: str, before: dict) -> bool:
+        """before 이후 테이블이 갱신되었는지 (요청 완료, 이전 행이 다시 그려짐(stale), 내용 변경 중 하나)"""
+        try:
+            state = self.driver.execute_script(TABLE_STATE_JS, heading)
+            # 내용이 이전과 같은 결과(같은 조건 재조회, 같은 사례 재클릭, 빈 구간)도 요청이 끝나면 갱신 완료
+            if state["xhr_done"] > before["xhr_done"] and state["xhr_started"] == state["xhr_done"]:
+                return True
+            if state["text"] == "":
+                return False
+            if state["text"] != before["text"]:
+                return True
+            return before["element"] is not None and EC.staleness_of(before["element"])(self.driver)
+        except Exception:
+            return False
             
-    def set_search_date(self, start_year: int = 2016, start_month: int = 1):
-        """시행일자 시작일 설정"""
+    def wait_for_table_change(self, heading: str, before: dict, timeout: int = DOM_CHANGE_TIMEOUT) -> bool:
+        """클릭 전 상태(table_snapshot) 이후 테이블이 갱신될 때까지 대기 (고정 sleep 대신 실제 갱신 신호 사용)"""
         try:
-            # 시작일자 달력 버튼 클릭
-            calendar_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "(//a[@class='btn_calendar'])[1]"))
-            )
-            calendar_btn.click()
-            time.sleep(1)
-            print("달력 팝업 열기 완료")
+            WebDriverWait(self.driver, timeout).until(lambda d: self.table_changed(heading, before))
+            return True
+        except TimeoutException:
+            return False
             
-            # 년도 선택 (select 드롭다운)
-            year_select = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//select[@name='selectYear' and @title='시작일자 연도']"))
-            )
-            Select(year_select).select_by_value(str(start_year))
-            time.sleep(0.5)
-            print(f"시작 년도 선택: {start_year}년")
+    def expect_table_change(self, heading: str, before: dict, timeout: int = DOM_CHANGE_TIMEOUT):
+        """wait_for_table_change와 같지만 갱신되지 않으면 TimeoutException (재시도/실패 기록 경로로 전달)"""
+        if not self.wait_for_table_change(heading, before, timeout):
+            raise TimeoutException(f"{heading} 테이블이 {timeout}초 안에 갱신되지 않았습니다.")
             
-            # 날짜(1일) 클릭
-            day_element = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'day') and contains(@class, 'toMonth') and text()='1']"))
-            )
-            day_element.click()
-            time.sleep(0.5)
-            print("날짜 선택: 1일")
+    def navigate_to_main_page(self):
+        """메인 페이지로 이동"""
+        url = f"{self.base_url}/clip/index.do"
+        with self.throttle(), self.profiler.measure("navigate_main"):
+            self.driver.get(url)
+            self.wait_for_page_ready()
+        # 세션 쿠키가 필요한 이미지도 받을 수 있도록 브라우저 쿠키 공유
+        if self.image_pipeline:
+            self.image_pipeline.load_cookies(self.driver.get_cookies())
+        self.log("메인 페이지 로드 완료", event="navigate")
+        
+    def navigate_to_hs_classification(self):
+        """세계 HS > 품목분류국내사례 메뉴로 이동"""
+        search_btn_locator = (By.XPATH, "//button[@type='submit' and @title='조회']")
+        try:
+            with self.throttle(), self.profiler.measure("navigate_menu"):
+                # 메인 메뉴에서 '세계HS' 버튼 클릭 (span 태그로 되어있음)
+                world_hs_menu = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//span[contains(text(), '세계HS')]"))
+                )
+                world_hs_menu.click()
+                self.log("세계HS 메뉴 클릭 완료", "debug", "navigate")
+                
+                # 서브메뉴에서 '품목분류 국내사례' 클릭 (ID로 찾기, 서브메뉴가 열릴 때까지 대기)
+                domestic_case_menu = self.wait.until(
+                    EC.element_to_be_clickable((By.ID, "LEFTMENU_LNK_M_ULS0807030051"))
+                )
+                domestic_case_menu.click()
+                
+                # 검색 화면의 조회 버튼이 나타나면 이동 완료
+                self.wait.until(EC.presence_of_element_located(search_btn_locator))
+            self.log("품목분류 국내사례 페이지로 이동 완료", event="navigate")
             
-            # 확인 버튼 클릭
-            confirm_btn = self.driver.find_element(
-                By.XPATH, "//button[@name='dateSelectBtn']"
-            )
-            confirm_btn.click()
-            time.sleep(1)
-            print(f"검색 시작일 설정 완료: {start_year}년 {start_month}월 1일")
+        except TimeoutException:
+            self.log("메뉴를 찾을 수 없습니다. 직접 URL로 이동합니다.", "warning", "navigate")
+            # 직접 URL로 이동 시도
+            with self.throttle(), self.profiler.measure("navigate_menu"):
+                self.driver.get(f"{self.base_url}/clip/index.do#702010100000")
+                self.wait_for_page_ready()
             
-        except Exception as e:
-            print(f"날짜 설정 중 오류: {e}")
+    def set_search_date(self, start_year: int = 2016, start_month: int = 1, start_day: int = 1, end_date: date = None):
+        """시행일자 검색 기간 설정 (end_date가 없으면 종료일은 사이트 기본값 유지)
+        
+        설정 후 입력란의 값을 다시 읽어 확인하고, 다르면 다시 설정한다. 재시도 횟수를 넘으면 마지막 예외
+        (값이 다르면 TimeoutException)를 전달하여 다른 기간을 조회한 채로 스크래핑하지 않도록 한다.
+        """
+        start_date = date(start_year, start_month, start_day)
+        expected = {1: start_date.isoformat()}
+        if end_date:
+            expected[2] = end_date.isoformat()
+        error = None
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                with self.profiler.measure("set_search_date"):
+                    self.select_calendar_date("시작일자", 1, start_date)
+                    if end_date:
+                        self.select_calendar_date("종료일자", 2, end_date)
+                    actual = {position: self.read_search_date(position) for position in expected}
+                if actual == expected:
+                    self.log(f"검색 기간 설정 완료: {start_date} ~ {end_date or ''}", event="search_date",
+                             start=start_date.isoformat(), end=end_date.isoformat() if end_date else None)
+                    return
+                error = TimeoutException(f"검색 기간이 설정되지 않았습니다 (요청 {expected}, 화면 {actual})")
+            except Exception as e:
+                error = e
+            self.log(f"날짜 설정 중 오류 ({attempt}/{self.retry_policy.max_attempts}): {error}", "warning", "search_date",
+                     error_type=type(error).__name__, attempt=attempt, start=start_date.isoformat(),
+                     end=end_date.isoformat() if end_date else None)
+            self.telemetry.count("search_date_failures")
+        raise error
+        
+    def read_search_date(self, position: int) -> str:
+        """position번째 달력(1: 시작일자, 2: 종료일자)의 입력란 값 ('YYYY-MM-DD', 입력란이 없으면 빈 문자열)"""
+        inputs = self.driver.find_elements(By.XPATH, SEARCH_DATE_INPUT_XPATH.format(position=position))
+        return normalize_date(inputs[0].get_attribute("value") or "") if inputs else ""
             
+    def find_visible(self, locator: tuple):
+        """locator에 맞는 요소 중 화면에 보이는 첫 번째 요소 (없으면 None, 달력 팝업이 여러 개인 화면용)"""
+        for element in self.driver.find_elements(*locator):
+            try:
+                if element.is_displayed():
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return None
+        
+    def select_calendar_date(self, label: str, position: int, day: date):
+        """label(시작일자/종료일자) 달력 팝업을 열어 날짜 선택 (position은 화면에서 달력 버튼의 순서)"""
+        day_locator = (By.XPATH, f"//div[contains(@class, 'day') and contains(@class, 'toMonth') and text()='{day.day}']")
+        confirm_locator = (By.XPATH, "//button[@name='dateSelectBtn']")
+        
+        # 달력 버튼 클릭
+        calendar_btn = self.wait.until(
+            EC.element_to_be_clickable((By.XPATH, f"(//a[@class='btn_calendar'])[{position}]"))
+        )
+        calendar_btn.click()
+        
+        # 년도 선택 (select 드롭다운, 달력 팝업이 열리면 나타남)
+        year_select = self.wait.until(
+            EC.presence_of_element_located((By.XPATH, f"//select[@name='selectYear' and @title='{label} 연도']"))
+        )
+        self.log(f"{label} 달력 팝업 열기 완료", "debug")
+        old_day = self.find_visible(day_locator)
+        Select(year_select).select_by_value(str(day.year))
+        
+        # 월 선택 (월 드롭다운이 있는 달력인 경우, 값 형식은 '1' 또는 '01')
+        month_selects = self.driver.find_elements(
+            By.XPATH, f"//select[@name='selectMonth' and @title='{label} 월']"
+        )
+        if month_selects:
+            try:
+                Select(month_selects[0]).select_by_value(str(day.month))
+            except NoSuchElementException:
+                Select(month_selects[0]).select_by_value(f"{day.month:02d}")
+        
+        # 년/월 변경으로 달력이 다시 그려질 때까지 대기 후 날짜 클릭
+        if old_day:
+            try:
+                WebDriverWait(self.driver, 2).until(EC.staleness_of(old_day))
+            except TimeoutException:
+                pass
+        day_element = self.wait.until(lambda d: self.find_visible(day_locator))
+        day_element.click()
+        
+        # 확인 버튼 클릭 후 달력 팝업이 닫힐 때까지 대기
+        confirm_btn = self.wait.until(lambda d: self.find_visible(confirm_locator))
+        confirm_btn.click()
+        self.wait.until(EC.invisibility_of_element(confirm_btn))
+        self.log(f"{label} 선택: {day}", "debug")
+        
     def click_search(self):
         """조회 버튼 클릭"""
+        before = self.table_snapshot("품목분류사례")
         try:
-            search_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and @title='조회']"))
-            )
-            search_btn.click()
-            time.sleep(3)
-            print("조회 버튼 클릭 완료")
+            with self.throttle(), self.profiler.measure("search"):
+                search_btn = self.wait.until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[@type='submit' and @title='조회']"))
+                )
+                search_btn.click()
+                # 결과 목록이 갱신될 때까지 대기
+                self.expect_table_change("품목분류사례", before, timeout=20)
+            self.log("조회 버튼 클릭 완료", event="search")
             
         except TimeoutException:
             # 다른 방법으로 조회 버튼 찾기
             try:
-                search_btn = self.driver.find_element(By.XPATH, "//button//span[text()='조회']/parent::button")
-                search_btn.click()
-                time.sleep(3)
-            except:
-                print("조회 버튼을 찾을 수 없습니다.")
+                with self.throttle(), self.profiler.measure("search"):
+                    search_btn = self.driver.find_element(By.XPATH, "//button//span[text()='조회']/parent::button")
+                    search_btn.click()
+                    self.expect_table_change("품목분류사례", before, timeout=20)
+            except Exception:
+                self.log("조회 버튼을 찾을 수 없습니다.", "error", "search")
+                raise
                 
-    def get_total_pages(self) -> int:
-        """전체 페이지 수 확인"""
+    def get_pagination_state(self) -> dict:
+        """페이지네이션 상태 (pages, current, has_next_group, total_count_text)를 한 번의 스크립트 호출로 조회"""
         try:
-            # 페이지네이션에서 마지막 페이지 버튼 찾기
-            # 마지막 페이지로 이동하는 버튼이나 페이지 정보 텍스트에서 추출
-            page_info_elements = self.driver.find_elements(
-                By.XPATH, "//div[contains(@class, 'paging')]//a | //div[contains(@class, 'pagination')]//a"
-            )
+            return self.driver.execute_script(PAGINATION_JS) or {}
+        except Exception:
+            return {}
             
-            pages = []
-            for elem in page_info_elements:
-                try:
-                    text = elem.text.strip()
-                    if text.isdigit():
-                        pages.append(int(text))
-                except:
-                    continue
-                    
-            if pages:
-                return max(pages)
-                
-        except:
-            pass
+    def get_total_pages(self) -> int:
+        """전체 페이지 수 확인"""
+        state = self.get_pagination_state()
+        
+        # 페이지네이션에서 가장 큰 페이지 번호 (마지막 페이지/다음10페이지 링크의 href="#N" 포함)
+        pages = state.get("pages", []) + state.get("linked_pages", [])
+        if pages:
+            return max(pages)
         
         # 전체 건수에서 페이지 수 계산 (10개씩)
-        try:
-            total_count_elem = self.driver.find_element(
-                By.XPATH, "//*[contains(text(), '건') or contains(text(), '총')]"
-            )
-            text = total_count_elem.text
-            import re
-            numbers = re.findall(r'\d+', text)
-            if numbers:
-                total_count = int(numbers[0])
-                return (total_count + 9) // 10  # 10개씩, 올림
-        except:
-            pass
+        total_count = self.parse_total_count(state.get("total_count_text", ""))
+        if total_count is not None:
+            return (total_count + 9) // 10  # 10개씩, 올림
             
         return 1  # 기본값
         
+    @staticmethod
+    def parse_total_count(text: str) -> int:
+        """'총 1,234건' 형식의 문구에서 사례 수 (찾지 못하면 None)"""
+        match = re.search(r"총\s*([\d,]+)\s*건", text) or re.search(r"(\d[\d,]*)", text)
+        return int(match.group(1).replace(",", "")) if match else None
+        
+    def get_total_count(self) -> int:
+        """조회 결과 전체 사례 수 (찾지 못하면 None)"""
+        return self.parse_total_count(self.get_pagination_state().get("total_count_text", ""))
+        
+    def get_case_list(self) -> dict:
+        """품목분류사례 목록의 사례 행 수(rows), 품명 링크(links), 테이블 텍스트(text)를 한 번에 조회
+        
+        WebDriver 오류는 그대로 전달한다 (읽지 못한 목록을 빈 페이지로 취급하면 페이지가 완료로 기록됨).
+        """
+        return self.driver.execute_script(CASE_LIST_JS)
+        
     def get_case_count_on_page(self) -> int:
-        """현재 페이지의 사례 수 확인"""
-        try:
-            # 품목분류사례 테이블에서 행 수 확인
-            rows = self.driver.find_elements(
-                By.XPATH, "//h2[contains(text(), '품목분류사례')]/following::table[1]//tbody//tr"
-            )
-            return len([r for r in rows if r.find_elements(By.TAG_NAME, "td")])
-        except:
-            return 0
+        """현재 페이지의 사례 수 확인 (WebDriver 오류는 그대로 전달)"""
+        return self.get_case_list()["rows"]
         
     def click_case_by_index(self, index: int) -> bool:
-        """인덱스로 사례 클릭 (0부터 시작)"""
-        try:
-            # 품목분류사례 테이블에서 품명 링크 클릭
-            case_links = self.driver.find_elements(
-                By.XPATH, "//h2[contains(text(), '품목분류사례')]/following::table[1]//tbody//tr//a"
-            )
-            
-            if index < len(case_links):
+        """인덱스로 사례 클릭 (0부터 시작, 클릭 중 WebDriver 오류는 재시도할 수 있도록 그대로 전달)"""
+        # 품목분류사례 테이블에서 품명 링크 클릭
+        case_links = self.get_case_list()["links"]
+        
+        if index < len(case_links):
+            before = self.table_snapshot("상세보기")
+            with self.throttle(), self.profiler.measure("click_case"):
                 case_links[index].click()
-                time.sleep(2)
-                return True
-            return False
-            
-        except Exception as e:
-            print(f"    사례 클릭 오류: {e}")
-            return False
+                # 상세보기 테이블 내용이 바뀔 때까지 대기
+                self.expect_table_change("상세보기", before)
+            return True
+        return False
         
-    def download_image(self, img_url: str, filename: str) -> str:
-        """이미지 다운로드"""
-        try:
-            if img_url.startswith("data:"):
-                # Base64 인코딩된 이미지
-                header, data = img_url.split(",", 1)
-                img_data = base64.b64decode(data)
-            else:
-                # URL에서 다운로드
-                if not img_url.startswith("http"):
-                    img_url = "https://unipass.customs.go.kr" + img_url
-                response = requests.get(img_url, timeout=10)
-                img_data = response.content
-                
-            filepath = self.images_dir / filename
-            with open(filepath, "wb") as f:
-                f.write(img_data)
-            return str(filepath)
+    def download_image(self, img_url: str, alt: str = "") -> dict:
+        """이미지 한 건 즉시 다운로드 (결과는 images 항목 형식: src, alt, sha256, local_path, thumbnail_path)"""
+        if self.image_pipeline is None:
+            self.image_pipeline = self.create_image_pipeline()
+        image = self.image_pipeline.download(img_url, alt)
+        self.count_image(image)
+        if image.get("error"):
+            self.log(f"이미지 다운로드 실패: {image['error']}", "warning", "image_failed", src=img_url)
+        return image
+        
+    def count_image(self, image: dict):
+        """이미지 다운로드 결과 카운터"""
+        self.telemetry.count("images", result="failed" if image.get("error") else "ok")
+        
+    def submit_image_downloads(self, detail: dict):
+        """상세보기에서 찾은 이미지를 백그라운드 다운로드에 등록 (결과는 collect_images로 반영)"""
+        if self.image_pipeline and detail["images"]:
+            self.pending_images[detail["index"]] = [
+                self.image_pipeline.submit(image["src"], image.get("alt", "")) for image in detail["images"]
+            ]
             
-        except Exception as e:
-            print(f"이미지 다운로드 실패: {e}")
-            return ""
-    
+    def collect_images(self, detail: dict):
+        """백그라운드 이미지 다운로드 결과를 사례 레코드에 반영"""
+        futures = self.pending_images.pop(detail["index"], None)
+        if futures is None:
+            return
+        images = []
+        for image, future in zip(detail["images"], futures):
+            try:
+                images.append(future.result(timeout=IMAGE_DOWNLOAD_TIMEOUT))
+            except Exception as e:
+                images.append(dict(image, error=str(e) or type(e).__name__))
+        for image in images:
+            self.count_image(image)
+            if image.get("error"):
+                self.log(f"    사례 {detail['index']} 이미지 다운로드 실패: {image['error']}", "warning", "image_failed",
+                         case_index=detail["index"], src=image["src"])
+        detail["images"] = images
+        
+    def is_pending(self, detail: dict) -> bool:
+        """PDF 변환이나 이미지 다운로드가 진행 중인 사례인지 여부"""
+        return detail["index"] in self.pending_pdfs or detail["index"] in self.pending_images
+        
     def click_print_button_and_save_pdf(self, case_index: int) -> str:
         """인쇄 버튼 클릭 후 PDF로 저장"""
-        pdf_filename = f"case_{case_index}.pdf"
-        pdf_path = self.pdf_dir / pdf_filename
-        
         try:
             # 상세보기 영역 옆에 있는 인쇄 버튼 찾기
             print_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, 
-                    "//button[@title='인쇄'] | //a[@title='인쇄'] | //button[contains(@onclick, 'print')] | "
-                    "//a[contains(@onclick, 'print')] | //button[contains(text(), '인쇄')] | "
-                    "//span[contains(text(), '인쇄')]/parent::button | //span[contains(text(), '인쇄')]/parent::a | "
-                    "//img[contains(@alt, '인쇄')]/parent::a | //img[contains(@alt, '인쇄')]/parent::button"
-                ))
+                EC.element_to_be_clickable((By.XPATH, PRINT_BUTTON_XPATH))
             )
             
-            # 현재 창 핸들 저장
+            # 현재 창 핸들 저장 (다른 탭이 열려 있을 수 있으므로 클릭 전 창 목록과 비교하여 팝업을 찾음)
             main_window = self.driver.current_window_handle
+            existing_windows = set(self.driver.window_handles)
+            window_count = len(existing_windows)
             
-            # 인쇄 버튼 클릭
-            print_btn.click()
-            time.sleep(2)
+            # 인쇄 버튼 클릭 후 인쇄 팝업 창이 열릴 때까지 대기
+            with self.throttle():
+                print_btn.click()
+                with self.profiler.measure("print_popup"):
+                    try:
+                        WebDriverWait(self.driver, 5).until(EC.number_of_windows_to_be(window_count + 1))
+                    except TimeoutException:
+                        pass
             
             # 새 창으로 전환
             all_windows = self.driver.window_handles
             new_window = None
             for window in all_windows:
-                if window != main_window:
+                if window not in existing_windows:
                     new_window = window
                     break
             
             if new_window:
                 self.driver.switch_to.window(new_window)
-                time.sleep(2)
+                # 인쇄 화면 로드 완료까지 대기
+                with self.profiler.measure("print_load"):
+                    self.wait_for_page_ready()
                 
                 # 새 창에서 PDF로 인쇄 (Chrome의 Print to PDF 기능 사용)
                 # DevTools Protocol을 사용하여 PDF 생성
-                result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                    "printBackground": True,
-                    "landscape": False,
-                    "paperWidth": 8.27,  # A4 width in inches
-                    "paperHeight": 11.69,  # A4 height in inches
-                    "marginTop": 0.4,
-                    "marginBottom": 0.4,
-                    "marginLeft": 0.4,
-                    "marginRight": 0.4
-                })
+                with self.profiler.measure("print_to_pdf"):
+                    result = self.driver.execute_cdp_cmd("Page.printToPDF", PDF_PRINT_OPTIONS)
                 
                 # Base64 디코딩하여 PDF 파일 저장
-                pdf_data = base64.b64decode(result["data"])
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_data)
-                
-                print(f"    PDF 저장 완료: {pdf_path}")
+                pdf_path = self.save_pdf(base64.b64decode(result["data"]))
+                self.log(f"    PDF 저장 완료: {pdf_path}", "debug", "pdf_saved", case_index=case_index)
                 
                 # 새 창 닫기
                 self.driver.close()
                 
                 # 메인 창으로 돌아가기
                 self.driver.switch_to.window(main_window)
-                time.sleep(1)
                 
-                return str(pdf_path)
+                return pdf_path
             else:
                 # 새 창이 열리지 않은 경우, 현재 창에서 처리
-                print("    새 창이 열리지 않음, 현재 창에서 PDF 저장 시도")
+                self.log("    새 창이 열리지 않음, 현재 창에서 PDF 저장 시도", "warning", "pdf_fallback", case_index=case_index)
                 
                 # DevTools Protocol을 사용하여 PDF 생성
-                result = self.driver.execute_cdp_cmd("Page.printToPDF", {
-                    "printBackground": True,
-                    "landscape": False,
-                    "paperWidth": 8.27,
-                    "paperHeight": 11.69,
-                    "marginTop": 0.4,
-                    "marginBottom": 0.4,
-                    "marginLeft": 0.4,
-                    "marginRight": 0.4
-                })
-                
-                pdf_data = base64.b64decode(result["data"])
-                with open(pdf_path, "wb") as f:
-                    f.write(pdf_data)
+                with self.profiler.measure("print_to_pdf"):
+                    result = self.driver.execute_cdp_cmd("Page.printToPDF", PDF_PRINT_OPTIONS)
                 
-                print(f"    PDF 저장 완료: {pdf_path}")
-                return str(pdf_path)
+                pdf_path = self.save_pdf(base64.b64decode(result["data"]))
+                self.log(f"    PDF 저장 완료: {pdf_path}", "debug", "pdf_saved", case_index=case_index)
+                return pdf_path
                 
         except Exception as e:
-            print(f"    PDF 저장 중 오류: {e}")
+            self.log(f"    PDF 저장 중 오류: {e}", "warning", "pdf_failed", case_index=case_index,
+                     error_type=type(e).__name__)
+            self.telemetry.count("pdfs", result="failed")
             return ""
             
-    def scrape_case_detail(self, case_index: int) -> dict:
-        """개별 사례 상세 정보 스크래핑 (인쇄 버튼 → PDF 저장 방식)"""
-        detail = {
-            "index": case_index,
-            "title": "",
-            "hs_code": "",
-            "description": "",
-            "images": [],
-            "classification_reason": "",
-            "pdf_path": "",
-            "scraped_at": datetime.now().isoformat()
-        }
+    def save_pdf(self, pdf_data: bytes) -> str:
+        """PDF를 내용 해시 저장소에 저장하고 경로 반환 (같은 내용이면 쓰지 않음, PDF 변환 스레드에서도 호출)"""
+        _, path = self.blob_store.put(normalize_pdf(pdf_data), ".pdf")
+        self.telemetry.count("pdfs", result="ok")
+        return str(path)
+        
+    def capture_print_view(self) -> str:
+        """인쇄 버튼 클릭 후 인쇄 화면 HTML만 가져오기 (PDF 변환은 백그라운드에서 처리)"""
+        print_btn = self.wait.until(
+            EC.element_to_be_clickable((By.XPATH, PRINT_BUTTON_XPATH))
+        )
+        main_window = self.driver.current_window_handle
+        existing_windows = set(self.driver.window_handles)
+        window_count = len(existing_windows)
         
         try:
-            # 상세보기 영역 대기
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), '상세보기')]"))
-            )
+            with self.throttle():
+                print_btn.click()
+                WebDriverWait(self.driver, 5).until(EC.number_of_windows_to_be(window_count + 1))
+        except TimeoutException:
+            # 새 창이 열리지 않은 경우 현재 화면을 그대로 사용
+            return self.driver.page_source
             
-            # 상세보기 테이블에서 기본 정보 추출 (제목, HS코드 등)
-            detail_table = self.driver.find_element(
-                By.XPATH, "//h2[contains(text(), '상세보기')]/following::table[1]"
-            )
+        new_window = next(window for window in self.driver.window_handles if window not in existing_windows)
+        self.driver.switch_to.window(new_window)
+        try:
+            self.wait_for_page_ready()
+            return self.driver.page_source
+        finally:
+            self.driver.close()
+            self.driver.switch_to.window(main_window)
             
-            # 모든 th-td 쌍에서 정보 추출
-            rows = detail_table.find_elements(By.TAG_NAME, "tr")
-            for row in rows:
-                try:
-                    th = row.find_element(By.TAG_NAME, "th")
-                    td = row.find_element(By.TAG_NAME, "td")
-                    header = th.text.strip()
-                    value = td.text.strip()
+    def submit_pdf_render(self, case_index: int):
+        """인쇄 화면을 캡처하여 백그라운드 PDF 변환 풀에 등록 (결과는 collect_pdf로 반영)"""
+        with self.profiler.measure("pdf_capture"):
+            html = self.capture_print_view()
+        self.pending_pdfs[case_index] = self.pdf_pool.submit(html, self.base_url, self.save_pdf)
+        
+    def collect_pdf(self, detail: dict):
+        """백그라운드 PDF 변환 결과(경로 또는 오류)를 사례 레코드에 반영"""
+        future = self.pending_pdfs.pop(detail["index"], None)
+        if future is None:
+            return
+        try:
+            detail["pdf_path"] = future.result(timeout=PDF_RENDER_TIMEOUT)
+        except Exception as e:
+            detail["pdf_error"] = str(e) or type(e).__name__
+            self.log(f"    사례 {detail['index']} PDF 변환 실패: {detail['pdf_error']}", "warning", "pdf_failed",
+                     case_index=detail["index"], error_type=type(e).__name__)
+            self.telemetry.count("pdfs", result="failed")
+            
+    def extract_case_detail(self, case_index: int) -> dict:
+        """상세보기 테이블에서 기본 정보 추출 (제목, HS코드 등)"""
+        detail = new_case_detail(case_index)
+        
+        with self.profiler.measure("extract_detail"):
+            # 상세보기 테이블의 모든 th-td 쌍과 이미지를 한 번의 스크립트 호출로 추출 (테이블이 나타날 때까지 대기)
+            table = self.wait.until(lambda d: d.execute_script(DETAIL_TABLE_JS))
+            for header, value in table["rows"]:
+                assign_detail_field(detail, header, value)
+                
+            # 상세보기 이미지 (URL 또는 data URI, 다운로드는 scrape_case_detail에서 등록)
+            for image in table["images"]:
+                if not any(known["src"] == image["src"] for known in detail["images"]):
+                    detail["images"].append(image)
                     
-                    if "품명" in header:
-                        detail["title"] = value
-                    elif "HS" in header or "세번" in header:
-                        detail["hs_code"] = value
-                    elif "해설" in header or "내용" in header:
-                        detail["description"] = value
-                    elif "분류사유" in header or "결정사유" in header or "사유" in header:
-                        detail["classification_reason"] = value
-                        
-                except NoSuchElementException:
-                    continue
+        return detail
+        
+    def scrape_case_detail(self, case_index: int, known_cases: KnownCaseIndex = None) -> dict:
+        """개별 사례 상세 정보 스크래핑 (인쇄 버튼 → PDF 저장 방식, known_cases에 있는 사례면 None)
+        
+        상세 정보 추출 오류는 재시도할 수 있도록 그대로 전달하고, PDF 저장 실패는 사례에 기록만 한다.
+        """
+        detail = self.extract_case_detail(case_index)
+        
+        # 이미 수집한 사례는 PDF 저장 없이 건너뜀 (증분 크롤링)
+        if known_cases is not None and known_cases.contains(detail):
+            return None
+        
+        self.submit_image_downloads(detail)
+        
+        # 백그라운드 변환 모드: 인쇄 화면만 캡처하고 바로 다음 사례로 진행
+        if self.pdf_pool:
+            try:
+                self.submit_pdf_render(case_index)
+            except Exception as e:
+                detail["pdf_error"] = f"인쇄 화면 캡처 실패: {e}"
+            return detail
             
-            # 인쇄 버튼 클릭 후 PDF 저장
+        # 인쇄 버튼 클릭 후 PDF 저장
+        with self.profiler.measure("pdf"):
             pdf_path = self.click_print_button_and_save_pdf(case_index)
-            if pdf_path:
-                detail["pdf_path"] = pdf_path
-                
-        except Exception as e:
-            print(f"상세 정보 추출 중 오류: {e}")
+        if pdf_path:
+            detail["pdf_path"] = pdf_path
             
         return detail
         
+    def scrape_case(self, position: int, case_index: int, known_cases: KnownCaseIndex = None) -> dict:
+        """목록의 position번째 사례를 클릭하여 상세 정보 스크래핑 (목록에 없으면 NoSuchElementException)"""
+        if not self.click_case_by_index(position):
+            raise NoSuchElementException(f"목록에 {position + 1}번째 사례가 없습니다.")
+        return self.scrape_case_detail(case_index, known_cases)
+        
     def go_to_page(self, page_num: int):
         """특정 페이지로 이동 (품목분류사례와 상세보기 사이의 ul.pages 사용)"""
         try:
@@ -424,12 +948,15 @@ class UnipassHSScraper:
                     f"//h2[contains(text(), '품목분류사례')]/following::ul[@class='pages'][1]//a[normalize-space(text())='{page_num}']"
                 ))
             )
-            page_btn.click()
-            time.sleep(2)
-            print(f"  페이지 {page_num}으로 이동 완료")
+            before = self.table_snapshot("품목분류사례")
+            with self.throttle(), self.profiler.measure("page_move"):
+                page_btn.click()
+                # 결과 목록이 갱신될 때까지 대기
+                self.expect_table_change("품목분류사례", before)
+            self.log(f"  페이지 {page_num}으로 이동 완료", "debug", "page_move", page=page_num)
             return True
         except Exception as e:
-            print(f"  페이지 {page_num} 버튼 클릭 실패: {e}")
+            self.log(f"  페이지 {page_num} 버튼 클릭 실패: {e}", "warning", "page_move", page=page_num)
             return False
     
     def go_to_next_page_group(self) -> bool:
@@ -442,129 +969,795 @@ class UnipassHSScraper:
                     "//h2[contains(text(), '품목분류사례')]/following::a[span[contains(text(), '다음10페이지')]][1]"
                 ))
             )
-            next_group_btn.click()
-            time.sleep(2)
-            print("  다음 10페이지 그룹으로 이동 완료")
+            before = self.table_snapshot("품목분류사례")
+            with self.throttle(), self.profiler.measure("page_move"):
+                next_group_btn.click()
+                # 결과 목록이 갱신될 때까지 대기
+                self.expect_table_change("품목분류사례", before)
+            self.log("  다음 10페이지 그룹으로 이동 완료", "debug", "page_move")
             return True
         except Exception as e:
-            print(f"  다음 10페이지 버튼 없음 (마지막 그룹): {e}")
+            self.log(f"  다음 10페이지 버튼 없음 (마지막 그룹): {e}", "debug", "page_move")
+            return False
+    
+    def jump_to_page(self, page_num: int) -> bool:
+        """페이지 번호 링크의 페이지 인자만 바꿔 목표 페이지로 바로 이동 (그룹 이동 없이 한 번에)"""
+        if self.get_pagination_state().get("current") == page_num:
+            return True
+        before = self.table_snapshot("품목분류사례")
+        try:
+            with self.throttle(), self.profiler.measure("page_jump"):
+                if not self.driver.execute_script(PAGE_JUMP_JS, page_num):
+                    return False
+                self.expect_table_change("품목분류사례", before)
+        except Exception as e:
+            self.log(f"  페이지 {page_num} 바로 이동 실패: {e}", "debug", "page_jump", page=page_num)
+            return False
+        return self.is_on_page(page_num)
+        
+    def is_on_page(self, page_num: int) -> bool:
+        """현재 목록이 page_num 페이지인지 확인 (현재 페이지 표시가 없으면 확인할 수 없으므로 False)
+        
+        같은 그룹의 다른 페이지도 page_num 링크를 보여 주므로 그룹 링크만으로는 이동했다고 판단하지 않는다.
+        """
+        return self.get_pagination_state().get("current") == page_num
+        
+    def go_to_page_number(self, current_page: int, target_page: int) -> bool:
+        """목표 페이지로 이동 후 도착한 페이지 확인 (바로 이동이 안 되면 10페이지 그룹 단위로 앞으로 이동)"""
+        if target_page == current_page:
+            return True
+        if self.jump_to_page(target_page):
+            self.current_page = target_page
+            return True
+        if target_page < current_page:
+            return False
+        
+        # 목표 페이지가 속한 그룹까지 "다음10페이지" 버튼으로 이동
+        while (current_page - 1) // PAGE_GROUP_SIZE < (target_page - 1) // PAGE_GROUP_SIZE:
+            if not self.go_to_next_page_group():
+                return False
+            current_page = ((current_page - 1) // PAGE_GROUP_SIZE + 1) * PAGE_GROUP_SIZE + 1
+        
+        # 같은 그룹 내에서 페이지 번호 버튼 클릭
+        if current_page != target_page and not self.go_to_page(target_page):
             return False
+        if not self.is_on_page(target_page):
+            return False
+        self.current_page = target_page
+        return True
+    
+    def recycle_driver(self, page_num: int, reason: str):
+        """장시간 실행으로 느려지거나 메모리가 늘어난 브라우저(PDF 변환/이미지 다운로드 포함)를 새로 띄워 page_num 페이지로 복원"""
+        last = self.monitor.last
+        self.log(f"  브라우저 교체 ({reason}): 브라우저 {last['browser_mb']}MB, 파이썬 {last['python_mb']}MB, "
+                 f"사례 {last['cases']}건 처리 후 {page_num} 페이지로 복원합니다.", "warning", "driver_recycle",
+                 page=page_num, reason=reason, **last)
+        self.telemetry.count("driver_recycles", reason=reason)
+        if self.pdf_pool:
+            self.pdf_pool.shutdown()
+            self.pdf_pool = None
+        if self.image_pipeline:
+            self.image_pipeline.close()
+            self.image_pipeline = None
+        gc.collect()
+        with self.profiler.measure("driver_recycle"):
+            self.reopen_browser(page_num)
+        self.monitor.reset()
+        
+    def move_to_page(self, target_page: int):
+        """현재 페이지에서 target_page로 이동 (실패하면 재시도/브라우저 재시작, 끝내 실패하면 TimeoutException)
+        
+        장시간 모드에서는 이동 전에 브라우저 교체가 필요한지 확인하여, 교체하면 새 브라우저에서 target_page로 바로 복원한다.
+        """
+        if self.monitor and self.driver is not None:
+            reason = self.monitor.check(self.driver)
+            if reason:
+                try:
+                    self.recycle_driver(target_page, reason)
+                except Exception as e:
+                    # 아래 이동에서 재시도/브라우저 재시작으로 복구
+                    self.log(f"  브라우저 교체 실패: {type(e).__name__}", "warning", "driver_recycle",
+                             page=target_page, error_type=type(e).__name__)
+                    
+        def move():
+            if not self.go_to_page_number(self.current_page, target_page):
+                raise TimeoutException(f"페이지 {target_page}로 이동하지 못했습니다.")
+                
+        self.run_with_recovery(move, target_page, f"페이지 {target_page} 이동")
+    
+    def open_tab(self) -> str:
+        """새 탭을 열어 현재 검색 조건으로 조회 (결과 1페이지 표시, 새 탭의 창 핸들 반환)"""
+        start_date, end_date = self.search or (date(2016, 1, 1), None)
+        self.driver.switch_to.new_window("tab")
+        if self.browser_profile == "fast":
+            block_resources(self.driver)
+        self.navigate_to_main_page()
+        self.navigate_to_hs_classification()
+        self.set_search_date(start_date.year, start_date.month, start_date.day, end_date)
+        self.click_search()
+        return self.driver.current_window_handle
+    
+    def close_tabs(self):
+        """추가 탭을 모두 닫고 메인 탭으로 돌아감 (다음 sync_tabs가 현재 검색 조건으로 다시 엶)"""
+        if not self.tab_pages:
+            return
+        main_window = self.driver.current_window_handle
+        open_windows = set(self.driver.window_handles)
+        for handle in self.tab_pages:
+            if handle in open_windows and handle != main_window:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(main_window)
+        self.tab_pages = {}
+    
+    def sync_tabs(self, page_num: int) -> list:
+        """추가 탭을 tabs - 1개까지 열고 모두 page_num 페이지로 이동 (이동하지 못한 탭은 닫음, 메인 탭 포함 창 핸들 목록 반환)"""
+        main_window = self.driver.current_window_handle
+        open_windows = set(self.driver.window_handles)
+        self.tab_pages = {handle: page for handle, page in self.tab_pages.items() if handle in open_windows}
+        current_page = self.current_page  # go_to_page_number가 바꾸는 메인 탭 페이지 번호
+        try:
+            with self.profiler.measure("tab_sync"):
+                while len(self.tab_pages) < self.tabs - 1:
+                    self.tab_pages[self.open_tab()] = 1
+                for handle, tab_page in list(self.tab_pages.items()):
+                    if tab_page == page_num:
+                        continue
+                    self.driver.switch_to.window(handle)
+                    if self.go_to_page_number(tab_page, page_num):
+                        self.tab_pages[handle] = page_num
+                    else:
+                        self.driver.close()
+                        del self.tab_pages[handle]
+        finally:
+            self.current_page = current_page
+            self.driver.switch_to.window(main_window)
+        return [main_window] + list(self.tab_pages)
+    
+    def scrape_cases_in_tabs(self, page_num: int, case_count: int, known_cases: KnownCaseIndex = None,
+                             index_offset: int = 0) -> dict:
+        """현재 페이지의 사례를 여러 탭에 나누어 동시에 불러온 뒤 차례로 추출 (목록 위치 → 상세 정보, 이미 수집한 사례는 None)
+
+        WebDriver 명령은 세션당 하나씩 실행되므로 탭마다 사례 클릭을 먼저 보내 두고 상세보기 갱신을 차례로 기다려
+        사이트 응답 대기 시간을 겹치게 한다. 실패한 사례는 결과에 넣지 않으며 호출한 쪽에서 메인 탭으로 다시 처리한다.
+        """
+        results = {}
+        try:
+            handles = self.sync_tabs(page_num)
+        except Exception as e:
+            self.log(f"  탭 준비 실패, 메인 탭에서만 처리: {type(e).__name__}", "warning", "tab_failed", page=page_num,
+                     error_type=type(e).__name__)
+            return results
+        
+        main_window = handles[0]
+        try:
+            for first in range(0, case_count, len(handles)):
+                # 1. 탭마다 사례 클릭 (응답을 기다리지 않음)
+                started = {}  # 목록 위치 → (창 핸들, 클릭 전 상세보기 텍스트, 클릭 시각)
+                for handle, position in zip(handles, range(first, min(first + len(handles), case_count))):
+                    try:
+                        self.driver.switch_to.window(handle)
+                        before = self.table_snapshot("상세보기")
+                        with self.throttle():
+                            self.get_case_list()["links"][position].click()
+                        started[position] = (handle, before, time.perf_counter())
+                    except Exception as e:
+                        self.log(f"  탭에서 {position + 1}번째 사례 클릭 실패: {type(e).__name__}", "debug", "tab_failed",
+                                 page=page_num, error_type=type(e).__name__)
+                
+                # 2. 클릭한 순서대로 상세보기 갱신을 기다려 추출
+                for position, (handle, before, clicked) in started.items():
+                    case_index = index_offset + (page_num - 1) * CASES_PER_PAGE + position + 1
+                    try:
+                        self.driver.switch_to.window(handle)
+                        if not self.wait_for_table_change("상세보기", before):
+                            continue
+                        self.profiler.record("click_case", time.perf_counter() - clicked)
+                        results[position] = self.scrape_case_detail(case_index, known_cases)
+                    except Exception as e:
+                        self.log(f"  사례 {case_index}: 탭에서 추출 실패: {type(e).__name__}", "debug", "tab_failed",
+                                 page=page_num, case_index=case_index, error_type=type(e).__name__)
+        finally:
+            self.driver.switch_to.window(main_window)
+        return results
+    
+    def scrape_current_page(self, page_num: int, known_cases: KnownCaseIndex = None, index_offset: int = 0) -> list:
+        """현재 페이지의 사례를 순차적으로 클릭하며 스크래핑 (known_cases에 있는 사례는 제외)"""
+        page_results = []
+        started = time.perf_counter()
+        
+        # 현재 페이지의 사례 수 확인 (재시도/브라우저 재시작 후에도 읽지 못하면 페이지를 완료로 기록하지 않도록 예외 전달)
+        case_count = self.run_with_recovery(self.get_case_count_on_page, page_num, f"페이지 {page_num} 사례 수")
+        self.log(f"현재 페이지 사례 수: {case_count}", event="page_start", page=page_num, case_count=case_count)
+        
+        # 여러 탭으로 먼저 불러오고, 탭에서 실패한 사례만 아래에서 메인 탭으로 처리
+        prefetched = {}
+        if self.tabs > 1 and case_count > 1:
+            prefetched = self.scrape_cases_in_tabs(page_num, case_count, known_cases, index_offset)
+        
+        for i in range(case_count):
+            # 페이지 위치 기반 인덱스 (병렬 워커 간에도 PDF 파일명이 겹치지 않음)
+            case_index = index_offset + (page_num - 1) * CASES_PER_PAGE + i + 1
+            try:
+                self.log(f"  사례 {case_index}: 상세 정보 추출 중...", "debug", "case_start", case_index=case_index)
+                
+                # 사례 클릭 후 상세 정보 스크래핑 (오류는 재시도, 끝내 실패하면 dead letter로 기록하고 다음 사례로 진행)
+                try:
+                    if i in prefetched:
+                        detail = prefetched[i]
+                    else:
+                        detail = self.run_with_recovery(
+                            lambda: self.scrape_case(i, case_index, known_cases), page_num, f"사례 {case_index}"
+                        )
+                except Exception as e:
+                    attempts = 1 if classify_error(e) == FATAL else self.retry_policy.max_attempts
+                    self.dead_letters.append(page_num, case_index, e, attempts)
+                    self.log(f"  사례 {case_index}: 처리 실패 ({type(e).__name__}), 실패 목록에 기록", "error", "case_failed",
+                             page=page_num, case_index=case_index, error_type=type(e).__name__)
+                    self.telemetry.count("cases_failed", error_class=classify_error(e))
+                    continue
+                    
+                # 즉시 저널과 출력에 기록
+                if detail is None:
+                    self.log(f"  사례 {case_index}: 이미 수집된 사례, 건너뜀", event="case_skipped", case_index=case_index)
+                    self.telemetry.count("cases_skipped")
+                    continue
+                page_results.append(detail)
+                # PDF 변환/이미지 다운로드 중인 사례는 페이지 끝에서 결과를 반영한 뒤 기록
+                pending = self.is_pending(detail)
+                if not pending:
+                    self.record_case(page_num, detail)
+                
+                self.log(f"    제목: {detail.get('title', '')[:30]}...", "debug")
+                self.log(f"    HS코드: {detail.get('hs_code', '')}", "debug")
+                if not pending:
+                    self.log(f"    PDF: {detail.get('pdf_path', '')}", "debug")
+            
+            except Exception as e:
+                self.log(f"    사례 {case_index} 처리 중 오류: {e}", "error", "case_failed", page=page_num, case_index=case_index,
+                         error_type=type(e).__name__)
+                continue
+                
+        # 백그라운드 PDF 변환/이미지 다운로드 결과를 반영하여 기록 (대부분 다른 사례를 처리하는 동안 완료됨)
+        for detail in page_results:
+            if not self.is_pending(detail):
+                continue
+            if detail["index"] in self.pending_pdfs:
+                with self.profiler.measure("pdf_wait"):
+                    self.collect_pdf(detail)
+            if detail["index"] in self.pending_images:
+                with self.profiler.measure("image_wait"):
+                    self.collect_images(detail)
+            self.record_case(page_num, detail)
                 
-    def scrape_all_cases(self, start_year: int = 2016, start_month: int = 1, max_pages: int = None):
-        """모든 품목분류 사례 스크래핑"""
+        self.telemetry.count("pages")
+        self.telemetry.write_metrics()
+        if self.monitor:
+            self.monitor.record_page(time.perf_counter() - started, case_count)
+        return page_results
+    
+    def open_sinks(self, append: bool):
+        """사례 출력 열기 (append=False면 기존 출력을 비우고 시작)"""
+        for sink in self.sinks:
+            sink.open(append)
+            
+    def close_sinks(self):
+        for sink in self.sinks:
+            sink.close()
+            
+    def record_case(self, page_num: int, detail: dict):
+        """사례 한 건을 저널과 모든 출력에 즉시 기록 (병렬 워커에서는 결과를 부모 프로세스로 보내기만 하고 기록하지 않음)"""
+        if not self.recording:
+            return
+        if self.journal:
+            self.journal.append_case(page_num, detail)
+        for sink in self.sinks:
+            sink.write(detail)
+        self.store_record(detail)
+        self.telemetry.count("cases_saved")
+        self.telemetry.event("case_saved", "debug", page=page_num, case_index=detail.get("index"), key=case_key(detail))
+        
+    def store_record(self, detail: dict):
+        """레코드를 내용 해시 저장소에 저장하고 매니페스트에 사례 → 레코드/PDF 해시 기록 (내용이 같으면 쓰지 않음)"""
+        record_sha, _ = self.blob_store.put(record_bytes(detail), ".json")
+        self.manifest.update(case_key(detail), record_sha, pdf_sha(self.blob_store, detail.get("pdf_path", "")))
+            
+    def prepare_output(self, search: dict, resume: bool) -> dict:
+        """크롤링 저널과 출력 준비 (resume이고 검색 조건이 같으면 진행 상황을 복원하고 출력에 이어서 기록)"""
+        if resume:
+            state = self.journal.load_state()
+            if state["search"] == search:
+                self.log(f"저널 복원: 완료 페이지 {len(state['completed_pages'])}개, 사례 {state['case_count']}건 "
+                      f"(마지막 완료 {state['last_group']}그룹 {state['last_page']} 페이지)")
+                self.open_sinks(append=True)
+                return state
+            self.log("저널이 없거나 검색 조건이 달라 처음부터 스크래핑합니다.")
+            
+        self.journal.start(search)
+        self.dead_letters.start()
+        self.open_sinks(append=False)
+        return {"search": search, "completed_pages": set(), "first_unfinished_page": 1}
+        
+    def scrape_all_cases(self, start_year: int = 2016, start_month: int = 1, max_pages: int = None,
+                         resume: bool = False) -> bool:
+        """모든 품목분류 사례 스크래핑 (resume=True면 저널에 완료로 기록되지 않은 페이지만 이어서 진행, 끝까지 완료하면 True)"""
+        state = self.prepare_output({"start_year": start_year, "start_month": start_month}, resume)
         try:
             self.setup_driver()
-            self.navigate_to_main_page()
-            self.navigate_to_hs_classification()
             
-            # 날짜 설정 및 조회
-            self.set_search_date(start_year, start_month)
-            self.click_search()
+            # 메뉴 이동, 날짜 설정 및 조회
+            self.open_search(start_year, start_month)
             
             # 전체 페이지 수 확인
             total_pages = self.get_total_pages()
             if max_pages:
                 total_pages = min(total_pages, max_pages)
-            print(f"총 {total_pages} 페이지 스크래핑 예정")
+            self.log(f"총 {total_pages} 페이지 스크래핑 예정")
             
-            case_index = 0
-            current_page = 1
+            # 이어서 진행: 저널에 완료로 기록된 페이지는 건너뛰고 완료되지 않은 페이지로만 바로 이동
+            # (병렬 실행이 중단된 경우 첫 빈 페이지 뒤에도 완료된 페이지가 많음)
+            pages = [page for page in range(1, total_pages + 1) if page not in state["completed_pages"]]
+            if len(pages) < total_pages:
+                self.log(f"이전 크롤링 이어서 진행: 완료된 {total_pages - len(pages)} 페이지를 건너뛰고 "
+                         f"{len(pages)} 페이지 처리" + (f" ({pages[0]} 페이지부터)" if pages else ""))
             
-            while current_page <= total_pages:
-                print(f"\n--- {current_page}/{total_pages} 페이지 처리 중 ---")
+            for current_page in pages:
+                # 다음 페이지로 이동 (재시도 후에도 실패하면 다른 페이지를 잘못 기록하지 않고 중단)
+                self.move_to_page(current_page)
+                self.log(f"\n--- {current_page}/{total_pages} 페이지 처리 중 ---")
                 
-                # 현재 페이지의 사례 수 확인
-                case_count = self.get_case_count_on_page()
-                print(f"현재 페이지 사례 수: {case_count}")
-                
-                # 각 사례 순차적으로 클릭하며 스크래핑
-                for i in range(case_count):
-                    try:
-                        case_index += 1
-                        
-                        # 사례 클릭
-                        if not self.click_case_by_index(i):
-                            print(f"  사례 {case_index}: 클릭 실패, 건너뜀")
-                            continue
-                            
-                        print(f"  사례 {case_index}: 상세 정보 추출 중...")
-                        
-                        # 상세 정보 스크래핑
-                        detail = self.scrape_case_detail(case_index)
-                        self.results.append(detail)
-                        
-                        print(f"    제목: {detail.get('title', '')[:30]}...")
-                        print(f"    HS코드: {detail.get('hs_code', '')}")
-                        print(f"    PDF: {detail.get('pdf_path', '')}")
-                        
-                    except Exception as e:
-                        print(f"    사례 {case_index} 처리 중 오류: {e}")
-                        continue
+                # 현재 페이지의 사례를 순차적으로 클릭하며 스크래핑 (사례마다 저널에 기록됨)
+                page_results = self.scrape_current_page(current_page)
+                case_count = len(page_results)
+                self.journal.mark_page_done(current_page, case_count, PAGE_GROUP_SIZE)
                 
                 # 현재 페이지에서 다운로드 완료
-                print(f"  페이지 {current_page} 처리 완료 ({case_count}건)")
+                self.log(f"  페이지 {current_page} 처리 완료 ({case_count}건)")
+            
+            crawl_complete = True
+                    
+        except Exception as e:
+            crawl_complete = False
+            self.log(f"스크래핑 중 오류 발생: {e}", "error", "crawl_failed", error_type=type(e).__name__)
+            
+        finally:
+            # 진행 상황과 사례는 이미 저널/출력에 기록되어 있으므로 JSON/CSV는 종료 시 한 번만 생성
+            self.journal.close()
+            self.save_results()
+            self.close_driver()
+            self.profiler.print_summary()
+            self.print_dead_letters()
+            self.telemetry.close()
+            
+        # 끝까지 완료한 크롤링만 증분 크롤링 기준으로 등록
+        if crawl_complete:
+            self.update_known_cases()
+        return crawl_complete
+    
+    def scrape_all_cases_parallel(self, start_year: int = 2016, start_month: int = 1, max_pages: int = None,
+                                  num_workers: int = 4, pages_per_task: int = PAGE_GROUP_SIZE,
+                                  resume: bool = False) -> bool:
+        """여러 브라우저 프로세스로 페이지 범위를 나누어 병렬 스크래핑 (모든 페이지를 처리하면 True)"""
+        state = self.prepare_output({"start_year": start_year, "start_month": start_month}, resume)
+        
+        # 탐색용 세션으로 전체 페이지 수 확인
+        try:
+            self.setup_driver()
+            self.open_search(start_year, start_month)
+            total_pages = self.get_total_pages()
+        finally:
+            self.close_driver()
+        
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        
+        # 전체 페이지를 pages_per_task 단위 범위로 나누어 공유 큐에 넣고, 각 워커가 하나씩 가져가 처리
+        # (기본값 10페이지는 페이지 그룹과 맞춰져 있어 워커가 그룹 이동만으로 범위 시작점에 도달)
+        # 이어서 진행하는 경우 저널에 완료로 기록된 페이지는 제외
+        search_start = date(start_year, start_month, 1).isoformat()
+        tasks = []
+        for first in range(1, total_pages + 1, pages_per_task):
+            pages = [
+                page_num for page_num in range(first, min(first + pages_per_task, total_pages + 1))
+                if page_num not in state["completed_pages"]
+            ]
+            if pages:
+                tasks.append({"start": search_start, "end": None, "first_page": 1, "pages": pages})
+        
+        self.log(f"총 {total_pages} 페이지를 {len(tasks)}개 범위로 나누어 {min(num_workers, len(tasks))}개 워커로 스크래핑 예정")
+        return self.run_parallel_tasks(tasks, num_workers)
+        
+    def run_parallel_tasks(self, tasks: list, num_workers: int, verified: bool = True) -> bool:
+        """작업({start, end, first_page, pages})을 여러 브라우저 프로세스에 나누어 처리하고 결과를 기록
+        
+        pages는 해당 검색 조건 안의 페이지 번호이며, 저널에는 first_page + pages - 1로 기록된다.
+        모든 페이지가 처리되었고 verified(구간별 사례 수 확인 결과)면 True (증분 크롤링 기준 등록까지 수행)
+        """
+        ctx = multiprocessing.get_context("spawn")
+        task_queue = ctx.Queue()
+        result_queue = ctx.Queue()
+        for task in tasks:
+            task_queue.put(task)
+        
+        num_workers = max(1, min(num_workers, len(tasks)))
+        for _ in range(num_workers):
+            task_queue.put(None)  # 워커 종료 신호
+        
+        workers = [
+            ctx.Process(
+                target=_parallel_worker,
+                args=(worker_id, self.worker_options(), task_queue, result_queue),
+                daemon=True
+            )
+            for worker_id in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        finished = 0
+        pages_done = 0
+        case_count = 0
+        crawl_complete = False
+        try:
+            while finished < len(workers):
+                try:
+                    message = result_queue.get(timeout=10)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        self.log("모든 워커가 종료되었습니다.", "warning")
+                        break
+                    continue
+                
+                if message[0] == "page":
+                    _, worker_id, page_num, page_results = message
+                    # 결과 목록이 크롤링 중에 밀려 같은 사례가 두 페이지에 나타나는 경우는 save_results에서 중복 제거
+                    for detail in page_results:
+                        self.record_case(page_num, detail)
+                    self.journal.mark_page_done(page_num, len(page_results), PAGE_GROUP_SIZE)
+                    pages_done += 1
+                    case_count += len(page_results)
+                    self.log(f"[워커 {worker_id}] 페이지 {page_num} 완료 ({len(page_results)}건, 누적 {case_count}건)",
+                             event="page_done", worker=worker_id, page=page_num, cases=len(page_results))
+                elif message[0] == "profile":
+                    # 워커의 단계별 소요 시간/카운터 병합
+                    self.profiler.merge(message[2])
+                    self.telemetry.merge_counters(message[3])
+                elif message[0] == "done":
+                    finished += 1
+            
+            crawl_complete = verified and pages_done == sum(len(task["pages"]) for task in tasks)
+        
+        finally:
+            for worker in workers:
+                worker.join(timeout=30)
+            self.journal.close()
+            self.save_results()
+            self.profiler.print_summary()
+            self.print_dead_letters()
+            self.telemetry.close()
+            
+        # 모든 페이지가 처리된 경우에만 증분 크롤링 기준으로 등록
+        if crawl_complete:
+            self.update_known_cases()
+        return crawl_complete
+        
+    def count_cases(self, start_date: date, end_date: date) -> tuple:
+        """기간을 조회하여 (사례 수 또는 None, 페이지 수) 반환"""
+        self.ensure_search(start_date, end_date)
+        count = self.get_total_count()
+        pages = (count + CASES_PER_PAGE - 1) // CASES_PER_PAGE if count is not None else self.get_total_pages()
+        return count, pages
+        
+    def plan_date_shards(self, start_date: date, end_date: date, max_shard_pages: int) -> ShardPlan:
+        """기간을 월 단위로 나누고, max_shard_pages보다 페이지가 많은 구간은 절반씩 다시 나눈 계획 작성
+        
+        전체 기간의 사례 수도 조회하여 구간별 사례 수의 합과 같은지 확인한다.
+        """
+        plan = ShardPlan(self.output_dir)
+        plan.total_count, _ = self.count_cases(start_date, end_date)
+        
+        pending = month_shards(start_date, end_date)
+        while pending:
+            shard_start, shard_end = pending.pop(0)
+            count, pages = self.count_cases(shard_start, shard_end)
+            if pages > max_shard_pages and shard_start < shard_end:
+                pending[:0] = split_shard(shard_start, shard_end)
+                continue
+            plan.add(shard_start, shard_end, count or 0, pages)
+            self.log(f"  구간 {shard_start} ~ {shard_end}: {count if count is not None else '?'}건, {pages} 페이지",
+                     "debug", "shard_planned", start=shard_start.isoformat(), end=shard_end.isoformat(),
+                     count=count, pages=pages)
+        
+        if plan.verified():
+            self.log(f"구간 {len(plan.shards)}개, 사례 수 합계 {plan.shard_count_sum}건 = 전체 기간 조회 결과 일치",
+                     event="shard_verify", shards=len(plan.shards), total=plan.total_count, ok=True)
+        else:
+            self.log(f"구간별 사례 수 합계({plan.shard_count_sum}건)가 전체 기간 조회 결과({plan.total_count}건)와 다릅니다.",
+                     "warning", "shard_verify", shards=len(plan.shards), total=plan.total_count,
+                     shard_sum=plan.shard_count_sum, ok=False)
+            self.telemetry.count("shard_count_mismatch")
+        return plan
+        
+    def scrape_date_range(self, start_date, end_date=None, max_shard_pages: int = 5, num_workers: int = 1,
+                          resume: bool = False, max_pages: int = None):
+        """시행일자 기간(시작일~종료일, 날짜 포함)을 작은 구간으로 나누어 스크래핑
+        
+        깊은 페이지 이동 없이 구간마다 몇 페이지만 처리하며, num_workers가 2 이상이면 구간을 병렬로 처리한다.
+        구간 계획은 shard_plan.json에 저장되어 resume=True면 같은 계획과 페이지 번호로 이어서 진행한다.
+        max_pages가 있으면 구간을 이어 붙인 전체 페이지 번호 기준으로 앞의 max_pages 페이지만 처리한다 (테스트용).
+        """
+        start_date = parse_date(start_date)
+        end_date = parse_date(end_date) or date.today()
+        search = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "max_shard_pages": max_shard_pages}
+        state = self.prepare_output(search, resume)
+        
+        plan = ShardPlan(self.output_dir)
+        tasks = []
+        parallel = False
+        verified = False
+        crawl_complete = False
+        try:
+            if not (resume and plan.load(search)):
+                self.setup_driver()
+                plan = self.plan_date_shards(start_date, end_date, max_shard_pages)
+                plan.search = search
+                plan.save()
+            self.log(f"{start_date} ~ {end_date}: 구간 {len(plan.shards)}개, 총 {plan.total_pages} 페이지 스크래핑 예정")
+            
+            # 구간별 사례 수 합계가 전체 기간과 다르면 (날짜가 잘못 설정된 구간 등) 스크래핑은 하되 완료로 보고하지 않음
+            verified = plan.verified()
+            if not verified:
+                self.log("구간별 사례 수 합계가 확인되지 않아 이번 크롤링은 완료로 기록하지 않습니다.", "warning", "shard_verify",
+                         total=plan.total_count, shard_sum=plan.shard_count_sum, ok=False)
+            
+            # 구간별로 완료되지 않은 페이지 (구간 안의 페이지 번호)
+            last_page = min(plan.total_pages, max_pages) if max_pages else plan.total_pages
+            for shard in plan.shards:
+                pages = [
+                    page for page in range(1, shard["pages"] + 1)
+                    if shard["first_page"] + page - 1 not in state["completed_pages"]
+                    and shard["first_page"] + page - 1 <= last_page
+                ]
+                if pages:
+                    tasks.append({"start": shard["start"], "end": shard["end"], "first_page": shard["first_page"],
+                                  "pages": pages})
+            
+            if num_workers > 1:
+                # 계획을 세운 브라우저는 닫고 워커들이 구간을 나누어 처리
+                parallel = True
+            else:
+                if self.driver is None:
+                    self.setup_driver()
+                for task in tasks:
+                    self.log(f"\n--- 구간 {task['start']} ~ {task['end']} ({len(task['pages'])} 페이지) ---")
+                    self.scrape_task(task, self.journal)
+                crawl_complete = verified
+            
+        except Exception as e:
+            parallel = False
+            self.log(f"구간 스크래핑 중 오류 발생: {e}", "error", "crawl_failed", error_type=type(e).__name__)
+            
+        finally:
+            if parallel:
+                self.close_driver()
+            else:
+                self.journal.close()
+                self.save_results()
+                self.close_driver()
+                self.profiler.print_summary()
+                self.print_dead_letters()
+                self.telemetry.close()
+                
+        if parallel:
+            return self.run_parallel_tasks(tasks, num_workers, verified)
+        if crawl_complete:
+            self.update_known_cases()
+        return crawl_complete
+        
+    def scrape_task(self, task: dict, journal: CrawlJournal = None, on_page=None):
+        """작업 하나({start, end, first_page, pages}) 처리: 기간 조회 후 페이지마다 이동/스크래핑
+        
+        journal이 있으면 전체 페이지 번호로 완료를 기록하고, on_page(전체 페이지 번호, 결과)가 있으면 호출한다.
+        """
+        self.ensure_search(parse_date(task["start"]), parse_date(task["end"]))
+        index_offset = (task["first_page"] - 1) * CASES_PER_PAGE
+        for page in task["pages"]:
+            global_page = task["first_page"] + page - 1
+            self.move_to_page(page)
+            page_results = self.scrape_current_page(page, index_offset=index_offset)
+            if journal:
+                journal.mark_page_done(global_page, len(page_results), PAGE_GROUP_SIZE)
+            if on_page:
+                on_page(global_page, page_results)
+            self.log(f"  페이지 {global_page} 처리 완료 ({len(page_results)}건)", event="page_done",
+                     page=global_page, cases=len(page_results))
+        
+    def worker_options(self) -> dict:
+        """병렬 워커에서 같은 설정의 스크래퍼를 만들기 위한 생성자 인자"""
+        return {
+            "output_dir": str(self.output_dir),
+            "base_url": self.base_url,
+            "pdf_workers": self.pdf_workers,
+            "image_workers": self.image_workers,
+            "max_attempts": self.retry_policy.max_attempts,
+            "browser_profile": self.browser_profile,
+            "verbosity": self.verbosity,
+            "rate_limit": self.rate_limiter.enabled,
+            "tabs": self.tabs,
+            "long_run": self.monitor is not None,
+        }
+        
+    def update_known_cases(self):
+        """수집한 사례를 증분 크롤링 인덱스에 등록"""
+        known_cases = KnownCaseIndex(self.output_dir).load()
+        known_cases.add(iter_jsonl(self.cases_path))
+        known_cases.save()
+        self.log(f"증분 크롤링 인덱스 갱신: {len(known_cases)}건, 최근 시행일자 {known_cases.high_water_mark or '-'}")
+        
+    def scrape_new_cases(self, max_pages: int = None) -> tuple:
+        """증분 크롤링: 마지막 크롤링의 시행일자 최고 기록부터 검색하여 새 사례만 수집
+        
+        (수집한 사례 수, 끝까지 완료했는지 여부) 반환
+        """
+        known_cases = KnownCaseIndex(self.output_dir).load()
+        
+        # JSONL 도입 이전의 결과만 있으면 JSON에서 JSONL 원본 생성
+        json_path = self.output_dir / "hs_classification_cases.json"
+        if not self.cases_path.exists() and json_path.exists():
+            seed_jsonl_from_json(json_path, self.cases_path)
+            
+        # 인덱스가 없으면 기존 결과로 초기화
+        if not known_cases.keys:
+            known_cases.add(iter_jsonl(self.cases_path))
+            
+        search_start = known_cases.search_start()
+        if search_start is None:
+            self.log("이전 크롤링 기록이 없어 전체 크롤링을 수행합니다.")
+            crawl_complete = self.scrape_all_cases(max_pages=max_pages)
+            return sum(1 for _ in iter_jsonl(self.cases_path)), crawl_complete
+            
+        # 새 사례의 인덱스는 기존 사례 뒤에서부터 (기존 PDF 파일명과 겹치지 않도록)
+        index_offset = max((detail.get("index") or 0 for detail in iter_jsonl(self.cases_path)), default=0)
+        self.log(f"증분 크롤링: {search_start} 이후 시행 사례 검색 (기존 {len(known_cases)}건)")
+        
+        # 새 사례는 기존 출력 뒤에 이어서 기록 (저널은 사용하지 않음)
+        journal, self.journal = self.journal, None
+        self.open_sinks(append=True)
+        new_count = 0
+        crawl_complete = False
+        try:
+            self.setup_driver()
+            self.open_search(search_start.year, search_start.month, search_start.day)
+            
+            total_pages = self.get_total_pages()
+            if max_pages:
+                total_pages = min(total_pages, max_pages)
                 
-                # 다음 페이지로 이동
+            current_page = 1
+            while current_page <= total_pages:
+                self.log(f"\n--- {current_page}/{total_pages} 페이지 처리 중 ---")
+                page_results = self.scrape_current_page(current_page, known_cases, index_offset)
+                new_count += len(page_results)
+                
+                # 결과는 최신순이므로 새 사례가 하나도 없는 페이지에 도달하면 중단
+                if not page_results:
+                    self.log("  이미 수집된 사례에 도달하여 페이지 이동을 중단합니다.")
+                    break
+                    
                 current_page += 1
                 if current_page <= total_pages:
-                    # 10페이지마다 "다음10페이지" 버튼 클릭 (10 -> 11, 20 -> 21, 30 -> 31, ...)
-                    if (current_page - 1) % 10 == 0:
-                        # 다음 10페이지 그룹으로 이동
-                        print(f"\n  === 다음 10페이지 그룹으로 이동 (페이지 {current_page}~) ===")
-                        if not self.go_to_next_page_group():
-                            print("  다음 페이지 그룹이 없습니다. 스크래핑 종료.")
-                            break
-                    else:
-                        # 같은 그룹 내에서 페이지 번호 버튼 클릭
-                        if not self.go_to_page(current_page):
-                            print(f"  페이지 {current_page} 이동 실패, 건너뜀")
-                        
-                # 중간 저장 (10페이지마다)
-                if current_page % 10 == 1 and current_page > 1:
-                    self.save_results()
-                    print(f"중간 저장 완료 ({len(self.results)}건)")
-                    
+                    self.move_to_page(current_page)
+            crawl_complete = True
+            
         except Exception as e:
-            print(f"스크래핑 중 오류 발생: {e}")
+            self.log(f"증분 크롤링 중 오류 발생: {e}", "error", "crawl_failed", error_type=type(e).__name__)
             
         finally:
-            self.save_results()
             self.close_driver()
+            self.journal = journal
+            
+        self.save_results()
+        if crawl_complete:
+            self.update_known_cases()
+        self.log(f"새 사례 {new_count}건 수집")
+        self.profiler.print_summary()
+        self.telemetry.close()
+        return new_count, crawl_complete
+        
+    def lookup_case(self, effective_date, case_number: str = None, position: int = None) -> dict:
+        """시행일자 하루를 조회하여 사례 한 건의 상세 정보 반환 (PDF 저장/출력 기록 없음, 찾지 못하면 None)
+        
+        case_number가 있으면 문서번호가 같은 사례를, 없으면 결과 목록의 position번째(0부터, 기본값 0) 사례를 찾는다.
+        """
+        effective_date = parse_date(effective_date)
+        self.setup_driver()
+        self.ensure_search(effective_date, effective_date)
+        if case_number is None:
+            # 목록 위치로 찾으면 해당 페이지만 확인
+            page_num, i = divmod(position or 0, CASES_PER_PAGE)
+            if page_num + 1 > self.get_total_pages():
+                return None
+            self.move_to_page(page_num + 1)
+            if not self.click_case_by_index(i):
+                return None
+            return self.extract_case_detail(page_num * CASES_PER_PAGE + i + 1)
+        
+        for page_num in range(1, self.get_total_pages() + 1):
+            self.move_to_page(page_num)
+            for i in range(self.get_case_count_on_page()):
+                if not self.click_case_by_index(i):
+                    break
+                detail = self.extract_case_detail((page_num - 1) * CASES_PER_PAGE + i + 1)
+                if detail["case_number"].strip() == case_number.strip():
+                    return detail
+        return None
+        
+    def print_dead_letters(self):
+        """재시도 후에도 실패한 사례 요약 출력"""
+        records = self.dead_letters.records()
+        if records:
+            self.log(f"\n실패한 사례 {len(records)}건 (페이지 {sorted({r['page'] for r in records})}): {self.dead_letters.path}")
             
     def save_results(self):
-        """결과 저장"""
-        if not self.results:
-            print("저장할 데이터가 없습니다.")
+        """결과 저장 (출력을 닫고 JSONL 원본을 중복 제거하여 기존 형식의 JSON/CSV로 변환)"""
+        self.close_sinks()
+        if not self.cases_path.exists() or self.cases_path.stat().st_size == 0:
+            self.log("저장할 데이터가 없습니다.")
             return
             
-        # JSON 저장
         json_path = self.output_dir / "hs_classification_cases.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
-        print(f"JSON 저장 완료: {json_path}")
-        
-        # CSV 저장 (PDF 경로 포함)
-        csv_data = []
-        for result in self.results:
-            row = {
-                "index": result.get("index"),
-                "title": result.get("title"),
-                "hs_code": result.get("hs_code"),
-                "description": result.get("description"),
-                "classification_reason": result.get("classification_reason"),
-                "pdf_path": result.get("pdf_path", ""),
-                "images": "; ".join([img.get("local_path", "") for img in result.get("images", [])]),
-                "scraped_at": result.get("scraped_at")
-            }
-            csv_data.append(row)
-            
-        df = pd.DataFrame(csv_data)
         csv_path = self.output_dir / "hs_classification_cases.csv"
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-        print(f"CSV 저장 완료: {csv_path}")
+        count = compact_jsonl(self.cases_path, json_path, csv_path)
+        self.log(f"JSON 저장 완료: {json_path}")
+        self.log(f"CSV 저장 완료: {csv_path}")
+        
+        self.log(f"\n총 {count}건의 품목분류 사례 저장 완료")
+        self.log(f"PDF 파일 저장 위치: {self.blob_store.root} (매니페스트: {self.manifest.path})")
+        self.log(f"이미지 저장 위치: {self.images_dir}")
+
+
+def _parallel_worker(worker_id: int, scraper_options: dict, task_queue, result_queue):
+    """병렬 스크래핑 워커: 독립된 브라우저 세션으로 공유 큐의 작업(검색 기간 + 페이지 목록)을 처리"""
+    scraper = UnipassHSScraper(**scraper_options)
+    scraper.journal = None  # 저널과 출력, 내용 해시 저장소/매니페스트, cases_saved 카운터는 부모 프로세스가 기록
+    scraper.sinks = []
+    scraper.recording = False
+    scraper.telemetry.worker = worker_id  # 추적은 같은 파일에 워커 번호와 함께 기록, 지표는 부모 프로세스가 기록
+    scraper.telemetry.metrics_path = None
+    
+    def send_page(page_num: int, page_results: list):
+        result_queue.put(("page", worker_id, page_num, page_results))
+    
+    try:
+        scraper.setup_driver()
+        
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+                
+            first, last = task["first_page"] + task["pages"][0] - 1, task["first_page"] + task["pages"][-1] - 1
+            scraper.log(f"[워커 {worker_id}] 페이지 {first}~{last} 처리 시작", event="worker_task",
+                        first_page=first, last_page=last, start=task["start"], end=task["end"])
+            
+            # 페이지 하나씩 작업으로 나누어 이동 실패한 페이지만 건너뜀
+            # (완료로 기록되지 않은 페이지는 이어서 진행(resume) 시 다시 처리됨)
+            for page in task["pages"]:
+                try:
+                    scraper.scrape_task(dict(task, pages=[page]), on_page=send_page)
+                except Exception as e:
+                    page_num = task["first_page"] + page - 1
+                    scraper.log(f"[워커 {worker_id}] 페이지 {page_num} 이동 실패, 건너뜀: {type(e).__name__}", "error",
+                                "page_failed", page=page_num, error_type=type(e).__name__)
+                
+    except Exception as e:
+        scraper.log(f"[워커 {worker_id}] 스크래핑 중 오류 발생: {e}", "error", "crawl_failed", error_type=type(e).__name__)
         
-        print(f"\n총 {len(self.results)}건의 품목분류 사례 저장 완료")
-        print(f"PDF 파일 저장 위치: {self.pdf_dir}")
+    finally:
+        scraper.close_driver()
+        scraper.telemetry.close()
+        result_queue.put(("profile", worker_id, dict(scraper.profiler.timings), scraper.telemetry.counter_items()))
+        result_queue.put(("done", worker_id))
 
 
 def main():
@@ -573,14 +1766,43 @@ def main():
     print("관세청 UNIPASS 품목분류 국내사례 스크래퍼")
     print("=" * 60)
     
-    scraper = UnipassHSScraper(output_dir="scraped_data")
+    pdf_workers = 0  # 1 이상이면 PDF 변환/저장을 백그라운드 헤드리스 브라우저에서 처리
+    browser_profile = "default"  # "fast"면 헤드리스 + 이미지/폰트/분석 스크립트 차단
+    verbosity = "info"  # 콘솔 로그 수준 (error/warning/info/debug, 추적 파일에는 debug까지 기록)
+    tabs = 1  # 2 이상이면 한 브라우저에 탭을 더 열어 한 페이지의 사례를 동시에 불러옴
+    long_run = False  # True면 메모리/처리 시간을 보고 페이지 경계에서 브라우저를 주기적으로 새로 띄움 (며칠 걸리는 크롤링용)
+    scraper = UnipassHSScraper(output_dir="scraped_data", pdf_workers=pdf_workers, browser_profile=browser_profile,
+                               verbosity=verbosity, tabs=tabs, long_run=long_run)
+    num_workers = 1  # 2 이상이면 여러 브라우저로 병렬 스크래핑
+    resume = False  # True면 크롤링 저널에서 완료되지 않은 페이지부터 이어서 진행
+    incremental = False  # True면 마지막 크롤링 이후의 새 사례만 수집
+    sharded = False  # True면 시행일자 기간을 월 단위 구간으로 나누어 구간마다 몇 페이지씩만 스크래핑
     
     # 2016년 1월부터 조회 시작, 테스트용으로 max_pages 설정 가능
-    scraper.scrape_all_cases(
-        start_year=2016, 
-        start_month=1,
-        max_pages=None  # 전체 페이지 스크래핑 (테스트시 숫자로 제한 가능)
-    )
+    if incremental:
+        scraper.scrape_new_cases()
+    elif sharded:
+        scraper.scrape_date_range(
+            start_date="2016-01-01",
+            end_date=None,  # 오늘까지
+            num_workers=num_workers,
+            resume=resume
+        )
+    elif num_workers > 1:
+        scraper.scrape_all_cases_parallel(
+            start_year=2016,
+            start_month=1,
+            max_pages=None,
+            num_workers=num_workers,
+            resume=resume
+        )
+    else:
+        scraper.scrape_all_cases(
+            start_year=2016, 
+            start_month=1,
+            max_pages=None,  # 전체 페이지 스크래핑 (테스트시 숫자로 제한 가능)
+            resume=resume
+        )
     
     print("\n스크래핑 완료!")
     print(f"결과 저장 위치: {scraper.output_dir}")
@@ -0,0 +1,346 @@
+import json
+import time
+import zlib
+import struct
+import argparse
+import threading
+from datetime import date, timedelta
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+# 오프라인 테스트용 UNIPASS 품목분류 국내사례 목록/상세 XHR 엔드포인트
+LIST_PATH = "/clip/mock/selectClsfCaseList.do"
+DETAIL_PATH = "/clip/mock/selectClsfCaseDetail.do"
+PRINT_PATH = "/clip/mock/printClsfCase.do"
+IMAGE_PATH = "/clip/mock/image/"
+SESSION_COOKIE = "JSESSIONID"
+IMAGE_COUNT = 7  # 사례들이 돌려 쓰는 제품 사진 수 (이미지 중복 제거 확인용)
+
+# 상세 응답(JSON) 키 → 사례 레코드 필드
+FIELD_MAP = {
+    "case_number": "caseSn",
+    "title": "prnm",
+    "hs_code": "hsSgn",
+    "description": "prdtDesc",
+    "classification_reason": "clsfRsn",
+    "effective_date": "efctDt",
+}
+
+
+def build_corpus(size: int = 200, newest: date = date(2025, 12, 31)) -> list:
+    """결정론적인 가짜 품목분류 사례 목록 생성 (시행일자 내림차순)"""
+    corpus = []
+    for n in range(size):
+        heading = 8400 + (n * 7) % 150
+        corpus.append({
+            "caseSn": f"CLSF-{n + 1:06d}",
+            "prnm": f"시험용 품목 {n + 1}호 (모델 T-{n % 97:02d})",
+            "hsSgn": f"{heading:04d}.{(n * 13) % 90 + 10:02d}-{(n * 31) % 9000 + 1000:04d}",
+            "prdtDesc": f"시험용 품목 {n + 1}호의 해설. 재질과 용도가 기재된 설명문 {n % 11}번.",
+            "clsfRsn": f"관세율표 해석에 관한 통칙 제1호 및 제6호에 따라 제{heading}호에 분류함.",
+            "efctDt": (newest - timedelta(days=n)).isoformat(),
+            "imgPath": f"{IMAGE_PATH}{n % IMAGE_COUNT}.png",
+        })
+    return corpus
+
+
+def solid_png(number: int, size: int = 64) -> bytes:
+    """번호별 단색 PNG 이미지"""
+    color = bytes(((number * 73) % 256, (number * 151) % 256, (number * 199) % 256))
+    raw = b"".join(b"\x00" + color * size for _ in range(size))
+    
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+# 브라우저용 검색 화면 (세계HS 메뉴 → 품목분류 국내사례 → 달력 → 조회 → 목록/페이지네이션 → 상세보기/인쇄)
+# 실제 사이트와 같은 XPath(h2 제목, ul.pages, 다음10페이지, 인쇄 버튼 등)로 찾을 수 있는 구조이며 목록/상세는 XHR로 불러온다.
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="UTF-8"><title>UNIPASS mock</title>
+<style>.hidden { display: none; } .day { display: inline-block; width: 24px; cursor: pointer; }</style>
+</head><body>
+<h1>UNIPASS mock</h1>
+<nav>
+  <span onclick="document.getElementById('LEFTMENU_LNK_M_ULS0807030051').className = '';">세계HS</span>
+  <a id="LEFTMENU_LNK_M_ULS0807030051" class="hidden" href="#702010100000" onclick="openSearch();">품목분류 국내사례</a>
+</nav>
+<section id="search" class="hidden">
+  <label>시작일자 <input id="startDate" readonly></label>
+  <a href="#" class="btn_calendar" onclick="openCalendar('start'); return false;">달력</a>
+  <div id="calendar_start" class="hidden">
+    <select name="selectYear" title="시작일자 연도" onchange="renderDays('start');"></select>
+    <select name="selectMonth" title="시작일자 월" onchange="renderDays('start');"></select>
+    <div id="days_start"></div>
+    <button type="button" name="dateSelectBtn" onclick="confirmDate('start');">확인</button>
+  </div>
+  <label>종료일자 <input id="endDate" readonly></label>
+  <a href="#" class="btn_calendar" onclick="openCalendar('end'); return false;">달력</a>
+  <div id="calendar_end" class="hidden">
+    <select name="selectYear" title="종료일자 연도" onchange="renderDays('end');"></select>
+    <select name="selectMonth" title="종료일자 월" onchange="renderDays('end');"></select>
+    <div id="days_end"></div>
+    <button type="button" name="dateSelectBtn" onclick="confirmDate('end');">확인</button>
+  </div>
+  <button type="submit" title="조회" onclick="loadPage(1); return false;">조회</button>
+  <h2>품목분류사례</h2>
+  <table><thead><tr><th>번호</th><th>품명</th><th>HS부호</th><th>시행일자</th></tr></thead><tbody id="list"></tbody></table>
+  <p id="total"></p>
+  <div class="paging" id="paging"></div>
+  <h2>상세보기</h2>
+  <div id="detail"></div>
+</section>
+<script>
+var LIST_PATH = "__LIST_PATH__", DETAIL_PATH = "__DETAIL_PATH__", PRINT_PATH = "__PRINT_PATH__";
+var state = {startDate: "", endDate: "", day: {start: 1, end: 1}};
+
+function post(path, params, done) {
+  var req = new XMLHttpRequest();
+  req.open("POST", path);
+  req.setRequestHeader("Content-Type", "application/x-www-form-urlencoded");
+  req.onload = function () { done(JSON.parse(req.responseText)); };
+  req.send(Object.keys(params).map(function (key) {
+    return encodeURIComponent(key) + "=" + encodeURIComponent(params[key]);
+  }).join("&"));
+}
+function esc(text) {
+  var div = document.createElement("div");
+  div.textContent = text;
+  return div.innerHTML;
+}
+function pad(n) { return (n < 10 ? "0" : "") + n; }
+function openSearch() { document.getElementById("search").className = ""; }
+function calendarSelect(which, name) { return document.querySelector("#calendar_" + which + " select[name=" + name + "]"); }
+function openCalendar(which) {
+  var year = calendarSelect(which, "selectYear"), month = calendarSelect(which, "selectMonth");
+  if (!year.options.length) {
+    for (var y = 2026; y >= 2000; y--) { year.add(new Option(y, y)); }
+    for (var m = 1; m <= 12; m++) { month.add(new Option(m + "월", m)); }
+  }
+  document.getElementById("calendar_" + which).className = "";
+  renderDays(which);
+}
+function renderDays(which) {
+  // 년/월을 바꾸면 날짜 칸을 새로 그림 (실제 달력처럼 이전 요소는 stale 상태가 됨)
+  var days = document.getElementById("days_" + which);
+  var year = parseInt(calendarSelect(which, "selectYear").value, 10), month = parseInt(calendarSelect(which, "selectMonth").value, 10);
+  days.innerHTML = "";
+  for (var d = 1; d <= new Date(year, month, 0).getDate(); d++) {
+    var cell = document.createElement("div");
+    cell.className = "day toMonth";
+    cell.textContent = d;
+    cell.onclick = (function (day) { return function () { state.day[which] = day; }; })(d);
+    days.appendChild(cell);
+  }
+}
+function confirmDate(which) {
+  var year = calendarSelect(which, "selectYear").value;
+  var month = calendarSelect(which, "selectMonth").value;
+  var value = year + "-" + pad(parseInt(month, 10)) + "-" + pad(state.day[which]);
+  state[which + "Date"] = value;
+  document.getElementById(which + "Date").value = value;
+  document.getElementById("calendar_" + which).className = "hidden";
+}
+function loadPage(page) {
+  post(LIST_PATH, {pageIndex: page, recordCountPerPage: 10, startDate: state.startDate, endDate: state.endDate}, function (data) {
+    var html = "";
+    data.resultList.forEach(function (row, i) {
+      html += "<tr><td>" + ((page - 1) * 10 + i + 1) + "</td><td><a href=\\"#\\" onclick=\\"showDetail('" + row.caseSn +
+        "'); return false;\\">" + esc(row.prnm) + "</a></td><td>" + esc(row.hsSgn) + "</td><td>" + row.efctDt + "</td></tr>";
+    });
+    document.getElementById("list").innerHTML = html;
+    document.getElementById("total").textContent = "총 " + data.totalCount + "건";
+    renderPaging(page, Math.ceil(data.totalCount / 10));
+  });
+}
+function renderPaging(page, totalPages) {
+  var first = Math.floor((page - 1) / 10) * 10 + 1, last = Math.min(first + 9, totalPages);
+  var html = "<ul class=\\"pages\\">";
+  for (var p = first; p <= last; p++) {
+    html += p === page ? "<li class=\\"on\\"><a href=\\"#" + p + "\\" title=\\"현재 페이지\\">" + p + "</a></li>"
+      : "<li><a href=\\"#" + p + "\\" onclick=\\"loadPage(" + p + "); return false;\\">" + p + "</a></li>";
+  }
+  html += "</ul>";
+  if (last < totalPages) {
+    html += "<a href=\\"#" + (last + 1) + "\\" onclick=\\"loadPage(" + (last + 1) + "); return false;\\"><span>다음10페이지</span></a>";
+  }
+  if (totalPages > 1) {
+    html += "<a href=\\"#" + totalPages + "\\" onclick=\\"loadPage(" + totalPages + "); return false;\\"><span>마지막페이지</span></a>";
+  }
+  document.getElementById("paging").innerHTML = html;
+}
+function showDetail(caseSn) {
+  post(DETAIL_PATH, {caseSn: caseSn}, function (data) {
+    var c = data.result;
+    var rows = [["문서번호", c.caseSn], ["품명", c.prnm], ["HS부호", c.hsSgn], ["품목해설", c.prdtDesc],
+                ["분류사유", c.clsfRsn], ["시행일자", c.efctDt]];
+    var html = "<table>" + rows.map(function (r) { return "<tr><th>" + r[0] + "</th><td>" + esc(r[1]) + "</td></tr>"; }).join("") +
+      "<tr><th>사진</th><td><img src=\\"" + c.imgPath + "\\" alt=\\"" + esc(c.prnm) + "\\"></td></tr></table>" +
+      "<button type=\\"button\\" title=\\"인쇄\\" onclick=\\"window.open('" + PRINT_PATH + "?caseSn=" + c.caseSn +
+      "', 'print', 'width=800,height=1000');\\">인쇄</button>";
+    document.getElementById("detail").innerHTML = html;
+  });
+}
+if (location.hash === "#702010100000") { openSearch(); }
+</script>
+</body></html>
+"""
+
+
+class MockUnipassHandler(BaseHTTPRequestHandler):
+    """검색 화면, 목록/상세 XHR, 인쇄 팝업, 제품 사진을 흉내 내는 요청 핸들러 (server.corpus, server.latency 사용)"""
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _send(self, status: int, body: str, content_type: str, cookie: str = None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _has_session(self) -> bool:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return SESSION_COOKIE in cookie
+    
+    def _form(self) -> dict:
+        query = parse_qs(urlsplit(self.path).query)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            body = self.rfile.read(length).decode("utf-8")
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                return {key: str(value) for key, value in json.loads(body).items()}
+            query.update(parse_qs(body))
+        return {key: values[-1] for key, values in query.items()}
+    
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path in ("/", "/clip/index.do"):
+            # 검색 화면과 세션 쿠키 발급 (브라우저 부트스트랩 흉내)
+            time.sleep(self.server.latency)
+            cookie = f"{SESSION_COOKIE}=mock-{threading.get_ident()}; Path=/"
+            html = INDEX_HTML.replace("__LIST_PATH__", LIST_PATH).replace("__DETAIL_PATH__", DETAIL_PATH)
+            self._send(200, html.replace("__PRINT_PATH__", PRINT_PATH), "text/html", cookie)
+        elif path == PRINT_PATH:
+            time.sleep(self.server.latency)
+            self._send_print(self._form())
+        elif path.startswith(IMAGE_PATH) and path.endswith(".png"):
+            number = path[len(IMAGE_PATH):-len(".png")]
+            if not number.isdigit():
+                self._send(404, "not found", "text/plain")
+                return
+            data = solid_png(int(number))
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        elif path in (LIST_PATH, DETAIL_PATH):
+            self.do_POST()
+        else:
+            self._send(404, "not found", "text/plain")
+    
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path not in (LIST_PATH, DETAIL_PATH):
+            self._send(404, "not found", "text/plain")
+            return
+        if not self._has_session():
+            self._send(403, json.dumps({"error": "session expired"}), "application/json")
+            return
+        
+        time.sleep(self.server.latency)
+        form = self._form()
+        if path == LIST_PATH:
+            self._send_list(form)
+        else:
+            self._send_detail(form)
+    
+    def _send_list(self, form: dict):
+        page_index = max(1, int(form.get("pageIndex", 1)))
+        page_size = int(form.get("recordCountPerPage", 10))
+        # 시행일자 시작일/종료일 조건 (YYYY-MM-DD, 날짜 포함, 없으면 제한 없음)
+        start_date, end_date = form.get("startDate", ""), form.get("endDate", "") or "9999-12-31"
+        corpus = [case for case in self.server.corpus if start_date <= case["efctDt"] <= end_date]
+        start = (page_index - 1) * page_size
+        rows = [
+            {key: case[key] for key in ("caseSn", "prnm", "hsSgn", "efctDt")}
+            for case in corpus[start:start + page_size]
+        ]
+        payload = {"totalCount": len(corpus), "pageIndex": page_index, "resultList": rows}
+        self._send(200, json.dumps(payload, ensure_ascii=False), "application/json")
+    
+    def _send_detail(self, form: dict):
+        case = self.server.cases_by_sn.get(form.get("caseSn", ""))
+        if case is None:
+            self._send(404, json.dumps({"error": "no such case"}), "application/json")
+            return
+        
+        if form.get("format") == "html":
+            # 상세보기 테이블 HTML 조각
+            rows = [("문서번호", case["caseSn"]), ("품명", case["prnm"]), ("HS부호", case["hsSgn"]),
+                    ("품목해설", case["prdtDesc"]), ("분류사유", case["clsfRsn"]), ("시행일자", case["efctDt"])]
+            body = "<table>" + "".join(
+                f"<tr><th>{escape(th)}</th><td>{escape(td)}</td></tr>" for th, td in rows
+            ) + "</table>"
+            self._send(200, body, "text/html")
+        else:
+            # 문서번호(caseSn)/시행일자(efctDt)를 포함한 상세 레코드 전체 (FIELD_MAP으로 사례 필드에 매핑)
+            self._send(200, json.dumps({"result": case}, ensure_ascii=False), "application/json")
+    
+    def _send_print(self, form: dict):
+        """인쇄 팝업 화면"""
+        case = self.server.cases_by_sn.get(form.get("caseSn", ""))
+        if case is None:
+            self._send(404, "not found", "text/plain")
+            return
+        rows = [("문서번호", case["caseSn"]), ("품명", case["prnm"]), ("HS부호", case["hsSgn"]),
+                ("품목해설", case["prdtDesc"]), ("분류사유", case["clsfRsn"]), ("시행일자", case["efctDt"])]
+        body = (
+            "<!DOCTYPE html><html lang='ko'><head><meta charset='UTF-8'><title>품목분류사례 인쇄</title></head><body>"
+            "<h1>품목분류 국내사례</h1><table border='1'>"
+            + "".join(f"<tr><th>{escape(th)}</th><td>{escape(td)}</td></tr>" for th, td in rows)
+            + f"</table><img src='{case['imgPath']}' alt=''></body></html>"
+        )
+        self._send(200, body, "text/html")
+
+
+def start_mock_server(port: int = 0, corpus_size: int = 200, latency: float = 0.0):
+    """백그라운드 스레드에서 목 서버 시작 후 (server, base_url) 반환"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockUnipassHandler)
+    server.daemon_threads = True
+    server.corpus = build_corpus(corpus_size)
+    server.cases_by_sn = {case["caseSn"]: case for case in server.corpus}
+    server.latency = latency
+    
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 테스트용 UNIPASS 목 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cases", type=int, default=200, help="사례 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="화면/XHR 응답 지연 (초)")
+    args = parser.parse_args()
+    
+    server, base_url = start_mock_server(args.port, args.cases, args.latency)
+    print(f"목 서버 실행 중: {base_url}/clip/index.do (사례 {args.cases}건, 지연 {args.latency}초)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
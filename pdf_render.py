@@ -0,0 +1,102 @@
+import re
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Page.printToPDF 옵션 (A4, 여백 0.4인치, 배경 포함)
+PDF_PRINT_OPTIONS = {
+    "printBackground": True,
+    "landscape": False,
+    "paperWidth": 8.27,  # A4 width in inches
+    "paperHeight": 11.69,  # A4 height in inches
+    "marginTop": 0.4,
+    "marginBottom": 0.4,
+    "marginLeft": 0.4,
+    "marginRight": 0.4
+}
+
+
+def inject_base_href(html: str, base_url: str) -> str:
+    """상대 경로 리소스(CSS, 이미지)가 원래 사이트에서 로드되도록 <base href> 삽입"""
+    if not base_url or re.search(r"<base\s", html, re.IGNORECASE):
+        return html
+    base_tag = f'<base href="{base_url.rstrip("/")}/">'
+    if re.search(r"<head[^>]*>", html, re.IGNORECASE):
+        return re.sub(r"(<head[^>]*>)", r"\1" + base_tag, html, count=1, flags=re.IGNORECASE)
+    return base_tag + html
+
+
+def render_html_to_pdf(driver, html: str, base_url: str, save) -> str:
+    """인쇄 화면 HTML을 빈 탭에 그린 뒤 Page.printToPDF로 만든 PDF를 save(PDF 바이트)로 저장하고 그 경로 반환"""
+    driver.get("about:blank")
+    frame_id = driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]["frame"]["id"]
+    driver.execute_cdp_cmd("Page.setDocumentContent", {"frameId": frame_id, "html": inject_base_href(html, base_url)})
+    
+    # 이미지/스타일 로드 완료 대기 (최대 10초)
+    driver.execute_async_script("""
+        var done = arguments[arguments.length - 1];
+        if (document.readyState === 'complete') { done(); return; }
+        window.addEventListener('load', function () { done(); });
+        setTimeout(done, 10000);
+    """)
+    
+    result = driver.execute_cdp_cmd("Page.printToPDF", PDF_PRINT_OPTIONS)
+    return save(base64.b64decode(result["data"]))
+
+
+class PdfRenderPool:
+    """인쇄 화면 HTML을 백그라운드 헤드리스 Chrome들로 PDF 변환하는 작업 풀
+
+    워커 스레드마다 driver_factory로 만든 브라우저를 하나씩 사용하며,
+    변환 중 오류가 나면 해당 브라우저를 버리고 다음 작업에서 새로 만든다.
+    """
+    
+    def __init__(self, driver_factory, num_workers: int = 2):
+        self._driver_factory = driver_factory
+        self._local = threading.local()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="pdf-render")
+    
+    def _driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self._driver_factory()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+    
+    def _discard_driver(self):
+        driver = getattr(self._local, "driver", None)
+        self._local.driver = None
+        if driver is not None:
+            with self._lock:
+                self._drivers.remove(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
+    def _render(self, html: str, base_url: str, save) -> str:
+        try:
+            return render_html_to_pdf(self._driver(), html, base_url, save)
+        except Exception:
+            self._discard_driver()
+            raise
+    
+    def submit(self, html: str, base_url: str, save):
+        """변환 작업 등록 (save는 PDF 바이트를 받아 저장 경로를 반환하는 함수, Future.result()는 그 경로, 실패 시 예외)"""
+        return self._executor.submit(self._render, html, base_url, save)
+    
+    def shutdown(self):
+        """남은 작업을 모두 처리한 뒤 브라우저 종료"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
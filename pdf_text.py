@@ -0,0 +1,186 @@
+import os
+import re
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from records import assign_detail_field, case_key
+from sinks import iter_jsonl, compact_jsonl
+from blob_store import BlobStore, BlobManifest, record_bytes, pdf_sha
+from search_index import SearchIndex, INDEX_FILENAME
+
+
+# PDF에서 채울 수 있는 필드 (상세보기 테이블 추출에서 비어 있는 경우만)
+FILLABLE_FIELDS = ("case_number", "title", "hs_code", "description", "classification_reason", "effective_date")
+
+# 인쇄 화면의 항목 이름으로 시작하는 줄 (항목 이름 뒤의 내용은 다음 항목 이름이 나올 때까지 이어짐)
+LABEL_PATTERN = re.compile(
+    r"^\s*(문서번호|사례번호|결정번호|참조번호|접수번호|품\s*명|HS\s*부호|HS\s*CODE|세\s*번|품목\s*해설|해\s*설|"
+    r"분류\s*사유|결정\s*사유|시행\s*일자|시행일)\s*[:：]?\s*(.*)$",
+    re.IGNORECASE
+)
+
+
+def load_pypdf():
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError("PDF 텍스트 추출에는 pypdf가 필요합니다 (uv sync --extra pdf)")
+    return pypdf
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pages(pdf_path) -> list:
+    """페이지별 텍스트 (가능하면 레이아웃을 유지하는 layout 모드)"""
+    pypdf = load_pypdf()
+    pages = []
+    for page in pypdf.PdfReader(str(pdf_path)).pages:
+        try:
+            pages.append(page.extract_text(extraction_mode="layout"))
+        except TypeError:
+            # layout 모드가 없는 이전 pypdf
+            pages.append(page.extract_text())
+    return pages
+
+
+def parse_fields(text: str) -> dict:
+    """인쇄 화면 텍스트에서 항목 이름/내용 쌍을 찾아 사례 필드로 변환"""
+    pairs = []
+    for line in text.splitlines():
+        match = LABEL_PATTERN.match(line)
+        if match:
+            pairs.append([re.sub(r"\s+", "", match.group(1)), [match.group(2).strip()]])
+        elif pairs and line.strip():
+            pairs[-1][1].append(line.strip())
+    
+    fields = {}
+    for header, lines in pairs:
+        value = re.sub(r"\s+", " ", " ".join(lines)).strip()
+        if value:
+            assign_detail_field(fields, header.upper(), value)
+    return fields
+
+
+def process_pdf(pdf_path: str, cache_dir: str) -> dict:
+    """PDF 한 개의 텍스트 추출 (내용 해시별 캐시가 있으면 재사용, 프로세스 풀 작업 단위)"""
+    sha256 = file_sha256(pdf_path)
+    cache_path = Path(cache_dir) / sha256[:2] / f"{sha256}.json"
+    if cache_path.exists():
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        return {"pdf_path": pdf_path, "sha256": sha256, "fields": cached["fields"], "cached": True}
+    
+    pages = extract_pages(pdf_path)
+    fields = parse_fields("\n".join(pages))
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"sha256": sha256, "pages": pages, "fields": fields}, f, ensure_ascii=False)
+    tmp_path.replace(cache_path)
+    return {"pdf_path": pdf_path, "sha256": sha256, "fields": fields, "cached": False}
+
+
+def fill_missing_fields(detail: dict, fields: dict) -> list:
+    """비어 있는 필드만 PDF에서 찾은 값으로 채우고 채운 필드 이름 반환"""
+    key = case_key(detail)
+    filled = []
+    for name in FILLABLE_FIELDS:
+        if detail.get(name) or not fields.get(name):
+            continue
+        detail[name] = fields[name]
+        # 식별 키가 바뀌면 저널/증분 크롤링 인덱스와 맞지 않으므로 되돌림
+        # (상세 정보를 하나도 추출하지 못해 인덱스로 구분하던 사례는 예외)
+        if case_key(detail) != key and not key.startswith("index:"):
+            detail[name] = ""
+            continue
+        filled.append(name)
+    return filled
+
+
+def enrich_from_pdfs(output_dir, workers: int = None) -> dict:
+    """저장된 PDF에서 텍스트를 추출하여 사례의 빈 필드를 채우고 JSONL/JSON/CSV, 저장소 매니페스트, 검색 색인 갱신"""
+    output_dir = Path(output_dir)
+    cases_path = output_dir / "hs_classification_cases.jsonl"
+    cache_dir = output_dir / "pdf_text_cache"
+    load_pypdf()
+    
+    pdf_paths = sorted({
+        detail["pdf_path"] for detail in iter_jsonl(cases_path)
+        if detail.get("pdf_path") and Path(detail["pdf_path"]).exists()
+    })
+    stats = {"pdfs": len(pdf_paths), "cached": 0, "failed": 0, "filled_cases": 0}
+    if not pdf_paths:
+        return stats
+    
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(process_pdf, path, str(cache_dir)): path for path in pdf_paths}
+        for future, path in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                stats["failed"] += 1
+                print(f"  PDF 텍스트 추출 실패: {path} ({e})")
+                continue
+            stats["cached"] += result["cached"]
+            results[path] = result["fields"]
+    
+    # JSONL을 한 줄씩 다시 쓰면서 빈 필드 채우기
+    filled_keys = set()
+    tmp_path = cases_path.with_suffix(".jsonl.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for detail in iter_jsonl(cases_path):
+            fields = results.get(detail.get("pdf_path"))
+            if fields and fill_missing_fields(detail, fields):
+                stats["filled_cases"] += 1
+                filled_keys.add(case_key(detail))
+            f.write(json.dumps(detail, ensure_ascii=False) + "\n")
+    tmp_path.replace(cases_path)
+    compact_jsonl(cases_path, output_dir / "hs_classification_cases.json", output_dir / "hs_classification_cases.csv")
+    
+    # 채운 사례의 마지막 레코드를 저장소/매니페스트에 다시 등록 (gc가 바뀐 레코드를 지우지 않도록)
+    if filled_keys:
+        latest = {}
+        for detail in iter_jsonl(cases_path):
+            key = case_key(detail)
+            if key in filled_keys:
+                latest[key] = detail
+        store = BlobStore(output_dir / "blobs")
+        manifest = BlobManifest(output_dir)
+        for key, detail in latest.items():
+            record_sha, _ = store.put(record_bytes(detail), ".json")
+            manifest.update(key, record_sha, pdf_sha(store, detail.get("pdf_path", "")))
+    
+    # 검색 색인이 있으면 다시 쓴 JSONL로 다시 색인
+    if (output_dir / INDEX_FILENAME).exists():
+        index = SearchIndex(output_dir)
+        try:
+            index.clear()
+            index.update_from_jsonl(cases_path)
+        finally:
+            index.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 품목분류 사례 PDF에서 텍스트 추출 및 빈 필드 채우기")
+    parser.add_argument("--output-dir", default="scraped_data")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args()
+    
+    stats = enrich_from_pdfs(args.output_dir, args.workers)
+    print(f"PDF {stats['pdfs']}개 (캐시 사용 {stats['cached']}개, 실패 {stats['failed']}개), "
+          f"빈 필드를 채운 사례 {stats['filled_cases']}건")
+
+
+if __name__ == "__main__":
+    main()
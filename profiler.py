@@ -0,0 +1,69 @@
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(values: list, q: float) -> float:
+    """백분위수 계산 (nearest-rank 방식)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class StepProfiler:
+    """스크래핑 단계별 실제 소요 시간 기록기"""
+    
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.listeners = []  # 기록마다 호출할 함수 (step, seconds), 예: Telemetry.step
+    
+    @contextmanager
+    def measure(self, step: str):
+        """with 블록의 소요 시간을 step 이름으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(step, time.perf_counter() - start)
+    
+    def record(self, step: str, seconds: float):
+        """소요 시간 직접 기록"""
+        self.timings[step].append(seconds)
+        for listener in self.listeners:
+            listener(step, seconds)
+    
+    def merge(self, timings: dict):
+        """다른 프로파일러(예: 병렬 워커)의 기록 병합"""
+        for step, values in timings.items():
+            self.timings[step].extend(values)
+    
+    def summary(self) -> dict:
+        """단계별 통계 (횟수, 합계, 평균, p50, p95, 최대, 단위: 초)"""
+        stats = {}
+        for step, values in self.timings.items():
+            if not values:
+                continue
+            stats[step] = {
+                "count": len(values),
+                "total": sum(values),
+                "mean": sum(values) / len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "max": max(values),
+            }
+        return stats
+    
+    def print_summary(self):
+        """단계별 소요 시간 표 출력 (총 소요 시간이 큰 단계부터)"""
+        stats = self.summary()
+        if not stats:
+            return
+        
+        print("\n단계별 소요 시간 (초)")
+        print(f"{'단계':<20}{'횟수':>8}{'합계':>10}{'평균':>8}{'p50':>8}{'p95':>8}{'최대':>8}")
+        for step, s in sorted(stats.items(), key=lambda item: item[1]["total"], reverse=True):
+            print(f"{step:<20}{s['count']:>8}{s['total']:>10.2f}{s['mean']:>8.2f}"
+                  f"{s['p50']:>8.2f}{s['p95']:>8.2f}{s['max']:>8.2f}")
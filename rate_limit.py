@@ -0,0 +1,139 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+
+# 사이트별 요청 속도 상태 파일 위치 (같은 사이트를 대상으로 하는 모든 워커/실행이 공유)
+STATE_DIR = Path.home() / ".cache" / "unipass_scraper"
+
+
+@contextmanager
+def locked_file(path: Path):
+    """프로세스 간 배타 잠금을 건 상태 파일 (읽기/쓰기 모드)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield f
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class AdaptiveRateLimiter:
+    """여러 워커가 파일로 공유하는 토큰 버킷 요청 속도 제한 (AIMD 방식으로 속도 자동 조정)
+
+    요청 전 acquire()로 토큰을 하나 가져가고(없으면 채워질 때까지 대기), 요청 결과를 report()로 알린다.
+    정상 응답이면 속도를 조금씩 올리고(가산 증가), 오류나 느린 응답이면 절반으로 줄인다(승산 감소).
+    한 번의 장애로 여러 워커가 동시에 속도를 계속 줄이지 않도록 감소는 cooldown초에 한 번만 적용한다.
+    """
+    
+    def __init__(self, state_path, initial_rate: float = 2.0, min_rate: float = 0.2, max_rate: float = 10.0,
+                 burst: float = 2.0, increase: float = 0.1, decrease: float = 0.5, slow_threshold: float = 5.0,
+                 cooldown: float = 2.0, enabled: bool = True):
+        self.state_path = Path(state_path)
+        self.initial_rate = initial_rate  # 초당 요청 수
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst  # 쉬고 있을 때 모아 둘 수 있는 최대 토큰 수
+        self.increase = increase  # 정상 응답 시 초당 요청 수 증가량 (1초 동안의 요청을 합친 값)
+        self.decrease = decrease  # 오류/느린 응답 시 곱할 비율
+        self.slow_threshold = slow_threshold  # 이보다 오래 걸린 요청은 느린 응답으로 간주 (초)
+        self.cooldown = cooldown
+        self.enabled = enabled
+        self._lock = threading.Lock()  # 같은 프로세스의 스레드(이미지 다운로드) 간 잠금
+    
+    @classmethod
+    def for_site(cls, base_url: str, **options) -> "AdaptiveRateLimiter":
+        """사이트(호스트)별 공유 상태 파일을 사용하는 제한기"""
+        host = urlsplit(base_url).netloc.replace(":", "_") or "default"
+        return cls(STATE_DIR / f"rate_{host}.json", **options)
+    
+    def _update(self, change):
+        """잠금을 건 상태에서 공유 상태를 읽고 change(state, now)로 바꾼 뒤 저장 (change의 반환값 반환)"""
+        with self._lock, locked_file(self.state_path) as f:
+            f.seek(0)
+            try:
+                state = json.loads(f.read() or b"{}")
+            except ValueError:
+                state = {}
+            now = time.time()
+            state.setdefault("rate", self.initial_rate)
+            state.setdefault("tokens", self.burst)
+            state.setdefault("updated", now)
+            state.setdefault("decreased", 0.0)
+            result = change(state, now)
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(state).encode("utf-8"))
+            f.flush()
+            return result
+    
+    def acquire(self) -> float:
+        """요청 토큰 하나 가져오기 (부족하면 차례가 올 때까지 대기, 대기한 시간 반환)"""
+        if not self.enabled:
+            return 0.0
+        
+        def take(state, now):
+            # 마지막 갱신 이후 채워진 토큰을 더하고 하나를 예약 (음수면 앞선 예약이 처리될 때까지 대기)
+            state["tokens"] = min(self.burst, state["tokens"] + (now - state["updated"]) * state["rate"]) - 1
+            state["updated"] = now
+            return max(0.0, -state["tokens"] / state["rate"])
+        
+        wait = self._update(take)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def report(self, seconds: float, ok: bool = True) -> float:
+        """요청 결과를 반영하여 속도 조정 (조정된 초당 요청 수 반환)"""
+        if not self.enabled:
+            return 0.0
+        
+        def adjust(state, now):
+            if not ok or seconds > self.slow_threshold:
+                if now - state["decreased"] >= self.cooldown:
+                    state["rate"] = max(self.min_rate, state["rate"] * self.decrease)
+                    state["decreased"] = now
+            else:
+                # 요청마다 increase / rate만큼 올려 1초에 약 increase만큼 증가
+                state["rate"] = min(self.max_rate, state["rate"] + self.increase / state["rate"])
+            return state["rate"]
+        
+        return self._update(adjust)
+    
+    @property
+    def rate(self) -> float:
+        """현재 공유 초당 요청 수"""
+        return self._update(lambda state, now: state["rate"])
+    
+    @contextmanager
+    def limit(self, profiler=None):
+        """with 블록 전에 토큰을 가져오고 끝나면 소요 시간/오류 여부를 반영 (profiler가 있으면 대기 시간을 rate_wait로 기록)"""
+        wait = self.acquire()
+        if profiler is not None and wait > 0:
+            profiler.record("rate_wait", wait)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.report(time.perf_counter() - start, ok=False)
+            raise
+        self.report(time.perf_counter() - start, ok=True)
@@ -0,0 +1,63 @@
+import re
+from datetime import datetime
+
+
+def new_case_detail(case_index: int) -> dict:
+    """빈 사례 상세 정보 레코드 생성"""
+    return {
+        "index": case_index,
+        "case_number": "",
+        "title": "",
+        "hs_code": "",
+        "description": "",
+        "images": [],
+        "classification_reason": "",
+        "effective_date": "",
+        "pdf_path": "",
+        "scraped_at": datetime.now().isoformat()
+    }
+
+
+def normalize_date(value: str) -> str:
+    """'2023.05.10', '2023-5-10', '20230510' 형식의 날짜를 'YYYY-MM-DD'로 변환 (실패 시 원문)"""
+    match = re.search(r"(\d{4})\D?(\d{1,2})\D?(\d{1,2})", value or "")
+    if not match:
+        return (value or "").strip()
+    year, month, day = (int(part) for part in match.groups())
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def assign_detail_field(detail: dict, header: str, value: str) -> bool:
+    """상세보기 테이블의 th(header)에 해당하는 필드에 td(value) 저장"""
+    if "시행일" in header:
+        detail["effective_date"] = normalize_date(value)
+    elif any(name in header for name in ("문서번호", "사례번호", "결정번호", "참조번호", "접수번호")):
+        detail["case_number"] = value
+    elif "품명" in header:
+        detail["title"] = value
+    elif "HS" in header or "세번" in header:
+        detail["hs_code"] = value
+    elif "해설" in header or "내용" in header:
+        detail["description"] = value
+    elif "분류사유" in header or "결정사유" in header or "사유" in header:
+        detail["classification_reason"] = value
+    else:
+        return False
+    return True
+
+
+def case_key(detail: dict) -> str:
+    """사례 식별 키 (문서번호가 있으면 문서번호, 없으면 품명 + HS코드 + 시행일자)"""
+    number = (detail.get("case_number") or "").strip()
+    if number:
+        return f"no:{number}"
+    
+    # 시행일자가 없는 예전 레코드는 해설로 구분
+    key = "|".join(
+        (detail.get(field) or "").strip()
+        for field in ("title", "hs_code", "effective_date" if detail.get("effective_date") else "description")
+    )
+    # 상세 정보 추출에 실패한 사례는 서로 다른 사례로 취급
+    if key.strip("|") == "":
+        return f"index:{detail.get('index')}"
+    return key
@@ -0,0 +1,133 @@
+import json
+import time
+import random
+from datetime import datetime
+from pathlib import Path
+
+from selenium.common.exceptions import (
+    WebDriverException,
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSessionIdException,
+    NoSuchWindowException
+)
+from urllib3.exceptions import HTTPError as Urllib3Error
+from requests.exceptions import (
+    HTTPError as RequestsHTTPError,
+    ConnectionError as RequestsConnectionError,
+    Timeout as RequestsTimeout
+)
+
+
+# 오류 분류
+TRANSIENT = "transient"  # 같은 브라우저에서 다시 시도하면 되는 오류 (화면 갱신 중, 다른 요소가 가림 등)
+SESSION = "session"  # 브라우저/chromedriver 세션이 끊겨 재시작이 필요한 오류
+FATAL = "fatal"  # 재시도해도 소용없는 오류 (코드 오류 등)
+
+TRANSIENT_ERRORS = (
+    StaleElementReferenceException,
+    TimeoutException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+)
+SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException, ConnectionError, Urllib3Error)
+# 세션이 끊겼을 때 WebDriverException 메시지에 나타나는 문구
+SESSION_MESSAGES = (
+    "invalid session id", "session deleted", "chrome not reachable", "disconnected",
+    "no such window", "target window already closed", "tab crashed", "session not created",
+)
+# HTTP 백엔드 응답 상태 코드 (세션 만료 / 잠시 후 다시 시도하면 되는 오류)
+SESSION_STATUS = (401, 403, 440)
+TRANSIENT_STATUS = (408, 429, 500, 502, 503, 504)
+
+
+def classify_error(error: Exception) -> str:
+    """예외를 transient / session / fatal 중 하나로 분류 (WebDriver 오류와 HTTP 백엔드의 requests 오류)"""
+    if isinstance(error, RequestsHTTPError) and error.response is not None:
+        status = error.response.status_code
+        if status in SESSION_STATUS:
+            return SESSION
+        return TRANSIENT if status in TRANSIENT_STATUS else FATAL
+    if isinstance(error, (RequestsConnectionError, RequestsTimeout)):
+        return TRANSIENT
+    if isinstance(error, SESSION_ERRORS):
+        return SESSION
+    message = str(error).lower()
+    if isinstance(error, WebDriverException) and any(text in message for text in SESSION_MESSAGES):
+        return SESSION
+    if isinstance(error, TRANSIENT_ERRORS):
+        return TRANSIENT
+    return FATAL
+
+
+class RetryPolicy:
+    """재시도 횟수와 지수 백오프 대기 시간 (attempt번째 실패 후 base_delay * 2^(attempt-1), 최대 max_delay)"""
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (여러 워커가 동시에 재시도하지 않도록 50~100% 범위에서 무작위)"""
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+def retry_call(action, policy: RetryPolicy, on_retry=None):
+    """action 실행 (fatal 오류이거나 재시도 횟수를 넘으면 마지막 예외를 그대로 전달)
+
+    재시도할 오류면 on_retry(error, kind, attempt, delay)를 호출한 뒤 백오프만큼 기다렸다가 다시 실행한다.
+    Selenium 경로(run_with_recovery)와 HTTP 백엔드(run_with_retry)가 같은 분류/재시도 규칙을 쓰도록 공유한다.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return action()
+        except Exception as e:
+            kind = classify_error(e)
+            if kind == FATAL or attempt >= policy.max_attempts:
+                raise
+            delay = policy.delay(attempt)
+            if on_retry:
+                on_retry(e, kind, attempt, delay)
+            time.sleep(delay)
+
+
+class DeadLetterLog:
+    """재시도 후에도 실패한 사례 기록 (JSONL, 병렬 워커도 같은 파일에 한 줄씩 추가)"""
+    
+    def __init__(self, output_dir, filename: str = "dead_letters.jsonl"):
+        self.path = Path(output_dir) / filename
+    
+    def start(self):
+        """새 크롤링 시작 시 이전 기록 삭제"""
+        self.path.write_text("", encoding="utf-8")
+    
+    def append(self, page_num: int, case_index: int, error: Exception, attempts: int):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "page": page_num,
+                "case_index": case_index,
+                "error_type": type(error).__name__,
+                "error_class": classify_error(error),
+                "error": str(error).strip().splitlines()[0] if str(error).strip() else "",
+                "attempts": attempts,
+                "at": datetime.now().isoformat()
+            }, ensure_ascii=False) + "\n")
+    
+    def records(self) -> list:
+        if not self.path.exists():
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
@@ -0,0 +1,119 @@
+import os
+import sys
+from collections import defaultdict, deque
+
+from profiler import percentile
+
+
+def process_tree_rss(root_pid: int) -> int:
+    """root_pid와 모든 하위 프로세스(Chrome, chromedriver 포함)의 RSS 합계 (바이트, /proc가 없으면 0)"""
+    if not os.path.isdir("/proc"):
+        return 0
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    children = defaultdict(list)
+    rss = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # "pid (comm) state ppid ..." 형식, comm에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 분리
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children[int(fields[1])].append(int(entry))
+        rss[int(entry)] = int(fields[21]) * page_size
+    
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+def python_rss() -> int:
+    """현재 파이썬 프로세스의 RSS (바이트, /proc가 없으면 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def driver_rss(driver) -> int:
+    """WebDriver가 띄운 chromedriver와 Chrome 프로세스 전체의 RSS (바이트, 알 수 없으면 0)"""
+    try:
+        return process_tree_rss(driver.service.process.pid)
+    except AttributeError:
+        return 0
+
+
+class ResourceMonitor:
+    """장시간 크롤링 중 브라우저/파이썬 메모리와 사례당 처리 시간을 보고 브라우저 재시작이 필요한지 판단
+
+    페이지마다 record_page()로 사례당 처리 시간을 기록하고, 페이지 경계에서 check()가 재시작 사유를 반환한다.
+    처리 시간은 재시작 직후 baseline_pages 페이지의 중앙값을 기준으로, 최근 window 페이지의 중앙값이
+    latency_factor배를 넘으면 느려진 것으로 본다. 기준값은 reset()(재시작 후)마다 다시 잡는다.
+    재시작해도 줄지 않는 파이썬 메모리 등으로 페이지마다 재시작하지 않도록, 재시작 후 min_cases건 동안은 확인하지 않는다.
+    """
+    
+    def __init__(self, max_browser_mb: float = 2048, max_python_mb: float = 1024, latency_factor: float = 2.0,
+                 max_cases: int = 2000, min_cases: int = 100, baseline_pages: int = 3, window: int = 3):
+        self.max_browser_mb = max_browser_mb  # None이면 확인하지 않음 (아래 항목도 같음)
+        self.max_python_mb = max_python_mb
+        self.latency_factor = latency_factor
+        self.max_cases = max_cases  # 이 사례 수마다 무조건 재시작
+        self.min_cases = min_cases
+        self.baseline_pages = baseline_pages
+        self.baseline = None  # 재시작 직후 사례당 처리 시간 중앙값 (초)
+        self.recent = deque(maxlen=window)
+        self._baseline_samples = []
+        self.cases = 0  # 마지막 재시작 이후 처리한 사례 수
+        self.last = {}  # 마지막 check()의 측정값
+    
+    def record_page(self, seconds: float, case_count: int):
+        """페이지 한 개의 처리 시간 기록 (사례가 없는 페이지는 제외)"""
+        if case_count <= 0:
+            return
+        self.cases += case_count
+        per_case = seconds / case_count
+        if self.baseline is None:
+            self._baseline_samples.append(per_case)
+            if len(self._baseline_samples) >= self.baseline_pages:
+                self.baseline = percentile(self._baseline_samples, 50)
+        else:
+            self.recent.append(per_case)
+    
+    def check(self, driver) -> str:
+        """재시작 사유 (browser_memory/python_memory/latency/case_count, 필요 없으면 빈 문자열)"""
+        browser_mb = driver_rss(driver) / 2 ** 20 if driver is not None else 0.0
+        python_mb = python_rss() / 2 ** 20
+        latency = percentile(list(self.recent), 50) if len(self.recent) == self.recent.maxlen else None
+        self.last = {"browser_mb": round(browser_mb, 1), "python_mb": round(python_mb, 1), "cases": self.cases,
+                     "seconds_per_case": latency, "baseline_seconds_per_case": self.baseline}
+        if self.cases < self.min_cases:
+            return ""
+        if self.max_browser_mb and browser_mb > self.max_browser_mb:
+            return "browser_memory"
+        if self.max_python_mb and python_mb > self.max_python_mb:
+            return "python_memory"
+        if self.latency_factor and self.baseline and latency and latency > self.baseline * self.latency_factor:
+            return "latency"
+        if self.max_cases and self.cases >= self.max_cases:
+            return "case_count"
+        return ""
+    
+    def reset(self):
+        """브라우저 재시작 후 사례 수와 처리 시간 기준값 초기화"""
+        self.cases = 0
+        self.baseline = None
+        self._baseline_samples = []
+        self.recent.clear()
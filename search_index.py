@@ -0,0 +1,290 @@
+import re
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+from pathlib import Path
+
+from records import case_key
+from sinks import ResultSink
+
+
+INDEX_FILENAME = "hs_classification_cases.sqlite"
+TEXT_FIELDS = ("title", "description", "classification_reason", "hs_code")
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    case_index INTEGER,
+    case_number TEXT,
+    title TEXT,
+    hs_code TEXT,
+    hs_digits TEXT,
+    effective_date TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_hs_digits ON cases (hs_digits);
+CREATE VIRTUAL TABLE IF NOT EXISTS cases_fts USING fts5 (
+    title, description, classification_reason, hs_code, tokenize = "unicode61"
+);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+# HS 부호 단계별 자릿수 (류/호/소호/세번)
+HS_LEVELS = {2: "류", 4: "호", 6: "소호", 10: "세번"}
+TAIL_BYTES = 4096  # 색인한 위치 바로 앞에서 파일이 다시 쓰였는지 확인할 바이트 수
+
+
+def ngram_tokens(text: str) -> list:
+    """한국어 검색용 2-gram 토큰 (띄어쓰기 없는 합성어도 부분 문자열로 찾을 수 있도록 단어마다 두 글자씩 분할)"""
+    tokens = []
+    for word in WORD_PATTERN.findall(str(text or "").lower()):
+        if len(word) <= 2:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def fts_query(text: str) -> str:
+    """검색어를 FTS5 쿼리로 변환 (단어마다 연속된 2-gram 구문, 한 글자 단어는 접두어 검색, 단어끼리는 AND)"""
+    clauses = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        if len(word) == 1:
+            clauses.append(f'"{word}"*')
+        else:
+            clauses.append('"' + " ".join(ngram_tokens(word)) + '"')
+    return " AND ".join(clauses)
+
+
+def hs_digits(hs_code: str) -> str:
+    """HS 부호의 숫자만 (예: '8471.30-1000' → '8471301000')"""
+    return re.sub(r"\D", "", str(hs_code or ""))
+
+
+def tail_sha(f, offset: int) -> str:
+    """파일에서 offset 바로 앞 TAIL_BYTES 바이트의 sha256 (파일이 다시 쓰였는지 확인용)"""
+    start = max(0, offset - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+class SearchIndex:
+    """스크래핑한 사례의 전문 검색(SQLite FTS5, 2-gram) + HS 부호 접두어 색인"""
+    
+    def __init__(self, output_dir, filename: str = INDEX_FILENAME):
+        self.path = Path(output_dir) / filename
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+    
+    def clear(self):
+        """색인 전체 삭제"""
+        with self.conn:
+            self.conn.execute("DELETE FROM cases")
+            self.conn.execute("DELETE FROM cases_fts")
+            self.conn.execute("DELETE FROM meta")
+    
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT count(*) FROM cases").fetchone()[0]
+    
+    def add(self, detail: dict):
+        """사례 한 건 추가 (같은 사례가 이미 있으면 새 기록으로 교체, 커밋은 호출한 쪽에서)"""
+        key = case_key(detail)
+        row = self.conn.execute("SELECT id FROM cases WHERE key = ?", (key,)).fetchone()
+        if row:
+            self.conn.execute("DELETE FROM cases_fts WHERE rowid = ?", (row["id"],))
+            self.conn.execute("DELETE FROM cases WHERE id = ?", (row["id"],))
+        
+        cursor = self.conn.execute(
+            "INSERT INTO cases (key, case_index, case_number, title, hs_code, hs_digits, effective_date, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, detail.get("index"), detail.get("case_number", ""), detail.get("title", ""),
+             detail.get("hs_code", ""), hs_digits(detail.get("hs_code")), detail.get("effective_date", ""),
+             json.dumps(detail, ensure_ascii=False))
+        )
+        self.conn.execute(
+            "INSERT INTO cases_fts (rowid, title, description, classification_reason, hs_code) VALUES (?, ?, ?, ?, ?)",
+            (cursor.lastrowid, *(" ".join(ngram_tokens(detail.get(field))) for field in TEXT_FIELDS))
+        )
+    
+    def add_many(self, details) -> int:
+        count = 0
+        with self.conn:
+            for detail in details:
+                self.add(detail)
+                count += 1
+        return count
+    
+    def update_from_jsonl(self, jsonl_path) -> int:
+        """JSONL 원본에서 마지막으로 색인한 위치 이후의 사례만 추가 (파일이 새로 쓰였으면 처음부터 다시 색인)
+        
+        위치(바이트 오프셋)와 함께 파일 식별자(장치:inode)와 위치 바로 앞 내용의 해시를 저장하여, 압축/PDF 보강/저장소
+        이전처럼 파일을 다시 쓴 경우 크기가 같거나 커졌어도 예전 위치에서 이어 읽지 않는다.
+        """
+        jsonl_path = Path(jsonl_path)
+        if not jsonl_path.exists():
+            return 0
+        offset = int(self.get_meta("jsonl_offset") or 0)
+        stat = jsonl_path.stat()
+        identity = f"{stat.st_dev}:{stat.st_ino}"
+        
+        count = 0
+        with open(jsonl_path, "rb") as f, self.conn:
+            if (stat.st_size < offset or self.get_meta("jsonl_path") != str(jsonl_path.resolve())
+                    or self.get_meta("jsonl_identity") != identity
+                    or self.get_meta("jsonl_tail_sha") != tail_sha(f, offset)):
+                self.clear()
+                offset = 0
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 기록 중인 마지막 줄은 다음에 색인
+                offset += len(line)
+                try:
+                    self.add(json.loads(line))
+                except ValueError:
+                    continue
+                count += 1
+            self.set_meta("jsonl_offset", str(offset))
+            self.set_meta("jsonl_path", str(jsonl_path.resolve()))
+            self.set_meta("jsonl_identity", identity)
+            self.set_meta("jsonl_tail_sha", tail_sha(f, offset))
+        return count
+    
+    def get_meta(self, name: str) -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else None
+    
+    def set_meta(self, name: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+    
+    def search(self, text: str = "", hs_prefix: str = "", limit: int = 20) -> list:
+        """검색어(품명/해설/분류사유/HS부호)와 HS 부호 접두어(류/호/소호)로 사례 검색 (검색어가 있으면 관련도순)"""
+        conditions, params = [], []
+        query = fts_query(text) if text else ""
+        prefix = hs_digits(hs_prefix)
+        if prefix:
+            # 숫자만 저장한 HS 부호의 범위 조건으로 인덱스 사용 ('9' 다음 문자는 ':')
+            conditions.append("c.hs_digits >= ? AND c.hs_digits < ?")
+            params += [prefix, prefix + ":"]
+        
+        if query:
+            sql = ("SELECT c.record FROM cases_fts JOIN cases c ON c.id = cases_fts.rowid "
+                   "WHERE cases_fts MATCH ?" + "".join(" AND " + c for c in conditions) +
+                   " ORDER BY bm25(cases_fts, 3.0, 1.0, 1.0, 2.0) LIMIT ?")
+            params = [query] + params
+        else:
+            sql = ("SELECT c.record FROM cases c" + (" WHERE " + " AND ".join(conditions) if conditions else "") +
+                   " ORDER BY c.effective_date DESC LIMIT ?")
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [json.loads(row["record"]) for row in rows]
+    
+    def hs_tree(self, prefix: str = "") -> list:
+        """HS 부호 접두어 아래 단계별 사례 수 (예: '84' → 8401, 8402, ... 호별 건수)"""
+        prefix = hs_digits(prefix)
+        width = next((level for level in sorted(HS_LEVELS) if level > len(prefix)), len(prefix))
+        rows = self.conn.execute(
+            "SELECT substr(hs_digits, 1, ?) AS code, count(*) AS n FROM cases "
+            "WHERE hs_digits >= ? AND hs_digits < ? GROUP BY code ORDER BY code",
+            (width, prefix, prefix + ":")
+        ).fetchall()
+        return [(row["code"], row["n"]) for row in rows]
+
+
+class SearchIndexSink(ResultSink):
+    """스크래핑한 사례를 검색 색인에 바로 추가하는 출력 (batch_size 건마다 커밋)"""
+    
+    def __init__(self, output_dir, batch_size: int = 100):
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.index = None
+        self._pending = 0
+    
+    def open(self, append: bool):
+        self.index = SearchIndex(self.output_dir)
+        if not append:
+            self.index.clear()
+    
+    def write(self, detail: dict):
+        self.index.add(detail)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if self.index:
+            self.index.conn.commit()
+            self._pending = 0
+    
+    def close(self):
+        if self.index:
+            self.index.close()
+            self.index = None
+
+
+def print_cases(cases: list):
+    for detail in cases:
+        print(f"[{detail.get('effective_date', '')}] {detail.get('hs_code', ''):<16} "
+              f"{detail.get('case_number', '')} {detail.get('title', '')[:50]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="품목분류 사례 검색 색인")
+    parser.add_argument("--output-dir", default="scraped_data")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="JSONL 원본에서 색인 생성/갱신 (새로 추가된 사례만)")
+    build.add_argument("--rebuild", action="store_true", help="처음부터 다시 색인")
+    
+    query = commands.add_parser("query", help="전문 검색")
+    query.add_argument("text", nargs="?", default="")
+    query.add_argument("--hs", default="", help="HS 부호 접두어 (예: 84, 8471, 847130)")
+    query.add_argument("--limit", type=int, default=20)
+    
+    tree = commands.add_parser("hs", help="HS 부호 단계별 사례 수")
+    tree.add_argument("prefix", nargs="?", default="")
+    args = parser.parse_args()
+    
+    index = SearchIndex(args.output_dir)
+    try:
+        if args.command == "build":
+            if args.rebuild:
+                index.clear()
+            jsonl_path = Path(args.output_dir) / "hs_classification_cases.jsonl"
+            json_path = Path(args.output_dir) / "hs_classification_cases.json"
+            start = time.perf_counter()
+            if jsonl_path.exists():
+                count = index.update_from_jsonl(jsonl_path)
+            elif json_path.exists():
+                # JSONL 도입 이전 결과
+                with open(json_path, encoding="utf-8") as f:
+                    count = index.add_many(json.load(f))
+            else:
+                count = 0
+            print(f"{count}건 색인 ({(time.perf_counter() - start) * 1000:.0f}ms), 전체 {len(index)}건: {index.path}")
+        
+        elif args.command == "query":
+            start = time.perf_counter()
+            cases = index.search(args.text, args.hs, args.limit)
+            print_cases(cases)
+            print(f"\n{len(cases)}건 ({(time.perf_counter() - start) * 1000:.1f}ms)")
+        
+        elif args.command == "hs":
+            for code, count in index.hs_tree(args.prefix):
+                print(f"{code:<12}{count:>8}")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
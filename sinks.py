@@ -0,0 +1,210 @@
+import csv
+import json
+import shutil
+from pathlib import Path
+
+from records import case_key
+
+
+# CSV/Parquet 출력 컬럼 (hs_classification_cases.csv와 동일, 기존 CSV를 읽는 쪽을 위해 새 컬럼은 뒤에 추가)
+CSV_COLUMNS = [
+    "index", "title", "hs_code", "description", "classification_reason", "pdf_path", "images", "scraped_at",
+    "case_number", "effective_date",
+]
+
+
+def csv_row(detail: dict) -> dict:
+    """사례 레코드를 CSV 한 행으로 변환 (이미지는 로컬 경로를 ';'로 연결)"""
+    row = {column: detail.get(column, "") for column in CSV_COLUMNS}
+    row["images"] = "; ".join(img.get("local_path", "") for img in detail.get("images", []))
+    return row
+
+
+class ResultSink:
+    """사례 레코드 출력 인터페이스 (스크래핑 직후 한 건씩 기록)"""
+    
+    def open(self, append: bool):
+        """출력 열기 (append=False면 기존 내용 삭제)"""
+    
+    def write(self, detail: dict):
+        raise NotImplementedError
+    
+    def flush(self):
+        """버퍼를 디스크에 기록"""
+    
+    def close(self):
+        self.flush()
+
+
+class JsonlSink(ResultSink):
+    """한 줄에 사례 하나씩 기록하는 JSONL 출력 (최종 JSON/CSV 생성의 원본)"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+    
+    def open(self, append: bool):
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+    
+    def write(self, detail: dict):
+        self._file.write(json.dumps(detail, ensure_ascii=False) + "\n")
+        self._file.flush()
+    
+    def flush(self):
+        if self._file:
+            self._file.flush()
+    
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class CsvAppendSink(ResultSink):
+    """행 단위로 덧붙이는 CSV 출력"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+        self._writer = None
+    
+    def open(self, append: bool):
+        is_new = not append or not self.path.exists() or self.path.stat().st_size == 0
+        # 새 파일에만 BOM(utf-8-sig)과 헤더 기록
+        self._file = open(self.path, "w" if is_new else "a", encoding="utf-8-sig" if is_new else "utf-8",
+                          newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_COLUMNS)
+        if is_new:
+            self._writer.writeheader()
+    
+    def write(self, detail: dict):
+        self._writer.writerow(csv_row(detail))
+    
+    def flush(self):
+        if self._file:
+            self._file.flush()
+    
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class ParquetSink(ResultSink):
+    """batch_size 건마다 row group을 기록하는 Parquet 출력 (pyarrow 필요)
+
+    실행마다 디렉터리 안에 part 파일을 하나씩 만들어 이어서 진행할 때도 기존 파일을 다시 쓰지 않는다.
+    """
+    
+    def __init__(self, path, batch_size: int = 500):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet 출력(--formats parquet)에는 pyarrow가 필요합니다 (uv sync --extra parquet)")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.schema = pyarrow.schema(
+            [("index", pyarrow.int64())] + [(column, pyarrow.string()) for column in CSV_COLUMNS[1:]]
+        )
+        self._writer = None
+        self._buffer = []
+    
+    def open(self, append: bool):
+        if not append and self.path.exists():
+            shutil.rmtree(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        part = len(list(self.path.glob("part-*.parquet")))
+        self._writer = self.pq.ParquetWriter(str(self.path / f"part-{part:05d}.parquet"), self.schema)
+    
+    def write(self, detail: dict):
+        row = csv_row(detail)
+        row["images"] = json.dumps(detail.get("images", []), ensure_ascii=False)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        if self._writer and self._buffer:
+            self._writer.write_table(self.pa.Table.from_pylist(self._buffer, schema=self.schema))
+            self._buffer = []
+    
+    def close(self):
+        if self._writer:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+
+def make_sinks(output_dir, formats=("jsonl",)) -> list:
+    """출력 형식 이름(jsonl, csv, parquet, index)으로 출력 목록 생성"""
+    output_dir = Path(output_dir)
+    
+    def search_index_sink():
+        from search_index import SearchIndexSink
+        return SearchIndexSink(output_dir)
+    
+    factories = {
+        "jsonl": lambda: JsonlSink(output_dir / "hs_classification_cases.jsonl"),
+        "csv": lambda: CsvAppendSink(output_dir / "hs_classification_cases.stream.csv"),
+        "parquet": lambda: ParquetSink(output_dir / "hs_classification_cases.parquet"),
+        "index": search_index_sink,
+    }
+    return [factories[name]() for name in formats]
+
+
+def iter_jsonl(path):
+    """JSONL 파일의 레코드 순회 (비정상 종료로 잘린 줄은 무시)"""
+    path = Path(path)
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def compact_jsonl(jsonl_path, json_path, csv_path) -> int:
+    """JSONL을 중복 제거하여 기존 형식의 JSON/CSV로 변환 (같은 사례는 마지막 기록 우선)
+
+    첫 번째 순회에서는 키별 마지막 위치만 기억하고 두 번째 순회에서 레코드를 바로 기록하므로
+    메모리는 사례 수만큼의 키만 사용한다.
+    """
+    last_position = {}
+    for position, detail in enumerate(iter_jsonl(jsonl_path)):
+        last_position[case_key(detail)] = position
+    
+    count = 0
+    json_tmp = Path(json_path).with_suffix(".json.tmp")
+    csv_tmp = Path(csv_path).with_suffix(".csv.tmp")
+    with open(json_tmp, "w", encoding="utf-8") as json_file, \
+            open(csv_tmp, "w", encoding="utf-8-sig", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        json_file.write("[")
+        for position, detail in enumerate(iter_jsonl(jsonl_path)):
+            if last_position[case_key(detail)] != position:
+                continue
+            item = json.dumps(detail, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            json_file.write(("," if count else "") + "\n  " + item)
+            writer.writerow(csv_row(detail))
+            count += 1
+        json_file.write("\n]\n" if count else "]\n")
+    
+    json_tmp.replace(json_path)
+    csv_tmp.replace(csv_path)
+    return count
+
+
+def seed_jsonl_from_json(json_path, jsonl_path) -> int:
+    """기존 JSON 결과 파일로 JSONL 원본 생성 (JSONL 도입 이전 결과를 이어서 쓰기 위해)"""
+    with open(json_path, encoding="utf-8") as f:
+        details = json.load(f)
+    with open(jsonl_path, "w", encoding="utf-8") as f:
+        for detail in details:
+            f.write(json.dumps(detail, ensure_ascii=False) + "\n")
+    return len(details)
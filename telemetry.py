@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import threading
+from collections import defaultdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+# 로그/추적 수준 (앞일수록 중요, 설정한 수준까지 출력/기록)
+LOG_LEVELS = ("error", "warning", "info", "debug")
+METRIC_PREFIX = "unipass"
+
+
+def level_rank(level: str) -> int:
+    if level not in LOG_LEVELS:
+        raise ValueError(f"알 수 없는 로그 수준: {level} (가능한 값: {', '.join(LOG_LEVELS)})")
+    return LOG_LEVELS.index(level)
+
+
+def format_labels(labels) -> str:
+    """Prometheus 레이블 문자열 (예: {kind="session"})"""
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + "}"
+
+
+class Telemetry:
+    """스크래퍼 로그/이벤트/카운터 기록기
+
+    - 콘솔: verbosity 수준까지의 로그만 출력
+    - 추적: trace_level 수준까지의 이벤트를 trace.jsonl에 한 줄씩 기록 (병렬 워커도 같은 파일에 추가)
+    - 지표: 카운터와 단계별 소요 시간을 Prometheus 텍스트 형식으로 metrics.prom에 기록 (metrics_port를 주면 HTTP로도 제공)
+    """
+    
+    def __init__(self, output_dir, verbosity: str = "info", trace_level: str = "debug",
+                 trace_filename: str = "trace.jsonl", metrics_filename: str = "metrics.prom", worker: int = None):
+        self.verbosity = level_rank(verbosity)
+        self.trace_level = level_rank(trace_level)
+        self.trace_path = Path(output_dir) / trace_filename
+        self.metrics_path = Path(output_dir) / metrics_filename if metrics_filename else None
+        self.worker = worker
+        self.counters = defaultdict(float)  # (이름, 레이블 튜플) → 값
+        self.started = time.time()
+        self.profiler = None  # 지표에 포함할 StepProfiler (attach_profiler로 연결)
+        self._trace_file = None
+        self._lock = threading.Lock()  # PDF 변환/이미지 다운로드 스레드에서도 기록
+        self._server = None
+    
+    def attach_profiler(self, profiler):
+        """StepProfiler의 단계별 소요 시간을 추적(debug 수준)과 지표에 포함"""
+        self.profiler = profiler
+        profiler.listeners.append(self.step)
+    
+    def event(self, name: str, level: str = "info", **fields):
+        """구조화 이벤트를 추적 파일에 기록 (trace_level보다 상세한 이벤트는 기록하지 않음)"""
+        if level_rank(level) > self.trace_level:
+            return
+        entry = {"ts": datetime.now().isoformat(), "event": name, "level": level, "pid": os.getpid()}
+        if self.worker is not None:
+            entry["worker"] = self.worker
+        entry.update(fields)
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._trace_file is None:
+                self._trace_file = open(self.trace_path, "a", encoding="utf-8")
+            self._trace_file.write(line)
+            self._trace_file.flush()
+    
+    def log(self, message: str, level: str = "info", event: str = "log", **fields):
+        """콘솔 출력(verbosity 수준까지) + 추적 이벤트 기록"""
+        if level_rank(level) <= self.verbosity:
+            print(message)
+        self.event(event, level, message=message.strip(), **fields)
+    
+    def count(self, name: str, value: float = 1, **labels):
+        """카운터 증가 (지표 이름은 unipass_<name>_total)"""
+        with self._lock:
+            self.counters[(name, tuple(sorted(labels.items())))] += value
+    
+    def step(self, step: str, seconds: float):
+        """StepProfiler 기록 리스너"""
+        self.event("step", "debug", step=step, seconds=round(seconds, 6))
+    
+    def counter_items(self) -> list:
+        """프로세스 간 전달용 카운터 목록 ([이름, 레이블 목록, 값])"""
+        with self._lock:
+            return [[name, [list(label) for label in labels], value] for (name, labels), value in self.counters.items()]
+    
+    def merge_counters(self, items: list):
+        """다른 프로세스(병렬 워커)의 카운터 병합"""
+        with self._lock:
+            for name, labels, value in items:
+                self.counters[(name, tuple(tuple(label) for label in labels))] += value
+    
+    def render_metrics(self) -> str:
+        """Prometheus 텍스트 형식 지표 (카운터, 단계별 소요 시간 요약, 처리량)"""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+        declared = set()
+        for (name, labels), value in counters:
+            metric = f"{METRIC_PREFIX}_{name}_total"
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{format_labels(labels)} {value:g}")
+        
+        elapsed = time.time() - self.started
+        lines.append(f"# TYPE {METRIC_PREFIX}_uptime_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}_uptime_seconds {elapsed:.3f}")
+        saved = sum(value for (name, _), value in counters if name == "cases_saved")
+        lines.append(f"# TYPE {METRIC_PREFIX}_cases_per_minute gauge")
+        lines.append(f"{METRIC_PREFIX}_cases_per_minute {saved / elapsed * 60 if elapsed else 0:.3f}")
+        
+        if self.profiler:
+            metric = f"{METRIC_PREFIX}_step_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for step, s in sorted(self.profiler.summary().items()):
+                for quantile, key in (("0.5", "p50"), ("0.95", "p95")):
+                    lines.append(f'{metric}{{step="{step}",quantile="{quantile}"}} {s[key]:.6f}')
+                lines.append(f'{metric}_sum{{step="{step}"}} {s["total"]:.6f}')
+                lines.append(f'{metric}_count{{step="{step}"}} {s["count"]}')
+        return "\n".join(lines) + "\n"
+    
+    def write_metrics(self):
+        """지표 파일 갱신 (node_exporter textfile collector 등에서 읽는 도중 바뀌지 않도록 임시 파일 후 교체)"""
+        if self.metrics_path is None:
+            return
+        tmp_path = self.metrics_path.with_name(self.metrics_path.name + ".tmp")
+        tmp_path.write_text(self.render_metrics(), encoding="utf-8")
+        tmp_path.replace(self.metrics_path)
+    
+    def serve_metrics(self, port: int, host: str = "127.0.0.1"):
+        """로컬 HTTP 지표 엔드포인트 시작 (GET /metrics, 백그라운드 스레드)"""
+        telemetry = self
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = telemetry.render_metrics().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        self.log(f"지표 엔드포인트: http://{host}:{self._server.server_port}/metrics", "debug", "metrics_server")
+    
+    def close(self):
+        """지표 파일을 기록하고 추적 파일 닫기 (이후 이벤트가 오면 다시 열림)"""
+        self.write_metrics()
+        with self._lock:
+            if self._trace_file:
+                self._trace_file.close()
+                self._trace_file = None
+    
+    def shutdown(self):
+        self.close()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
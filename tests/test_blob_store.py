@@ -0,0 +1,62 @@
+import json
+
+from blob_store import BlobStore, BlobManifest, normalize_pdf, record_bytes, collect_garbage
+from records import new_case_detail, case_key
+
+
+def render_pdf(created: str, document_id: str) -> bytes:
+    """같은 화면을 인쇄할 때마다 생성 시각/문서 ID만 바뀌는 PDF"""
+    return (b"%PDF-1.4\n1 0 obj\n<< /Producer (Skia/PDF) /CreationDate (D:" + created.encode() +
+            b") /ModDate (D:" + created.encode() + b") >>\nendobj\ntrailer\n<< /Size 2 /ID [<" +
+            document_id.encode() + b"> <" + document_id.encode() + b">] >>\n%%EOF\n")
+
+
+def test_two_renders_of_same_pdf_share_one_blob(tmp_path):
+    first = render_pdf("20250101093000+09'00'", "3F2A9C")
+    second = render_pdf("20250314172512+09'00'", "B71D04")
+    assert first != second
+    assert len(normalize_pdf(first)) == len(first)  # xref 위치가 바뀌지 않도록 길이 유지
+    
+    store = BlobStore(tmp_path / "blobs")
+    first_sha, first_path = store.put(normalize_pdf(first), ".pdf")
+    second_sha, second_path = store.put(normalize_pdf(second), ".pdf")
+    assert first_sha == second_sha
+    assert first_path == second_path
+    assert [sha for sha, _ in store.blobs()] == [first_sha]
+
+
+def test_record_hash_ignores_volatile_fields():
+    detail = new_case_detail(1)
+    detail.update(case_number="CLSF-000001", title="품목", scraped_at="2025-01-01T00:00:00")
+    rescraped = dict(detail, index=31, scraped_at="2025-03-01T12:00:00")
+    assert record_bytes(detail) == record_bytes(rescraped)
+    assert record_bytes(detail) != record_bytes(dict(detail, title="다른 품목"))
+
+
+def test_gc_removes_only_unreferenced_blobs(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    _, pdf_path = store.put(normalize_pdf(render_pdf("20250101093000+09'00'", "3F2A9C")), ".pdf")
+    orphan_sha, orphan_path = store.put(b"%PDF-1.4 orphan\n%%EOF\n", ".pdf")
+    
+    detail = new_case_detail(1)
+    detail.update(case_number="CLSF-000001", title="품목", pdf_path=str(pdf_path))
+    (tmp_path / "hs_classification_cases.jsonl").write_text(json.dumps(detail, ensure_ascii=False) + "\n",
+                                                             encoding="utf-8")
+    old_record_sha, old_record_path = store.put(record_bytes(dict(detail, title="이전 품목")), ".json")
+    manifest = BlobManifest(tmp_path)
+    manifest.update(case_key(detail), old_record_sha, pdf_path.name.split(".", 1)[0])
+    
+    # dry run은 아무것도 지우지 않음
+    stats = collect_garbage(tmp_path, dry_run=True)
+    assert stats["removed_blobs"] == 1  # dry run은 현재 레코드를 등록하지 않으므로 이전 레코드는 아직 참조됨
+    assert orphan_path.exists() and old_record_path.exists()
+    
+    stats = collect_garbage(tmp_path)
+    assert (stats["removed_blobs"], stats["kept_blobs"]) == (2, 2)
+    assert not orphan_path.exists()
+    assert not old_record_path.exists()
+    assert pdf_path.exists()
+    record_path = store.path(BlobManifest(tmp_path).load().entries[case_key(detail)]["record"], ".json")
+    assert record_path.read_bytes() == record_bytes(detail)
+    assert {sha for sha, _ in store.blobs()} == BlobManifest(tmp_path).load().referenced()
+    assert orphan_sha not in BlobManifest(tmp_path).load().referenced()
@@ -0,0 +1,38 @@
+import pytest
+
+import cli
+
+
+class FakeScraper:
+    """crawl 명령이 부르는 스크래퍼 메서드의 결과만 흉내 냄"""
+    
+    complete = True
+    
+    def __init__(self, **options):
+        pass
+    
+    def scrape_new_cases(self, max_pages=None):
+        return 3, self.complete
+    
+    def scrape_all_cases(self, start_year, start_month, max_pages=None):
+        return self.complete
+    
+    def scrape_date_range(self, start_date, end_date=None, max_shard_pages=5, num_workers=1, resume=False,
+                          max_pages=None):
+        FakeScraper.date_range_call = {"max_shard_pages": max_shard_pages, "max_pages": max_pages}
+        return self.complete
+
+
+@pytest.mark.parametrize("complete, code", [(True, 0), (False, 1)])
+@pytest.mark.parametrize("extra", [[], ["--incremental"]], ids=["full", "incremental"])
+def test_crawl_exit_code_follows_crawl_result(monkeypatch, tmp_path, extra, complete, code):
+    monkeypatch.setattr(FakeScraper, "complete", complete)
+    monkeypatch.setattr(cli, "scraper_class", lambda: FakeScraper)
+    assert cli.main(["--output-dir", str(tmp_path), "crawl"] + extra) == code
+
+
+def test_sharded_crawl_passes_max_pages(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "scraper_class", lambda: FakeScraper)
+    argv = ["--output-dir", str(tmp_path), "crawl", "--sharded", "--max-pages", "2", "--max-shard-pages", "3"]
+    assert cli.main(argv) == 0
+    assert FakeScraper.date_range_call == {"max_shard_pages": 3, "max_pages": 2}
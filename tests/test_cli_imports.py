@@ -0,0 +1,81 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import cli
+from records import new_case_detail
+
+
+REPO = Path(__file__).resolve().parent.parent
+# 브라우저가 필요 없는 명령에서 불러오지 않아야 하는 모듈
+BROWSER_MODULES = ("selenium", "webdriver_manager", "requests", "main")
+OFFLINE_COMMANDS = (["stats"], ["stats", "--json"], ["verify-pdfs"], ["export"])
+
+# cli.main 실행 후 불러온 최상위 모듈 목록을 출력
+SYS_MODULES_SCRIPT = """
+import sys, json, contextlib, io
+import cli
+with contextlib.redirect_stdout(io.StringIO()):
+    cli.main(sys.argv[1:])
+print(json.dumps(sorted({name.split(".")[0] for name in sys.modules})))
+"""
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    detail = new_case_detail(1)
+    detail.update(case_number="CLSF-000001", title="시험용 품목", hs_code="8401.10-1000", effective_date="2025-12-31")
+    (tmp_path / "hs_classification_cases.jsonl").write_text(json.dumps(detail, ensure_ascii=False) + "\n",
+                                                             encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("command", OFFLINE_COMMANDS, ids=" ".join)
+def test_offline_command_skips_browser_imports(output_dir, command):
+    completed = subprocess.run(
+        [sys.executable, "-c", SYS_MODULES_SCRIPT, "--output-dir", str(output_dir)] + command,
+        cwd=REPO, capture_output=True, text=True, check=True
+    )
+    modules = set(json.loads(completed.stdout.splitlines()[-1]))
+    assert not modules & set(BROWSER_MODULES)
+
+
+# 하위 명령별 불러오기 시간 예산 (-X importtime 누적 시간, 인터프리터 시작 시 불러오는 모듈 제외, µs)
+IMPORT_BUDGETS = {"crawl": 3_000_000, "resume": 3_000_000, "export": 300_000, "stats": 300_000,
+                  "verify-pdfs": 300_000}
+# crawl/resume은 브라우저를 띄우기 전에 스크래퍼 클래스를 불러오는 데까지만 측정
+BROWSER_IMPORT_SCRIPT = "import cli; cli.scraper_class()"
+
+
+def top_level_imports(args: list) -> dict:
+    """python -X importtime 실행 결과의 최상위 모듈별 누적 시간 (µs)"""
+    completed = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=REPO, capture_output=True, text=True,
+                               check=True)
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # 중첩된 모듈은 이름 앞 들여쓰기가 두 칸 이상 (부모의 누적 시간에 포함됨)
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def test_import_budgets_cover_all_commands():
+    assert set(IMPORT_BUDGETS) == set(cli.COMMANDS)
+
+
+@pytest.mark.parametrize("command", cli.COMMANDS)
+def test_import_time_budget(output_dir, command):
+    startup = top_level_imports(["-c", "pass"])
+    if command in ("crawl", "resume"):
+        imports = top_level_imports(["-c", BROWSER_IMPORT_SCRIPT])
+    else:
+        imports = top_level_imports(["cli.py", "--output-dir", str(output_dir), command])
+        assert not {name.split(".")[0] for name in imports} & set(BROWSER_MODULES)
+    micros = sum(value for name, value in imports.items() if name not in startup)
+    assert micros <= IMPORT_BUDGETS[command], f"{command}: {micros / 1000:.0f}ms"
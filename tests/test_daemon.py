@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from daemon import ScraperDaemon
+
+
+@pytest.fixture
+def make_daemon(tmp_path):
+    daemons = []
+
+    def make(**options):
+        daemon = ScraperDaemon(sessions=1, output_dir=str(tmp_path), keepalive=0, image_workers=0, rate_limit=False,
+                               **options)
+        # 브라우저 없이 작업 흐름만 확인
+        daemon.ensure_alive = lambda scraper: None
+        daemon.execute = lambda scraper, job_type, params: {"date": params["date"]}
+        for scraper in daemon.sessions:
+            daemon.idle.put(scraper)
+        daemons.append(daemon)
+        return daemon
+
+    yield make
+    for daemon in daemons:
+        daemon.shutdown()
+
+
+def run_lookups(daemon, count):
+    jobs = [daemon.submit("lookup", {"date": f"2024-01-{day:02d}"}) for day in range(1, count + 1)]
+    for job in jobs:
+        job.done.wait(5)
+    return jobs
+
+
+def test_finished_jobs_are_capped(make_daemon):
+    daemon = make_daemon(max_finished_jobs=3)
+    jobs = run_lookups(daemon, 5)
+    assert all(job.status == "done" for job in jobs)
+    assert sorted(daemon.jobs) == [job.id for job in jobs[-3:]]
+    assert daemon.status()["jobs"] == {"done": 3}
+
+
+def test_finished_jobs_expire_after_ttl(make_daemon):
+    daemon = make_daemon(job_ttl=0)
+    jobs = run_lookups(daemon, 2)
+    daemon.prune_jobs()
+    assert daemon.jobs == {}
+    assert jobs[-1].result == {"date": "2024-01-02"}
+
+
+def test_unfinished_jobs_are_kept(make_daemon):
+    daemon = make_daemon(job_ttl=0, max_finished_jobs=0)
+    scraper = daemon.idle.get()  # 세션이 없어 작업이 대기 상태로 남음
+    job = daemon.submit("lookup", {"date": "2024-01-01"})
+    daemon.prune_jobs()
+    assert list(daemon.jobs) == [job.id]
+    daemon.idle.put(scraper)
+    assert job.done.wait(5)
@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+
+from date_shards import parse_date, month_shards, split_shard, ShardPlan
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    # 첫/마지막 구간은 범위에 맞춰 잘림
+    (date(2024, 1, 15), date(2024, 3, 10),
+     [(date(2024, 1, 15), date(2024, 1, 31)), (date(2024, 2, 1), date(2024, 2, 29)),
+      (date(2024, 3, 1), date(2024, 3, 10))]),
+    # 연도 경계
+    (date(2023, 12, 1), date(2024, 1, 31),
+     [(date(2023, 12, 1), date(2023, 12, 31)), (date(2024, 1, 1), date(2024, 1, 31))]),
+    # 하루짜리 범위
+    (date(2024, 2, 29), date(2024, 2, 29), [(date(2024, 2, 29), date(2024, 2, 29))]),
+])
+def test_month_shards(start, end, expected):
+    assert month_shards(start, end) == expected
+
+
+def test_month_shards_rejects_reversed_range():
+    with pytest.raises(ValueError):
+        month_shards(date(2024, 3, 1), date(2024, 2, 1))
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (date(2024, 1, 1), date(2024, 1, 31),
+     [(date(2024, 1, 1), date(2024, 1, 16)), (date(2024, 1, 17), date(2024, 1, 31))]),
+    # 이틀짜리 구간은 하루씩
+    (date(2024, 1, 1), date(2024, 1, 2), [(date(2024, 1, 1), date(2024, 1, 1)), (date(2024, 1, 2), date(2024, 1, 2))]),
+    # 하루짜리 구간은 더 나눌 수 없음
+    (date(2024, 1, 5), date(2024, 1, 5), [(date(2024, 1, 5), date(2024, 1, 5))]),
+])
+def test_split_shard(start, end, expected):
+    halves = split_shard(start, end)
+    assert halves == expected
+    # 나눈 구간은 빈틈/겹침 없이 원래 구간을 덮음
+    assert halves[0][0] == start and halves[-1][1] == end
+
+
+def test_parse_date():
+    assert parse_date("2024-02-29") == date(2024, 2, 29)
+    assert parse_date(date(2024, 2, 29)) == date(2024, 2, 29)
+    assert parse_date(None) is None
+
+
+def plan_with(tmp_path, counts, total_count):
+    plan = ShardPlan(tmp_path)
+    for month, count in enumerate(counts, 1):
+        plan.add(date(2024, month, 1), date(2024, month, 28), count, (count + 9) // 10)
+    plan.total_count = total_count
+    return plan
+
+
+def test_plan_assigns_consecutive_global_pages(tmp_path):
+    plan = plan_with(tmp_path, [25, 0, 10], 35)
+    assert [(shard["first_page"], shard["pages"]) for shard in plan.shards] == [(1, 3), (4, 0), (4, 1)]
+    assert plan.total_pages == 4
+    assert plan.verified()
+
+
+@pytest.mark.parametrize("counts, total_count", [
+    ([25, 10], 36),  # 날짜가 잘못 설정된 구간 등으로 합계가 다름
+    ([25, 10], None),  # 전체 사례 수를 확인하지 못함
+])
+def test_unverified_plan(tmp_path, counts, total_count):
+    assert not plan_with(tmp_path, counts, total_count).verified()
+
+
+def test_plan_reloads_only_for_same_search(tmp_path):
+    plan = plan_with(tmp_path, [25, 10], 35)
+    plan.search = {"start_date": "2024-01-01", "end_date": "2024-02-28", "max_shard_pages": 5}
+    plan.save()
+    
+    loaded = ShardPlan(tmp_path)
+    assert loaded.load(dict(plan.search))
+    assert loaded.shards == plan.shards and loaded.verified()
+    assert not ShardPlan(tmp_path).load(dict(plan.search, max_shard_pages=3))
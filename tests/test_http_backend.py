@@ -0,0 +1,120 @@
+import shutil
+
+import pytest
+
+pytest.importorskip("requests")
+
+import mock_unipass
+from http_backend import fixture_backend, parse_table_rows
+from records import new_case_detail, assign_detail_field, case_key
+from recovery import RetryPolicy, DeadLetterLog
+from sinks import iter_jsonl
+
+
+@pytest.fixture
+def base_url():
+    server, base_url = mock_unipass.start_mock_server(corpus_size=30)
+    yield base_url
+    server.shutdown()
+
+
+def http_details(base_url: str, max_pages: int = 1) -> list:
+    """HTTP 엔진으로 수집한 사례 (목록 순서)"""
+    backend = fixture_backend(base_url, pool_size=4)
+    return [detail for _, page_results in backend.scrape_pages(max_pages=max_pages) for detail in page_results]
+
+
+def test_http_detail_has_identity_fields(base_url):
+    corpus = mock_unipass.build_corpus(30)
+    for detail, case in zip(http_details(base_url), corpus):
+        assert detail["case_number"] == case["caseSn"]
+        assert detail["effective_date"] == case["efctDt"]
+        assert case_key(detail) == f"no:{case['caseSn']}"
+
+
+def test_http_keys_match_detail_table(base_url):
+    # Selenium 경로와 같은 방식(상세보기 th/td → assign_detail_field)으로 읽은 사례와 비교
+    backend = fixture_backend(base_url)
+    for detail in http_details(base_url):
+        fragment = backend.request(backend.detail_endpoint, caseSn=detail["case_number"], format="html")
+        dom_detail = new_case_detail(detail["index"])
+        for row in parse_table_rows(fragment):
+            if row["th"] and row["td"]:
+                assign_detail_field(dom_detail, row["th"][0], row["td"][0])
+        assert case_key(dom_detail) == case_key(detail)
+        for field in ("case_number", "title", "hs_code", "description", "classification_reason", "effective_date"):
+            assert dom_detail[field] == detail[field]
+
+
+def test_expired_session_is_refreshed_and_retried(base_url, tmp_path):
+    backend = fixture_backend(base_url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+                              dead_letters=DeadLetterLog(tmp_path))
+    backend.session.cookies.clear()
+    detail = backend.fetch_case_detail({"caseSn": "CLSF-000001"}, 1, 1)
+    assert detail["case_number"] == "CLSF-000001"
+    assert DeadLetterLog(tmp_path).records() == []
+
+
+def test_failed_detail_goes_to_dead_letters(base_url, tmp_path):
+    backend = fixture_backend(base_url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+                              dead_letters=DeadLetterLog(tmp_path))
+    assert backend.fetch_case_detail({"caseSn": "CLSF-999999"}, 7, 1) is None
+    records = DeadLetterLog(tmp_path).records()
+    assert [(r["page"], r["case_index"], r["error_class"]) for r in records] == [(1, 7, "fatal")]
+
+
+class FakeRateLimiter:
+    def __init__(self):
+        self.acquired = 0
+        self.reports = []
+
+    def acquire(self):
+        self.acquired += 1
+        return 0.0
+
+    def report(self, seconds, ok=True):
+        self.reports.append(ok)
+
+
+def test_requests_go_through_rate_limiter(base_url, tmp_path):
+    limiter = FakeRateLimiter()
+    backend = fixture_backend(base_url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+                              dead_letters=DeadLetterLog(tmp_path), rate_limiter=limiter)
+    assert backend.fetch_case_detail({"caseSn": "CLSF-000001"}, 1, 1)["case_number"] == "CLSF-000001"
+    # 없는 사례(404)는 속도를 줄이지 않음
+    assert backend.fetch_case_detail({"caseSn": "CLSF-999999"}, 2, 1) is None
+    assert limiter.acquired == 2
+    assert limiter.reports == [True, True]
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_overloaded_responses_slow_down_and_retry(base_url, tmp_path, monkeypatch, status):
+    limiter = FakeRateLimiter()
+    backend = fixture_backend(base_url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+                              dead_letters=DeadLetterLog(tmp_path), rate_limiter=limiter)
+    post = backend.session.post
+    statuses = [status]
+
+    def overloaded_once(url, **kwargs):
+        response = post(url, **kwargs)
+        if statuses:
+            response.status_code = statuses.pop()
+        return response
+
+    monkeypatch.setattr(backend.session, "post", overloaded_once)
+    assert backend.fetch_case_detail({"caseSn": "CLSF-000001"}, 1, 1)["case_number"] == "CLSF-000001"
+    assert limiter.reports == [False, True]
+    assert DeadLetterLog(tmp_path).records() == []
+
+
+@pytest.mark.skipif(not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser")),
+                    reason="Chrome이 설치되어 있지 않음")
+def test_http_and_selenium_keys_match(base_url, tmp_path):
+    pytest.importorskip("selenium")
+    from main import UnipassHSScraper
+    
+    scraper = UnipassHSScraper(output_dir=str(tmp_path), base_url=base_url, browser_profile="fast",
+                               image_workers=0, rate_limit=False)
+    assert scraper.scrape_all_cases(max_pages=1)
+    selenium_keys = [case_key(detail) for detail in iter_jsonl(scraper.cases_path)]
+    assert selenium_keys == [case_key(detail) for detail in http_details(base_url)]
@@ -0,0 +1,77 @@
+import pytest
+
+from journal import CrawlJournal
+from records import new_case_detail
+
+
+def case(index):
+    detail = new_case_detail(index)
+    detail.update(case_number=f"CLSF-{index:06d}", title=f"품목 {index}")
+    return detail
+
+
+def test_replay_restores_completed_pages(tmp_path):
+    journal = CrawlJournal(tmp_path)
+    journal.start({"start_year": 2016, "start_month": 1})
+    for page in (1, 2, 4, 11):
+        for index in range((page - 1) * 10 + 1, page * 10 + 1):
+            journal.append_case(page, case(index))
+        journal.mark_page_done(page, 10)
+    journal.append_case(3, case(21))  # 3 페이지는 처리 중에 중단
+    journal.close()
+    
+    state = CrawlJournal(tmp_path).load_state()
+    assert state["search"] == {"start_year": 2016, "start_month": 1}
+    assert state["completed_pages"] == {1, 2, 4, 11}
+    assert (state["last_page"], state["last_group"]) == (11, 2)
+    assert state["case_count"] == 41
+    assert state["first_unfinished_page"] == 3
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    journal = CrawlJournal(tmp_path)
+    journal.start({"start_year": 2016, "start_month": 1})
+    journal.mark_page_done(1, 10)
+    journal.close()
+    # 기록 중에 중단되어 잘린 마지막 줄
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"type": "page", "page": 2, "gro')
+    
+    state = CrawlJournal(tmp_path).load_state()
+    assert state["completed_pages"] == {1}
+    assert state["first_unfinished_page"] == 2
+
+
+def test_start_clears_previous_crawl(tmp_path):
+    journal = CrawlJournal(tmp_path)
+    journal.start({"start_year": 2016, "start_month": 1})
+    journal.mark_page_done(1, 10)
+    journal.start({"start_year": 2020, "start_month": 1})
+    journal.close()
+    state = CrawlJournal(tmp_path).load_state()
+    assert state["search"] == {"start_year": 2020, "start_month": 1}
+    assert state["completed_pages"] == set()
+
+
+def test_resume_skips_journaled_pages(tmp_path):
+    pytest.importorskip("selenium")
+    from main import UnipassHSScraper
+    
+    search = {"start_year": 2016, "start_month": 1}
+    journal = CrawlJournal(tmp_path)
+    journal.start(search)
+    for page in (1, 2, 4):
+        journal.mark_page_done(page, 0)
+    journal.close()
+    
+    scraper = UnipassHSScraper(output_dir=str(tmp_path), image_workers=0, rate_limit=False)
+    moves, scraped = [], []
+    scraper.setup_driver = lambda: None
+    scraper.open_search = lambda *args, **kwargs: None
+    scraper.get_total_pages = lambda: 6
+    scraper.move_to_page = moves.append
+    scraper.scrape_current_page = lambda page: scraped.append(page) or []
+    
+    assert scraper.scrape_all_cases(resume=True)
+    assert moves == scraped == [3, 5, 6]
+    assert CrawlJournal(tmp_path).load_state()["completed_pages"] == {1, 2, 3, 4, 5, 6}
@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+
+from known_cases import KnownCaseIndex
+from records import new_case_detail
+
+
+def case(number, effective_date):
+    detail = new_case_detail(number)
+    detail.update(case_number=f"CLSF-{number:06d}", effective_date=effective_date)
+    return detail
+
+
+@pytest.mark.parametrize("dates, expected", [
+    (["2024-03-05", "2025-01-02", "2023-12-31"], "2025-01-02"),
+    # 화면 형식 그대로 저장된 날짜도 정규화하여 비교
+    (["2024-03-05", "2025.1.2", "20231231"], "2025-01-02"),
+    # 날짜가 아닌 값은 최고 기록이 되지 않음
+    (["2024-03-05", "미정", "2024-13-45", ""], "2024-03-05"),
+    (["", "미정"], ""),
+])
+def test_high_water_mark(tmp_path, dates, expected):
+    index = KnownCaseIndex(tmp_path)
+    index.add(case(number, value) for number, value in enumerate(dates, 1))
+    assert index.high_water_mark == expected
+    assert len(index) == len(dates)
+
+
+def test_invalid_saved_mark_is_replaced(tmp_path):
+    index = KnownCaseIndex(tmp_path)
+    index.high_water_mark = "시행일자 없음"
+    index.add([case(1, "2024-03-05")])
+    assert index.high_water_mark == "2024-03-05"
+
+
+def test_search_start_and_reload(tmp_path):
+    index = KnownCaseIndex(tmp_path)
+    assert index.search_start() is None
+    index.add([case(1, "2024.03.05"), case(2, "2023-01-01")])
+    index.save()
+    
+    loaded = KnownCaseIndex(tmp_path).load()
+    assert loaded.search_start() == date(2024, 3, 5)
+    assert loaded.contains(case(2, "2023-01-01"))
+    assert not loaded.contains(case(3, "2023-01-01"))
+    
+    # 시행일자 기록이 없으면 마지막 크롤링 날짜부터
+    loaded.high_water_mark = ""
+    assert loaded.search_start() == date.fromisoformat(loaded.last_crawl_at[:10])
@@ -0,0 +1,130 @@
+import json
+
+import pytest
+
+import pdf_text
+from blob_store import BlobStore, BlobManifest, normalize_pdf, record_bytes
+from pdf_text import parse_fields, fill_missing_fields, process_pdf, enrich_from_pdfs
+from records import new_case_detail, case_key
+from search_index import SearchIndex
+from sinks import iter_jsonl
+
+
+def make_pdf(lines) -> bytes:
+    """텍스트 줄(ASCII)만 있는 한 페이지 PDF"""
+    text = "BT /F1 12 Tf 72 720 Td 14 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(text), text.encode()),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return data
+
+
+def test_parse_fields_joins_continuation_lines():
+    text = "\n".join([
+        "문서번호: 품목분류2과-1234",
+        "품 명 : 자동차용 브레이크 패드",
+        "HS 부호 8708.30-1000",
+        "분류사유: 브레이크의 부분품으로",
+        "  제8708호에 분류함",
+        "시행일자 : 2024.03.05",
+    ])
+    assert parse_fields(text) == {
+        "case_number": "품목분류2과-1234",
+        "title": "자동차용 브레이크 패드",
+        "hs_code": "8708.30-1000",
+        "classification_reason": "브레이크의 부분품으로 제8708호에 분류함",
+        "effective_date": "2024-03-05",
+    }
+
+
+@pytest.mark.parametrize("detail, fields, filled", [
+    # 빈 필드만 채움
+    ({"case_number": "A-1", "title": "기존 품명", "hs_code": ""},
+     {"title": "PDF 품명", "hs_code": "8471.30-0000"}, ["hs_code"]),
+    # 식별 키가 바뀌는 값은 채우지 않음
+    ({"case_number": "", "title": "품명", "hs_code": "8471", "effective_date": "2024-01-01"},
+     {"case_number": "A-2"}, []),
+    # 상세 정보가 하나도 없던 사례는 식별 키가 바뀌어도 채움
+    ({"index": 3, "case_number": "", "title": ""},
+     {"case_number": "A-3", "title": "PDF 품명"}, ["case_number", "title"]),
+])
+def test_fill_missing_fields(detail, fields, filled):
+    before = dict(detail)
+    assert fill_missing_fields(detail, fields) == filled
+    for name in filled:
+        assert detail[name] == fields[name]
+    for name in set(before) - set(filled):
+        assert detail[name] == before[name]
+
+
+def test_process_pdf_reuses_cache_by_content(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "case_1.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 placeholder")
+    calls = []
+    monkeypatch.setattr(pdf_text, "extract_pages", lambda path: calls.append(path) or ["HS CODE: 8471.30-0000"])
+
+    first = process_pdf(str(pdf_path), str(tmp_path / "cache"))
+    assert first["cached"] is False
+    assert first["fields"] == {"hs_code": "8471.30-0000"}
+
+    # 같은 내용의 다른 파일은 추출하지 않고 캐시 사용
+    copy_path = tmp_path / "case_2.pdf"
+    copy_path.write_bytes(pdf_path.read_bytes())
+    second = process_pdf(str(copy_path), str(tmp_path / "cache"))
+    assert second["cached"] is True
+    assert second["sha256"] == first["sha256"]
+    assert second["fields"] == first["fields"]
+    assert len(calls) == 1
+
+
+def test_enrich_updates_jsonl_manifest_and_index(tmp_path):
+    pytest.importorskip("pypdf")
+    store = BlobStore(tmp_path / "blobs")
+    _, pdf_path = store.put(normalize_pdf(make_pdf(["HS CODE: 8471.30-0000"])), ".pdf")
+
+    cases_path = tmp_path / "hs_classification_cases.jsonl"
+    manifest = BlobManifest(tmp_path)
+    with open(cases_path, "w", encoding="utf-8") as f:
+        for i in (1, 2):
+            detail = new_case_detail(i)
+            detail.update(case_number=f"CLSF-{i:06d}", title=f"품명 {i}", pdf_path=str(pdf_path) if i == 1 else "")
+            record_sha, _ = store.put(record_bytes(detail), ".json")
+            manifest.update(case_key(detail), record_sha)
+            f.write(json.dumps(detail, ensure_ascii=False) + "\n")
+    index = SearchIndex(tmp_path)
+    index.update_from_jsonl(cases_path)
+    index.close()
+
+    # 두 개의 워커 프로세스로 추출
+    stats = enrich_from_pdfs(tmp_path, workers=2)
+    assert stats == {"pdfs": 1, "cached": 0, "failed": 0, "filled_cases": 1}
+    details = {detail["case_number"]: detail for detail in iter_jsonl(cases_path)}
+    assert details["CLSF-000001"]["hs_code"] == "8471.30-0000"
+    assert details["CLSF-000002"]["hs_code"] == ""
+
+    # 매니페스트는 보강한 레코드를 가리킴
+    entry = BlobManifest(tmp_path).load().entries["no:CLSF-000001"]
+    assert store.path(entry["record"], ".json").read_bytes() == record_bytes(details["CLSF-000001"])
+    assert entry["pdf"] == pdf_path.name.split(".", 1)[0]
+
+    # 검색 색인도 보강한 내용으로 다시 색인
+    index = SearchIndex(tmp_path)
+    assert [detail["case_number"] for detail in index.search(hs_prefix="8471")] == ["CLSF-000001"]
+    index.close()
+
+    # 다시 실행하면 캐시 사용
+    assert enrich_from_pdfs(tmp_path, workers=1)["cached"] == 1
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import TimeoutException
+
+from main import UnipassHSScraper
+
+
+class FakeLink:
+    def __init__(self):
+        self.clicks = 0
+
+    def click(self):
+        self.clicks += 1
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = UnipassHSScraper(output_dir=str(tmp_path), image_workers=0, rate_limit=False)
+    scraper.table_snapshot = lambda heading: {"text": "", "element": None, "xhr_done": 0}
+    scraper.wait_for_table_change = lambda heading, before, timeout=None: False
+    return scraper
+
+
+def test_unchanged_detail_table_raises_for_retry(scraper):
+    link = FakeLink()
+    scraper.get_case_list = lambda: {"rows": [], "links": [link]}
+    with pytest.raises(TimeoutException):
+        scraper.click_case_by_index(0)
+    assert link.clicks == 1
+
+
+def test_unchanged_page_jump_is_not_reported_as_moved(scraper):
+    scraper.get_pagination_state = lambda: {"current": 1, "pages": list(range(1, 11))}
+    scraper.driver = type("FakeDriver", (), {"execute_script": lambda self, script, *args: True})()
+    assert scraper.jump_to_page(3) is False
+
+
+@pytest.mark.parametrize("state, expected", [
+    ({"current": 3, "pages": list(range(1, 11))}, True),
+    ({"current": 2, "pages": list(range(1, 11))}, False),
+    # 현재 페이지 표시가 없으면 같은 그룹이 보이더라도 이동했다고 보지 않음
+    ({"current": None, "pages": list(range(1, 11))}, False),
+    ({}, False),
+])
+def test_is_on_page_requires_current_page_marker(scraper, state, expected):
+    scraper.get_pagination_state = lambda: state
+    assert scraper.is_on_page(3) is expected
@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+import requests
+from selenium.common.exceptions import (
+    WebDriverException,
+    TimeoutException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    InvalidSessionIdException,
+    NoSuchWindowException,
+)
+
+from recovery import TRANSIENT, SESSION, FATAL, classify_error, retry_call, RetryPolicy, DeadLetterLog
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.mark.parametrize("error, kind", [
+    (StaleElementReferenceException("stale"), TRANSIENT),
+    (TimeoutException("timeout"), TRANSIENT),
+    (ElementClickInterceptedException("intercepted"), TRANSIENT),
+    (InvalidSessionIdException("invalid session id"), SESSION),
+    (NoSuchWindowException("no such window"), SESSION),
+    (ConnectionRefusedError("refused"), SESSION),
+    (WebDriverException("chrome not reachable"), SESSION),
+    (WebDriverException("unknown error"), FATAL),
+    (KeyError("title"), FATAL),
+    (http_error(401), SESSION),
+    (http_error(403), SESSION),
+    (http_error(429), TRANSIENT),
+    (http_error(503), TRANSIENT),
+    (http_error(404), FATAL),
+    (requests.ConnectionError("reset"), TRANSIENT),
+    (requests.Timeout("read timeout"), TRANSIENT),
+], ids=lambda value: type(value).__name__ if isinstance(value, Exception) else value)
+def test_classify_error(error, kind):
+    assert classify_error(error) == kind
+
+
+@pytest.mark.parametrize("attempt, low, high", [(1, 0.5, 1.0), (2, 1.0, 2.0), (3, 2.0, 4.0), (10, 2.5, 5.0)])
+def test_backoff_doubles_with_jitter_and_cap(attempt, low, high):
+    policy = RetryPolicy(max_attempts=10, base_delay=1.0, max_delay=5.0)
+    delays = [policy.delay(attempt) for _ in range(50)]
+    assert all(low <= delay <= high for delay in delays)
+
+
+@pytest.mark.parametrize("errors, retries, raised", [
+    ([], [], None),
+    ([TimeoutException("1")], [(TRANSIENT, 1)], None),
+    ([InvalidSessionIdException("1"), TimeoutException("2")], [(SESSION, 1), (TRANSIENT, 2)], None),
+    # 마지막 시도의 오류와 fatal 오류는 재시도하지 않고 그대로 전달
+    ([TimeoutException("1"), TimeoutException("2"), TimeoutException("3")], [(TRANSIENT, 1), (TRANSIENT, 2)],
+     TimeoutException),
+    ([KeyError("fatal")], [], KeyError),
+])
+def test_retry_call(errors, retries, raised):
+    errors = list(errors)
+    seen = []
+
+    def action():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    def call():
+        return retry_call(action, RetryPolicy(max_attempts=3, base_delay=0),
+                          lambda error, kind, attempt, delay: seen.append((kind, attempt)))
+
+    if raised:
+        with pytest.raises(raised):
+            call()
+    else:
+        assert call() == "ok"
+    assert seen == retries
+
+
+def test_dead_letter_log(tmp_path):
+    log = DeadLetterLog(tmp_path)
+    log.append(3, 27, InvalidSessionIdException("invalid session id\nStacktrace: ..."), 3)
+    log.append(4, 31, KeyError("title"), 1)
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write('{"page": 5, "case_')  # 잘린 마지막 줄
+    records = log.records()
+    assert [(r["page"], r["case_index"], r["error_type"], r["error_class"], r["attempts"]) for r in records] == [
+        (3, 27, "InvalidSessionIdException", SESSION, 3),
+        (4, 31, "KeyError", FATAL, 1),
+    ]
+    assert records[0]["error"] == "Message: invalid session id"
+    
+    log.start()
+    assert log.records() == []
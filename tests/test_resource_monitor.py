@@ -0,0 +1,62 @@
+import pytest
+
+import resource_monitor
+from resource_monitor import ResourceMonitor
+
+MB = 2 ** 20
+
+
+@pytest.fixture
+def rss(monkeypatch):
+    """브라우저/파이썬 RSS를 정해 둔 값으로 돌려주는 가짜 측정"""
+    values = {"browser_mb": 500, "python_mb": 200}
+    monkeypatch.setattr(resource_monitor, "driver_rss", lambda driver: values["browser_mb"] * MB)
+    monkeypatch.setattr(resource_monitor, "python_rss", lambda: values["python_mb"] * MB)
+    return values
+
+
+def monitor_after(pages, page_seconds=None, cases_per_page=10, **options):
+    """pages 페이지를 처리한 모니터 (page_seconds: 페이지별 처리 시간, 없으면 사례당 0.5초)"""
+    monitor = ResourceMonitor(baseline_pages=2, window=2, **options)
+    for page in range(pages):
+        monitor.record_page(page_seconds[page] if page_seconds else 0.5 * cases_per_page, cases_per_page)
+    return monitor
+
+
+@pytest.mark.parametrize("browser_mb, python_mb, reason", [
+    (500, 200, ""),
+    (2100, 200, "browser_memory"),
+    (500, 1100, "python_memory"),
+    (2100, 1100, "browser_memory"),  # 브라우저 메모리가 먼저
+])
+def test_memory_thresholds(rss, browser_mb, python_mb, reason):
+    rss.update(browser_mb=browser_mb, python_mb=python_mb)
+    monitor = monitor_after(pages=12, min_cases=100)
+    assert monitor.check(object()) == reason
+    assert monitor.last["browser_mb"] == browser_mb and monitor.last["python_mb"] == python_mb
+
+
+def test_no_restart_before_min_cases(rss):
+    rss.update(browser_mb=4000, python_mb=4000)
+    assert monitor_after(pages=9, min_cases=100).check(object()) == ""
+    assert monitor_after(pages=10, min_cases=100).check(object()) == "browser_memory"
+
+
+def test_latency_against_baseline(rss):
+    # 기준 2페이지의 사례당 0.5초, 최근 2페이지가 1.2초면 2배를 넘어 재시작
+    monitor = monitor_after(pages=12, page_seconds=[5, 5] + [6] * 8 + [12, 12], min_cases=100)
+    assert monitor.baseline == 0.5
+    assert monitor.check(object()) == "latency"
+    monitor.reset()
+    assert (monitor.cases, monitor.baseline) == (0, None)
+    assert monitor.check(object()) == ""
+
+
+def test_case_count_limit(rss):
+    assert monitor_after(pages=20, min_cases=100, max_cases=200).check(object()) == "case_count"
+    assert monitor_after(pages=19, min_cases=100, max_cases=200).check(object()) == ""
+
+
+def test_no_driver_counts_as_no_browser_memory(rss):
+    rss.update(browser_mb=4000)
+    assert monitor_after(pages=12, min_cases=100).check(None) == ""
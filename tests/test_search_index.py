@@ -0,0 +1,50 @@
+import json
+
+from records import new_case_detail
+from search_index import SearchIndex
+
+
+def write_cases(path, titles):
+    with open(path, "w", encoding="utf-8") as f:
+        for i, title in enumerate(titles, 1):
+            detail = new_case_detail(i)
+            detail.update(case_number=f"CLSF-{i:06d}", title=title, scraped_at="2025-01-01T00:00:00")
+            f.write(json.dumps(detail, ensure_ascii=False) + "\n")
+
+
+def indexed_titles(index):
+    return sorted(detail["title"] for detail in index.search(limit=100))
+
+
+def test_update_appends_only_new_lines(tmp_path):
+    cases_path = tmp_path / "hs_classification_cases.jsonl"
+    write_cases(cases_path, ["자동차 부품", "전동기"])
+    index = SearchIndex(tmp_path)
+    assert index.update_from_jsonl(cases_path) == 2
+    write_cases(cases_path, ["자동차 부품", "전동기", "냉장고"])
+    assert index.update_from_jsonl(cases_path) == 1
+    assert indexed_titles(index) == ["냉장고", "자동차 부품", "전동기"]
+    index.close()
+
+
+def test_rewritten_file_is_reindexed(tmp_path):
+    # 다시 쓴 파일이 예전보다 크거나 같아도 예전 위치에서 이어 읽지 않음 (PDF 보강/저장소 이전과 같은 임시 파일 교체)
+    cases_path = tmp_path / "hs_classification_cases.jsonl"
+    write_cases(cases_path, ["자동차 부품", "전동기"])
+    index = SearchIndex(tmp_path)
+    index.update_from_jsonl(cases_path)
+    
+    tmp_path_new = tmp_path / "hs_classification_cases.jsonl.tmp"
+    write_cases(tmp_path_new, ["자동차 부품 (보강)", "전동기 (보강)"])
+    tmp_path_new.replace(cases_path)
+    assert index.update_from_jsonl(cases_path) == 2
+    assert indexed_titles(index) == ["자동차 부품 (보강)", "전동기 (보강)"]
+    
+    # 같은 파일을 그대로 두고 같은 크기로 덮어쓴 경우
+    with open(cases_path, "r+", encoding="utf-8") as f:
+        text = f.read().replace("보강", "수정")
+        f.seek(0)
+        f.write(text)
+    assert index.update_from_jsonl(cases_path) == 2
+    assert indexed_titles(index) == ["자동차 부품 (수정)", "전동기 (수정)"]
+    index.close()
@@ -0,0 +1,54 @@
+import csv
+import json
+import importlib.util
+
+import pytest
+
+import cli
+from records import new_case_detail
+from sinks import compact_jsonl, make_sinks
+
+
+# 기존 hs_classification_cases.csv의 컬럼 순서 (새 컬럼은 뒤에만 추가)
+BASELINE_COLUMNS = ["index", "title", "hs_code", "description", "classification_reason", "pdf_path", "images",
+                    "scraped_at"]
+
+
+def write_cases(path):
+    detail = new_case_detail(1)
+    detail.update(case_number="CLSF-000001", title="시험용 품목", hs_code="8401.10-1000", effective_date="2025-12-31",
+                  images=[{"local_path": "images/a.png"}, {"local_path": "images/b.png"}])
+    path.write_text(json.dumps(detail, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_csv_keeps_baseline_column_order(tmp_path):
+    cases_path = tmp_path / "hs_classification_cases.jsonl"
+    write_cases(cases_path)
+    compact_jsonl(cases_path, tmp_path / "cases.json", tmp_path / "cases.csv")
+    header, row = read_csv(tmp_path / "cases.csv")
+    assert header[:len(BASELINE_COLUMNS)] == BASELINE_COLUMNS
+    assert header[len(BASELINE_COLUMNS):] == ["case_number", "effective_date"]
+    assert row[header.index("images")] == "images/a.png; images/b.png"
+
+
+def test_stream_csv_matches_compacted_csv(tmp_path):
+    cases_path = tmp_path / "hs_classification_cases.jsonl"
+    write_cases(cases_path)
+    compact_jsonl(cases_path, tmp_path / "cases.json", tmp_path / "cases.csv")
+    sink, = make_sinks(tmp_path, ["csv"])
+    sink.open(append=False)
+    sink.write(json.loads(cases_path.read_text(encoding="utf-8")))
+    sink.close()
+    assert read_csv(tmp_path / "hs_classification_cases.stream.csv") == read_csv(tmp_path / "cases.csv")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow가 설치되어 있음")
+def test_export_parquet_without_pyarrow_fails_clearly(tmp_path, capsys):
+    write_cases(tmp_path / "hs_classification_cases.jsonl")
+    assert cli.main(["--output-dir", str(tmp_path), "export", "--formats", "parquet"]) == 2
+    assert "uv sync --extra parquet" in capsys.readouterr().err
@@ -0,0 +1,65 @@
+import shutil
+from datetime import date
+
+import pytest
+
+pytest.importorskip("selenium")
+
+import mock_unipass
+from main import UnipassHSScraper
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """창 핸들 전환/닫기만 흉내 내는 WebDriver"""
+
+    def __init__(self, handles):
+        self.window_handles = list(handles)
+        self.current_window_handle = handles[0]
+        self.switch_to = FakeSwitchTo(self)
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+def test_close_tabs_closes_extra_tabs_and_returns_to_main(tmp_path):
+    scraper = UnipassHSScraper(output_dir=str(tmp_path), image_workers=0, rate_limit=False, tabs=3)
+    scraper.driver = FakeDriver(["main", "tab-1", "tab-2"])
+    scraper.tab_pages = {"tab-1": 4, "tab-2": 4, "gone": 4}
+    scraper.close_tabs()
+    assert scraper.tab_pages == {}
+    assert scraper.driver.window_handles == ["main"]
+    assert scraper.driver.current_window_handle == "main"
+
+
+@pytest.mark.skipif(not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser")),
+                    reason="Chrome이 설치되어 있지 않음")
+def test_change_search_reopens_tabs_with_new_search(tmp_path):
+    server, base_url = mock_unipass.start_mock_server(corpus_size=60)
+    scraper = UnipassHSScraper(output_dir=str(tmp_path), base_url=base_url, browser_profile="fast",
+                               image_workers=0, rate_limit=False, tabs=2, keep_browser=True)
+    try:
+        scraper.setup_driver()
+        scraper.open_search(2016, 1, 1)
+        scraper.sync_tabs(1)
+        scraper.change_search(date(2020, 1, 1))
+        assert scraper.tab_pages == {}
+        handles = scraper.sync_tabs(1)
+        assert len(handles) == 2
+        main_rows = scraper.table_snapshot("품목분류사례")["text"]
+        for handle in handles[1:]:
+            scraper.driver.switch_to.window(handle)
+            assert scraper.read_search_date(1) == "2020-01-01"
+            assert scraper.table_snapshot("품목분류사례")["text"] == main_rows
+        scraper.driver.switch_to.window(handles[0])
+    finally:
+        scraper.keep_browser = False
+        scraper.close_driver()
+        server.shutdown()